@@ -0,0 +1,78 @@
+"""
+Benchmark: pure-Python vs numpy engine for loading and analyzing sensor readings.
+
+Run from the lab root:
+    python -m benchmarks.bench_engines                      # 10^6 and 10^7 readings
+    python -m benchmarks.bench_engines --sizes 100000000    # 10^8 (~400 MB file)
+    python -m benchmarks.bench_engines --workers 8 32       # add parallel mmap rows
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from src.analyzer import analyze_file, analyze_readings, load_readings
+
+
+def write_readings(path: str, n: int, invalid_every: int) -> None:
+    """Writes n readings in the sample_readings.txt format, with a '#@$' line every invalid_every lines."""
+    rng = random.Random(42)
+    batch = 100_000
+    with open(path, "w", encoding="utf-8") as f:
+        for start in range(0, n, batch):
+            lines = [str(rng.randint(60, 90)) for _ in range(min(batch, n - start))]
+            if invalid_every:
+                for i in range(0, len(lines), invalid_every):
+                    lines[i] = "#@$"
+            f.write("\n".join(lines) + "\n")
+
+
+def timed(fn):
+    # warnings for invalid entries would dominate the timing, so silence stdout
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = fn()
+        return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**6, 10**7])
+    parser.add_argument("--invalid-every", type=int, default=100_000,
+                        help="insert one invalid line every N lines (0 = none)")
+    parser.add_argument("--workers", type=int, nargs="*", default=[],
+                        help="also time analyze_file(workers=N) for each N")
+    args = parser.parse_args()
+
+    engines = {
+        "python (list)": lambda p: analyze_readings(load_readings(p), keep_stable_values=False),
+        "python (stream)": lambda p: analyze_file(p),
+        "numpy": lambda p: analyze_readings(load_readings(p, engine="numpy"), keep_stable_values=False),
+    }
+    for workers in args.workers:
+        engines[f"python x{workers}"] = lambda p, w=workers: analyze_file(p, workers=w)
+        engines[f"numpy x{workers}"] = lambda p, w=workers: analyze_file(p, engine="numpy", workers=w)
+
+    print(f"{'readings':>12} {'engine':>16} {'seconds':>9} {'readings/s':>12} {'speedup':>8}")
+    for n in args.sizes:
+        fd, path = tempfile.mkstemp(suffix=".txt")
+        os.close(fd)
+        try:
+            write_readings(path, n, args.invalid_every)
+            baseline = None
+            expected = None
+            for name, run in engines.items():
+                seconds, summary = timed(lambda: run(path))
+                expected = expected or summary
+                assert summary == expected, f"{name} disagrees with the python engine"
+                baseline = baseline or seconds
+                print(f"{n:>12,} {name:>16} {seconds:>9.2f} {n / seconds:>12,.0f} {baseline / seconds:>7.1f}x")
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,43 @@
-from src.analyzer import load_readings, analyze_readings, save_summary
+import argparse
+
+from src.analyzer import (
+    analyze_file_incremental, analyze_readings, analyze_stability, follow_file, load_readings, save_summary,
+)
+from src.cache import ReadingCache
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sensor Data Quality Analyzer")
+    parser.add_argument("--input", default="data/sample_readings.txt", help="readings file to analyze")
+    parser.add_argument("--output", default="sensor_summary_1.txt", help="summary report to append to")
+    parser.add_argument("--engine", choices=["python", "numpy"], default="python")
+    parser.add_argument("--cache-dir", help="cache parsed readings as binary arrays in this directory")
+    parser.add_argument("--stats", action="store_true",
+                        help="also report min/max/variance and p50/p95/p99 for all and stable readings")
+    parser.add_argument("--stability-window", type=int,
+                        help="use rolling-window stability (flag readings outside --sigma std devs) instead of the odd-index rule")
+    parser.add_argument("--sigma", type=float, default=3.0, help="band width for --stability-window")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only parse bytes appended since the last run (state kept in --state)")
+    parser.add_argument("--follow", action="store_true",
+                        help="keep polling the input and append a report whenever new readings arrive")
+    parser.add_argument("--state", default=".sensor_state.json", help="state file for --incremental/--follow")
+    parser.add_argument("--interval", type=float, default=5.0, help="seconds between polls in --follow mode")
+    args = parser.parse_args()
+
     print("[INFO] Starting Sensor Data Quality Analyzer...")
-    readings = load_readings("data/sample_readings.txt")
-    summary = analyze_readings(readings)
-    save_summary(summary, "sensor_summary_1.txt")
+    if args.follow:
+        follow_file(args.input, args.state, args.output, interval=args.interval, engine=args.engine,
+                    with_stats=args.stats)
+    else:
+        if args.incremental:
+            summary = analyze_file_incremental(args.input, args.state, engine=args.engine, with_stats=args.stats)
+        else:
+            cache = ReadingCache(args.cache_dir) if args.cache_dir else None
+            readings = load_readings(args.input, engine=args.engine, cache=cache)
+            if args.stability_window:
+                summary = analyze_stability(readings, window=args.stability_window, sigma=args.sigma)
+            else:
+                # the report lists the stable values, so keep them
+                summary = analyze_readings(readings, keep_stable_values=True, with_stats=args.stats)
+        save_summary(summary, args.output)
     print("[INFO] Processing complete.")
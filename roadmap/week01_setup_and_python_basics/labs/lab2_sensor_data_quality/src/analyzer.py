@@ -1,75 +1,868 @@
+import hashlib
+import io
+import json
+import math
+import mmap
+import os
 import pytest
-from typing import List, Dict
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 from datetime import datetime
 
-def load_readings(filepath: str) -> List[int]:
+from src.cache import ReadingCache
+from src.sketches import ReadingStats
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for engine="numpy"
+    np = None
+
+# block size used by the numpy engine when reading the file in bulk
+NUMPY_BLOCK_SIZE = 4 * 1024 * 1024
+# byte range handed to each worker process in parallel mode
+PARALLEL_CHUNK_SIZE = 64 * 1024 * 1024
+# bytes read at a time when a byte range (parallel chunk, incremental tail) is parsed
+RANGE_BLOCK_SIZE = 1024 * 1024
+# bytes at the start of the file hashed to detect a rotated/rewritten file in incremental mode
+STATE_HEAD_BYTES = 4096
+# defaults for the rolling-window stability mode
+STABILITY_WINDOW = 10
+STABILITY_SIGMA = 3.0
+# flagged positions listed in a stability summary (the count is always exact)
+MAX_FLAGGED_INDICES = 100
+# readings taken from a one-shot iterator at a time by ReadingAccumulator.update()
+UPDATE_BATCH_SIZE = 64 * 1024
+# longest line (sign included) that is guaranteed to fit in an int64 reading
+_MAX_CLEAN_LINE = 18
+
+def iter_readings(filepath: str, on_reject: Optional[Callable[[int, str, str], None]] = None) -> Iterator[int]:
     """
-    Loads numeric readings from a text file (one per line).
+    Yields numeric readings from a text file (one per line), one at a time.
+    Only the current line is held in memory, so files larger than RAM can be streamed.
     Ignores empty lines or invalid entries gracefully.
 
     Args:
         filepath (str): Path to the text file.
+        on_reject (callable): Optional hook called with (line_number, line, reason) for
+            every ignored entry, e.g. ErrorSink.on_reject (src/error_sink.py).
 
-    Returns:
-        List[int]: Clean list of numeric readings.
+    Yields:
+        int: The next valid numeric reading.
 
     Raises:
         FileNotFoundError: If the file path is invalid.
-        ValueError: If no valid readings are found.
     """
+    try:
+        f = open(filepath, "r", encoding="utf-8")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    with f:
+        yield from _parse_lines(f, on_reject)
+
+def _parse_lines(lines: Iterable[str], on_reject: Optional[Callable[[int, str, str], None]] = None) -> Iterator[int]:
+    for line_no, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:  # skip blank lines
+            continue
+        try:
+            value = int(line)
+        except ValueError:
+            print(f"[WARN] Ignored invalid entry: {line}")
+            if on_reject is not None:
+                on_reject(line_no, line, "invalid entry")
+            continue
+        yield value
+
+def _parse_lines_to_list(lines: Iterable[str], on_reject: Optional[Callable[[int, str, str], None]] = None) -> List[int]:
+    # list-building twin of _parse_lines() for load_readings(): the same rules without a
+    # generator frame per reading, as fast as the original inline loop
     readings: List[int] = []
+    append = readings.append
+    if on_reject is not None:
+        for value in _parse_lines(lines, on_reject):
+            append(value)
+        return readings
+    for line in lines:
+        line = line.strip()
+        if not line:  # skip blank lines
+            continue
+        try:
+            append(int(line))
+        except ValueError:
+            print(f"[WARN] Ignored invalid entry: {line}")
+    return readings
 
+def _iter_blocks(filepath: str, block_size: int, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Yields large byte blocks of the file (or of its [start, end) byte range), each ending
+    on a line boundary. The partial last line of a block is carried over to the next one.
+    """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:  # skip blank lines
-                    continue
-                try:
-                    value = int(line)
-                    readings.append(value)
-                except ValueError:
-                    print(f"[WARN] Ignored invalid entry: {line}")
-                    continue
+        f = open(filepath, "rb")
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {filepath}")
 
-    if not readings:
+    with f:
+        f.seek(start)
+        remaining = -1 if end is None else end - start
+        carry = b""
+        while remaining:
+            chunk = f.read(block_size if remaining < 0 else min(block_size, remaining))
+            if not chunk:
+                break
+            if remaining > 0:
+                remaining -= len(chunk)
+            chunk = carry + chunk
+            cut = chunk.rfind(b"\n") + 1
+            carry = chunk[cut:]
+            if cut:
+                yield chunk[:cut]
+        if carry:
+            yield carry + b"\n"
+
+def _parse_block_numpy(block: bytes) -> "np.ndarray":
+    """
+    Parses a newline-terminated block of readings into an int64 array.
+
+    A byte mask marks every line that np.fromstring cannot be trusted with
+    (anything but digits, newlines and a leading '-', or lines too long for int64).
+    Clean runs between those lines are parsed in bulk; the suspect lines go through
+    the same int(line.strip()) rule as iter_readings(), so both engines agree.
+    """
+    buf = np.frombuffer(block, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == 10)
+    line_starts = np.concatenate(([0], newlines[:-1] + 1))
+
+    is_digit = (buf >= 48) & (buf <= 57)
+    suspect = ~(is_digit | (buf == 10) | (buf == 45))
+    minus = np.flatnonzero(buf == 45)
+    # '-' is only clean at the start of a line and directly before a digit
+    bad_minus = minus[((minus > 0) & (buf[minus - 1] != 10)) | ~is_digit[minus + 1]]
+    suspect_pos = np.concatenate((np.flatnonzero(suspect), bad_minus))
+    suspect_lines = np.union1d(
+        np.searchsorted(newlines, suspect_pos),
+        np.flatnonzero(newlines - line_starts > _MAX_CLEAN_LINE),
+    )
+
+    parts = []
+    start = 0
+    for line in suspect_lines.tolist():
+        line_start, line_end = int(line_starts[line]), int(newlines[line])
+        # np.fromstring reads a whitespace-only run as [0], so only hand it runs with digits
+        if is_digit[start:line_start].any():
+            parts.append(np.fromstring(block[start:line_start], dtype=np.int64, sep="\n"))
+        # a lone '\r' ends a line in text mode, so split on it like iter_readings() would
+        for entry in block[line_start:line_end].decode("utf-8").split("\r"):
+            entry = entry.strip()
+            if not entry:
+                continue
+            try:
+                parts.append(np.array([int(entry)], dtype=np.int64))
+            except ValueError:
+                print(f"[WARN] Ignored invalid entry: {entry}")
+            except OverflowError:
+                print(f"[WARN] Ignored entry outside the int64 range: {entry}")
+        start = line_end + 1
+    if is_digit[start:].any():
+        parts.append(np.fromstring(block[start:], dtype=np.int64, sep="\n"))
+
+    if not parts:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(parts)
+
+def load_readings_numpy(filepath: str, block_size: int = NUMPY_BLOCK_SIZE) -> "np.ndarray":
+    """
+    Bulk-parses numeric readings from a text file into a numpy int64 array.
+    The file is read in large blocks instead of line by line; invalid entries are
+    skipped with the same warnings as iter_readings().
+
+    Args:
+        filepath (str): Path to the text file.
+        block_size (int): Bytes read per block.
+
+    Returns:
+        np.ndarray: Clean int64 array of numeric readings (possibly empty).
+
+    Raises:
+        ImportError: If numpy is not installed.
+        FileNotFoundError: If the file path is invalid.
+    """
+    if np is None:
+        raise ImportError("The numpy engine requires numpy: pip install numpy")
+    blocks = [_parse_block_numpy(block) for block in _iter_blocks(filepath, block_size)]
+    if not blocks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(blocks)
+
+def load_readings(
+    filepath: str,
+    engine: str = "python",
+    cache: "ReadingCache" = None,
+    on_reject: Optional[Callable[[int, str, str], None]] = None,
+) -> List[int]:
+    """
+    Loads numeric readings from a text file (one per line).
+    Ignores empty lines or invalid entries gracefully.
+
+    Args:
+        filepath (str): Path to the text file.
+        engine (str): "python" (default) parses line by line into a list;
+            "numpy" bulk-parses into an np.ndarray (see load_readings_numpy()).
+        cache (ReadingCache): Optional binary cache (src/cache.py). On a hit the parsed
+            readings are memory-mapped instead of re-parsing the text; on a miss they are stored.
+        on_reject (callable): Optional hook for ignored entries, as in iter_readings()
+            (python engine only; a cache hit parses nothing, so nothing is reported).
+
+    Returns:
+        List[int]: Clean list of numeric readings (an np.ndarray for engine="numpy").
+
+    Raises:
+        FileNotFoundError: If the file path is invalid.
+        ValueError: If no valid readings are found, the engine is unknown, or on_reject
+            is given with the numpy engine.
+    """
+    if engine not in ("python", "numpy"):
+        raise ValueError(f"Unknown engine: {engine}. Expected 'python' or 'numpy'.")
+    if engine == "numpy" and on_reject is not None:
+        raise ValueError("on_reject is only supported by the python engine.")
+    if engine == "numpy" and np is None:
+        raise ImportError("The numpy engine requires numpy: pip install numpy")
+
+    readings = cache.get(filepath, engine=engine) if cache is not None else None
+    if readings is not None:
+        print(f"[INFO] Loaded {len(readings)} cached readings.")
+        return readings
+
+    if engine == "python":
+        try:
+            f = open(filepath, "r", encoding="utf-8")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filepath}")
+        with f:
+            readings: List[int] = _parse_lines_to_list(f, on_reject)
+    else:
+        readings = load_readings_numpy(filepath)
+
+    if len(readings) == 0:
         raise ValueError("No valid numeric readings found.")
+    if cache is not None:
+        cache.put(filepath, readings)
 
     print(f"[INFO] Loaded {len(readings)} valid readings.")
     return readings
 
-def analyze_readings(readings: List[int]) -> Dict:
+def _exact_sum(values: "np.ndarray") -> int:
+    # an int64 sum wraps silently: sum in numpy only if size * max(|value|) fits in
+    # int64, otherwise add the values as Python ints
+    if values.size == 0:
+        return 0
+    bound = max(-int(values.min()), int(values.max()))
+    if bound * int(values.size) < 2**63:
+        return int(values.sum(dtype=np.int64))
+    return sum(values.tolist())
+
+class ReadingAccumulator:
+    """
+    Incremental accumulator for the stable-reading metrics.
+    Readings are fed one at a time with add(); only running totals are kept,
+    so memory use is O(1) unless keep_stable_values is True.
+
+    Args:
+        keep_stable_values (bool): Also retain the stable values themselves.
+        with_stats (bool): Also track min/max/variance and p50/p95/p99 sketches
+            (see src/sketches.py) for all readings and for the stable subset.
     """
-    * Take a list of numbers as indicated by readings: List[int]
-    * Filter even-indexed (stable) and compute metrics:
+
+    def __init__(self, keep_stable_values: bool = False, with_stats: bool = False):
+        self.total_readings = 0
+        self.stable_count = 0
+        self.sum_stable = 0
+        # the sum at even 0-based positions (unstable) is kept so that partial accumulators can be merged
+        self.sum_unstable = 0
+        self.stable_values = [] if keep_stable_values else None
+        # indexed by position parity: [unstable, stable]
+        self.stats = [ReadingStats(), ReadingStats()] if with_stats else None
+
+    def add(self, value: int) -> None:
+        # the reading's 0-based position is the number of readings seen before it
+        parity = self.total_readings % 2
+        if parity == 1:
+            self.stable_count += 1
+            self.sum_stable += value
+            if self.stable_values is not None:
+                self.stable_values.append(value)
+        else:
+            self.sum_unstable += value
+        if self.stats is not None:
+            self.stats[parity].add(value)
+        self.total_readings += 1
+
+    def update(self, readings: Iterable[int]) -> None:
+        """
+        Adds many readings. Lists and tuples take the slicing fast path (add_sequence());
+        any other iterable is consumed in slices of UPDATE_BATCH_SIZE readings, so a one-shot
+        iterator also avoids a method call per reading while memory stays bounded.
+        """
+        if isinstance(readings, (list, tuple)):
+            self.add_sequence(readings)
+            return
+        readings = iter(readings)
+        while True:
+            batch = list(islice(readings, UPDATE_BATCH_SIZE))
+            if not batch:
+                return
+            self.add_sequence(batch)
+
+    def add_sequence(self, readings: Sequence[int]) -> None:
+        """
+        update() for a list or tuple: the stable readings are readings[1::2] (readings[0::2]
+        after an odd number of readings), summed with the built-in sum() instead of a
+        Python-level loop, like add_array() does for numpy arrays.
+        """
+        first_stable = 1 - self.total_readings % 2
+        stable = readings[first_stable::2]
+        unstable = readings[1 - first_stable::2]
+        self.stable_count += len(stable)
+        self.sum_stable += sum(stable)
+        self.sum_unstable += sum(unstable)
+        if self.stable_values is not None:
+            self.stable_values.extend(stable)
+        if self.stats is not None:
+            for value in stable:
+                self.stats[1].add(value)
+            for value in unstable:
+                self.stats[0].add(value)
+        self.total_readings += len(readings)
+
+    def add_array(self, readings: "np.ndarray") -> None:
+        """
+        Vectorized update() for numpy arrays: the stable readings are a strided
+        view (readings[1::2], or readings[0::2] after an odd number of readings),
+        so nothing is copied or enumerated in Python.
+        """
+        first_stable = 1 - self.total_readings % 2
+        stable = readings[first_stable::2]
+        unstable = readings[1 - first_stable::2]
+        self.stable_count += int(stable.size)
+        self.sum_stable += _exact_sum(stable)
+        self.sum_unstable += _exact_sum(unstable)
+        if self.stable_values is not None:
+            self.stable_values.extend(stable.tolist())
+        if self.stats is not None:
+            self.stats[1].add_array(stable)
+            self.stats[0].add_array(unstable)
+        self.total_readings += int(readings.size)
+
+    def merge(self, other: "ReadingAccumulator") -> None:
+        """
+        Appends the readings summarized by other, as if they followed this accumulator's
+        readings in the same file. other counted positions from 0, so when this
+        accumulator has seen an odd number of readings its stable/unstable halves swap.
+
+        Raises:
+            ValueError: if either accumulator retains stable_values, or only one tracks stats
+        """
+        if self.stable_values is not None or other.stable_values is not None:
+            raise ValueError("Cannot merge accumulators that retain stable_values")
+        if (self.stats is None) != (other.stats is None):
+            raise ValueError("Cannot merge accumulators with and without stats")
+        if self.total_readings % 2 == 0:
+            self.stable_count += other.stable_count
+            self.sum_stable += other.sum_stable
+            self.sum_unstable += other.sum_unstable
+            other_stats = other.stats
+        else:
+            self.stable_count += other.total_readings - other.stable_count
+            self.sum_stable += other.sum_unstable
+            self.sum_unstable += other.sum_stable
+            other_stats = other.stats[::-1] if other.stats is not None else None
+        if self.stats is not None:
+            self.stats[0].merge(other_stats[0])
+            self.stats[1].merge(other_stats[1])
+        self.total_readings += other.total_readings
+
+    def to_state(self) -> Dict:
+        """Returns the running totals as a JSON-serializable dict (stable_values are not saved)."""
+        state = {
+            "total_readings": self.total_readings,
+            "stable_count": self.stable_count,
+            "sum_stable": self.sum_stable,
+            "sum_unstable": self.sum_unstable,
+        }
+        if self.stats is not None:
+            state["stats"] = [stats.to_state() for stats in self.stats]
+        return state
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "ReadingAccumulator":
+        """Rebuilds an accumulator from to_state() output."""
+        accumulator = cls()
+        accumulator.total_readings = state["total_readings"]
+        accumulator.stable_count = state["stable_count"]
+        accumulator.sum_stable = state["sum_stable"]
+        accumulator.sum_unstable = state["sum_unstable"]
+        if "stats" in state:
+            accumulator.stats = [ReadingStats.from_state(stats) for stats in state["stats"]]
+        return accumulator
+
+    def summary(self) -> Dict:
+        """
+        Returns the metrics dictionary in the same shape as analyze_readings().
+        'stable_values' is only included when the accumulator retains them, and
+        'reading_stats'/'stable_stats' only when it tracks stats.
+        """
+        average_stable = round(self.sum_stable / self.stable_count, 1) if self.stable_count > 0 else 0
+        summary = {
+            "total_readings": self.total_readings,
+            "stable_count": self.stable_count,
+            "sum_stable": self.sum_stable,
+            "average_stable": average_stable,
+        }
+        if self.stable_values is not None:
+            summary["stable_values"] = self.stable_values
+        if self.stats is not None:
+            all_readings = ReadingStats()
+            all_readings.merge(self.stats[0])
+            all_readings.merge(self.stats[1])
+            summary["reading_stats"] = all_readings.summary()
+            summary["stable_stats"] = self.stats[1].summary()
+        return summary
+
+def analyze_readings(readings: Iterable[int], keep_stable_values: bool = False, with_stats: bool = False) -> Dict:
+    """
+    * Take a list of numbers as indicated by readings: List[int] (any iterable works, e.g. iter_readings())
+    * np.ndarray input (engine="numpy") is analyzed with array slicing instead of a Python loop
+    * Filter even-indexed (stable) and compute metrics in a single pass:
       - total_readings, stable_count, sum_stable, average_stable, stable_values
+    * stable_values is only included when keep_stable_values is True
+    * with_stats adds 'reading_stats' and 'stable_stats': min, max, mean, variance, p50, p95, p99,
+      computed in the same pass with mergeable sketches (quantiles are approximate for large inputs)
     Raises:
         ValueError: if readings is empty
     """
-    if not readings:
-        raise ValueError("Readings list is empty")  
     #pick values at 0 based indices or indices 1,3,5 (the even -numbered readings in real life)
     '''
     positions 0 1 2 3 4 5
     values    72 74 71 73 70 75
     we keep indices 1,3,5 -> values 74,73,75. In real life we could count indices from 1. hence we are keeping the numbers at real world positions 2,4,6 which in program means 1,3,5 (0 based indexing)
     '''
-    stable_values = [val for i, val in enumerate(readings) if i%2 ==1] # following syntax for string comprehension
-    total_readings = len(readings)
-    stable_count = len(stable_values)
-    sum_stable = sum(stable_values)
-    average_stable = round(sum_stable / stable_count,1) if stable_count > 0 else 0
+    accumulator = ReadingAccumulator(keep_stable_values=keep_stable_values, with_stats=with_stats)
+    if np is not None and isinstance(readings, np.ndarray):
+        accumulator.add_array(readings)
+    else:
+        accumulator.update(readings)
+    if accumulator.total_readings == 0:
+        raise ValueError("Readings list is empty")
+    return accumulator.summary()
+
+class RollingStabilityDetector:
+    """
+    Streaming rolling-window stability check, an alternative to the odd-index rule.
+    Each reading is compared with the mean and standard deviation of the `window`
+    readings before it and flagged as unstable when it lies more than `sigma`
+    standard deviations away. Only the window is kept in memory, and running sums
+    make every step O(1).
+
+    Args:
+        window (int): Number of preceding readings in the rolling window.
+        sigma (float): Flag readings further than sigma * std from the rolling mean.
+        max_flagged (int): How many flagged positions to list in the summary.
+    """
+
+    def __init__(self, window: int = STABILITY_WINDOW, sigma: float = STABILITY_SIGMA,
+                 max_flagged: int = MAX_FLAGGED_INDICES):
+        if window < 1:
+            raise ValueError("window must be at least 1")
+        self.window = window
+        self.sigma = sigma
+        self.max_flagged = max_flagged
+        self._values = deque()
+        self._sum = 0
+        self._sum_squares = 0
+        self.total_readings = 0
+        self.flagged_count = 0
+        self.flagged_indices: List[int] = []
+        self.stable_count = 0
+        self.sum_stable = 0
+
+    def add(self, value: int) -> bool:
+        """Adds the next reading; returns True if it was flagged as unstable."""
+        flagged = False
+        if len(self._values) == self.window:
+            flagged = _outside_band(value, self._sum, self._sum_squares, self.window, self.sigma)
+            if flagged:
+                self.flagged_count += 1
+                if len(self.flagged_indices) < self.max_flagged:
+                    self.flagged_indices.append(self.total_readings)
+            else:
+                self.stable_count += 1
+                self.sum_stable += value
+            oldest = self._values.popleft()
+            self._sum -= oldest
+            self._sum_squares -= oldest * oldest
+        self._values.append(value)
+        self._sum += value
+        self._sum_squares += value * value
+        self.total_readings += 1
+        return flagged
+
+    def update(self, readings: Iterable[int]) -> None:
+        for value in readings:
+            self.add(value)
+
+    def summary(self) -> Dict:
+        """Returns the stability summary, see analyze_stability()."""
+        window = len(self._values)
+        return _stability_summary(
+            self.window, self.sigma, self.total_readings, self.flagged_count, self.flagged_indices,
+            self.stable_count, self.sum_stable,
+            self._sum / window if window else 0,
+            math.sqrt(max(window * self._sum_squares - self._sum * self._sum, 0)) / window if window else 0,
+        )
+
+def _outside_band(value: int, window_sum: int, window_sum_squares: int, window: int, sigma: float) -> bool:
+    # |x - mean| > sigma * std, multiplied through by the window size so the
+    # integer parts stay exact: (w*x - S)^2 > sigma^2 * (w*Q - S^2)
+    deviation = window * value - window_sum
+    spread = window * window_sum_squares - window_sum * window_sum
+    return deviation * deviation > sigma * sigma * spread
 
+def _stability_summary(window: int, sigma: float, total_readings: int, flagged_count: int,
+                       flagged_indices: List[int], stable_count: int, sum_stable: int,
+                       window_mean: float, window_std: float) -> Dict:
     return {
+        "stability_mode": "rolling",
+        "window": window,
+        "sigma": sigma,
         "total_readings": total_readings,
+        "evaluated_readings": max(total_readings - window, 0),
         "stable_count": stable_count,
         "sum_stable": sum_stable,
-        "average_stable": average_stable,
-        "stable_values": stable_values
+        "average_stable": round(sum_stable / stable_count, 1) if stable_count > 0 else 0,
+        "flagged_count": flagged_count,
+        "flagged_indices": flagged_indices,
+        "last_window_mean": round(window_mean, 2),
+        "last_window_std": round(window_std, 2),
     }
 
+def rolling_window_stats(readings: "np.ndarray", window: int = STABILITY_WINDOW) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Vectorized rolling mean and standard deviation (population) of the `window`
+    readings preceding each position, computed in O(n) from cumulative sums.
+    Element j describes the window before readings[window + j].
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (rolling_mean, rolling_std), each of length len(readings) - window.
+    """
+    window_sums, window_sum_squares = _window_sums(readings, window)
+    spread = window * window_sum_squares - window_sums * window_sums
+    return window_sums / window, np.sqrt(np.maximum(spread, 0)) / window
+
+def _window_sums(readings: "np.ndarray", window: int) -> Tuple["np.ndarray", "np.ndarray"]:
+    values = readings.astype(np.int64, copy=False)
+    # int64 cumsums may wrap on huge inputs, but differences of them are still exact
+    cumulative = np.concatenate(([0], np.cumsum(values)))
+    cumulative_squares = np.concatenate(([0], np.cumsum(values * values)))
+    end = len(values)
+    return cumulative[window:end] - cumulative[:end - window], cumulative_squares[window:end] - cumulative_squares[:end - window]
+
+def _analyze_stability_array(readings: "np.ndarray", window: int, sigma: float, max_flagged: int) -> Dict:
+    total_readings = int(readings.size)
+    if total_readings <= window:
+        detector = RollingStabilityDetector(window, sigma, max_flagged)
+        detector.update(readings.tolist())
+        return detector.summary()
+
+    values = readings.astype(np.int64, copy=False)
+    window_sums, window_sum_squares = _window_sums(values, window)
+    evaluated = values[window:]
+    deviation = (window * evaluated - window_sums).astype(np.float64)
+    spread = window * window_sum_squares - window_sums * window_sums
+    flagged = deviation * deviation > sigma * sigma * spread
+
+    flagged_positions = np.flatnonzero(flagged)
+    stable = evaluated[~flagged]
+    last = values[-window:]
+    return _stability_summary(
+        window, sigma, total_readings, int(flagged_positions.size),
+        (flagged_positions[:max_flagged] + window).tolist(),
+        int(stable.size), _exact_sum(stable),
+        float(last.mean()), float(last.std()),
+    )
+
+def analyze_stability(
+    readings: Iterable[int],
+    window: int = STABILITY_WINDOW,
+    sigma: float = STABILITY_SIGMA,
+    max_flagged: int = MAX_FLAGGED_INDICES,
+) -> Dict:
+    """
+    Rolling-window stability analysis: a reading is unstable when it lies more than
+    `sigma` rolling standard deviations from the mean of the `window` readings before it.
+    The first `window` readings only warm up the window and are neither stable nor flagged.
+
+    np.ndarray input uses the vectorized cumulative-sum implementation; any other
+    iterable (e.g. iter_readings()) is streamed through RollingStabilityDetector.
+    Both return the same schema, which keeps the analyze_readings() keys so that
+    save_summary() can report it:
+      - total_readings, stable_count, sum_stable, average_stable
+      - stability_mode, window, sigma, evaluated_readings, flagged_count,
+        flagged_indices (first max_flagged), last_window_mean, last_window_std
+
+    Raises:
+        ValueError: if readings is empty or window < 1
+    """
+    if window < 1:
+        raise ValueError("window must be at least 1")
+    if np is not None and isinstance(readings, np.ndarray):
+        if readings.size == 0:
+            raise ValueError("Readings list is empty")
+        return _analyze_stability_array(readings, window, sigma, max_flagged)
+
+    detector = RollingStabilityDetector(window, sigma, max_flagged)
+    detector.update(readings)
+    if detector.total_readings == 0:
+        raise ValueError("Readings list is empty")
+    return detector.summary()
+
+def _chunk_ranges(filepath: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Splits the file into byte ranges of roughly chunk_size bytes.
+    Each range is extended to end just after a newline, so no line is split across ranges.
+    """
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:  # an empty file cannot be memory-mapped
+            return []
+        ranges: List[Tuple[int, int]] = []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            while start < size:
+                end = min(start + chunk_size, size)
+                if end < size:
+                    newline = mm.find(b"\n", end - 1)
+                    end = size if newline == -1 else newline + 1
+                ranges.append((start, end))
+                start = end
+    return ranges
+
+def _analyze_range(
+    filepath: str, start: int, end: int, engine: str, with_stats: bool = False, block_size: int = RANGE_BLOCK_SIZE
+) -> ReadingAccumulator:
+    """
+    Summarizes the readings in the byte range [start, end), read in line-aligned blocks of
+    about block_size bytes so memory stays bounded however large the range is. Used by the
+    parallel workers and by incremental mode. Positions are counted from the start of the
+    range; the caller fixes the parity when it merges the accumulator in file order.
+    """
+    accumulator = ReadingAccumulator(with_stats=with_stats)
+    for block in _iter_blocks(filepath, block_size, start, end):
+        if engine == "numpy":
+            accumulator.add_array(_parse_block_numpy(block))
+        else:
+            # decoded lazily from the block; newline=None gives the same universal-newline
+            # splitting as iter_readings()
+            lines = io.TextIOWrapper(io.BytesIO(block), encoding="utf-8", newline=None)
+            accumulator.update(_parse_lines(lines))
+    return accumulator
+
+def _analyze_file_parallel(
+    filepath: str, engine: str, workers: int, chunk_size: int, with_stats: bool
+) -> ReadingAccumulator:
+    ranges = _chunk_ranges(filepath, chunk_size)
+    accumulator = ReadingAccumulator(with_stats=with_stats)
+    if not ranges:
+        return accumulator
+
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as pool:
+        # map() yields results in submission order, i.e. file order
+        for partial in pool.map(
+            _analyze_range, repeat(filepath), starts, ends, repeat(engine), repeat(with_stats)
+        ):
+            accumulator.merge(partial)
+    return accumulator
+
+def analyze_file(
+    filepath: str,
+    keep_stable_values: bool = False,
+    engine: str = "python",
+    workers: int = 1,
+    chunk_size: int = PARALLEL_CHUNK_SIZE,
+    with_stats: bool = False,
+) -> Dict:
+    """
+    Streams readings from filepath straight into a ReadingAccumulator without
+    building a list, so memory use stays constant regardless of file size.
+
+    With workers > 1 the file is memory-mapped and split into line-aligned byte
+    ranges of about chunk_size bytes, which are parsed and summarized in a process
+    pool. Each partial summary reports its reading count, so merging them in file
+    order restores the global odd/even positions.
+
+    Args:
+        filepath (str): Path to the text file.
+        keep_stable_values (bool): Retain the stable values in the summary (O(n) memory).
+        engine (str): "python" or "numpy" (block-wise bulk parsing, see load_readings_numpy()).
+        workers (int): Number of worker processes; None uses every CPU.
+        chunk_size (int): Approximate bytes per parallel work item.
+        with_stats (bool): Add min/max/variance/quantile stats, see analyze_readings().
+
+    Returns:
+        Dict: Metrics summary, see analyze_readings().
+
+    Raises:
+        FileNotFoundError: If the file path is invalid.
+        ValueError: If no valid readings are found, the engine is unknown, or
+            stable values are requested in parallel mode.
+        ImportError: If engine="numpy" and numpy is not installed.
+    """
+    if engine not in ("python", "numpy"):
+        raise ValueError(f"Unknown engine: {engine}. Expected 'python' or 'numpy'.")
+    if engine == "numpy" and np is None:
+        raise ImportError("The numpy engine requires numpy: pip install numpy")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers > 1:
+        if keep_stable_values:
+            raise ValueError("stable_values cannot be retained in parallel mode")
+        accumulator = _analyze_file_parallel(filepath, engine, workers, chunk_size, with_stats)
+    else:
+        accumulator = ReadingAccumulator(keep_stable_values=keep_stable_values, with_stats=with_stats)
+        if engine == "numpy":
+            for block in _iter_blocks(filepath, NUMPY_BLOCK_SIZE):
+                accumulator.add_array(_parse_block_numpy(block))
+        else:
+            accumulator.update(iter_readings(filepath))
+
+    if accumulator.total_readings == 0:
+        raise ValueError("No valid numeric readings found.")
+    print(f"[INFO] Streamed {accumulator.total_readings} valid readings.")
+    return accumulator.summary()
+
+def _head_hash(f, length: int) -> str:
+    f.seek(0)
+    return hashlib.sha256(f.read(min(length, STATE_HEAD_BYTES))).hexdigest()
+
+def _last_line_end(f, start: int, size: int) -> int:
+    """Returns the offset just past the last newline in [start, size), or start if there is none."""
+    position = size
+    while position > start:
+        read_from = max(start, position - 64 * 1024)
+        f.seek(read_from)
+        newline = f.read(position - read_from).rfind(b"\n")
+        if newline != -1:
+            return read_from + newline + 1
+        position = read_from
+    return start
+
+def _load_state(state_path: str) -> Dict:
+    try:
+        with open(state_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"[WARN] Ignoring unreadable state file {state_path}: {e}")
+        return {}
+
+def _save_state(state: Dict, state_path: str) -> None:
+    # write to a temp file and rename, so a crash never leaves a half-written state
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, state_path)
+
+def analyze_file_incremental(
+    filepath: str, state_path: str, engine: str = "python", with_stats: bool = False,
+    block_size: int = RANGE_BLOCK_SIZE,
+) -> Dict:
+    """
+    Updates the summary of a growing readings file by parsing only the bytes appended
+    since the last run. The byte offset, the running totals (which carry the odd/even
+    parity) and a fingerprint of the file are kept in a small JSON state file.
+
+    Falls back to a full rescan when the file was truncated or rotated (different inode,
+    shorter than the saved offset, or a changed head). A trailing line without a newline
+    is treated as still being written and is picked up by the next run.
+
+    Args:
+        filepath (str): Path to the text file.
+        state_path (str): Path to the JSON state file (created if missing).
+        engine (str): "python" or "numpy", see analyze_file().
+        with_stats (bool): Track min/max/variance/quantile stats; the sketches are saved
+            in the state file. Switching this on for an existing state forces a rescan.
+        block_size (int): Bytes read at a time, so a first run or a rescan of a large
+            file uses bounded memory.
+
+    Returns:
+        Dict: Metrics summary for the whole file, see analyze_readings().
+
+    Raises:
+        FileNotFoundError: If the file path is invalid.
+        ValueError: If no valid readings have been found so far.
+    """
+    if engine not in ("python", "numpy"):
+        raise ValueError(f"Unknown engine: {engine}. Expected 'python' or 'numpy'.")
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    state = _load_state(state_path)
+    with f:
+        stat = os.fstat(f.fileno())
+        offset = state.get("offset", 0)
+        resumable = (
+            bool(state)
+            and state.get("inode") == stat.st_ino
+            and state.get("device") == stat.st_dev
+            and offset <= stat.st_size
+            and state.get("head_hash") == _head_hash(f, offset)
+            and ("stats" in state["accumulator"]) == with_stats
+        )
+        if resumable:
+            accumulator = ReadingAccumulator.from_state(state["accumulator"])
+        else:
+            if state:
+                print(f"[INFO] {filepath} was truncated or rotated; rescanning from the start.")
+            accumulator = ReadingAccumulator(with_stats=with_stats)
+            offset = 0
+        end = _last_line_end(f, offset, stat.st_size)
+        head_hash = _head_hash(f, end)
+
+    if end > offset:
+        new_readings = _analyze_range(filepath, offset, end, engine, with_stats, block_size)
+        accumulator.merge(new_readings)
+        print(f"[INFO] Parsed {end - offset} new bytes ({new_readings.total_readings} new readings).")
+
+    _save_state(
+        {
+            "filepath": os.path.abspath(filepath),
+            "inode": stat.st_ino,
+            "device": stat.st_dev,
+            "offset": end,
+            "head_hash": head_hash,
+            "accumulator": accumulator.to_state(),
+        },
+        state_path,
+    )
+
+    if accumulator.total_readings == 0:
+        raise ValueError("No valid numeric readings found.")
+    return accumulator.summary()
+
 def save_summary(summary: Dict, output_path: str) -> None:
     """
     Writes a human-readable summary of sensor data analysis to a text file.
@@ -81,6 +874,9 @@ def save_summary(summary: Dict, output_path: str) -> None:
     Notes:
         - Appends to the file if it already exists.
         - Includes a timestamp for traceability.
+        - The 'Stable Values' line is omitted when the summary does not retain them.
+        - Stats lines (min, max, mean, variance, p50, p95, p99) are written when present.
+        - Rolling stability summaries (analyze_stability()) add their window and flagged readings.
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -91,10 +887,53 @@ def save_summary(summary: Dict, output_path: str) -> None:
             f.write(f"Stable Readings Count: {summary['stable_count']}\n")
             f.write(f"Sum of Stable Readings: {summary['sum_stable']}\n")
             f.write(f"Average Stable Reading: {summary['average_stable']}\n")
-            f.write(f"Stable Values: {summary['stable_values']}\n\n")
+            if "stable_values" in summary:
+                f.write(f"Stable Values: {summary['stable_values']}\n")
+            if summary.get("stability_mode") == "rolling":
+                f.write(f"Stability Mode: rolling window={summary['window']}, sigma={summary['sigma']}\n")
+                f.write(f"Flagged Readings: {summary['flagged_count']} of {summary['evaluated_readings']} evaluated\n")
+                f.write(f"Flagged Positions: {summary['flagged_indices']}\n")
+            for label, key in (("All Readings", "reading_stats"), ("Stable Readings", "stable_stats")):
+                if key in summary:
+                    stats = ", ".join(f"{name}={value}" for name, value in summary[key].items())
+                    f.write(f"{label} Stats: {stats}\n")
+            f.write("\n")
 
         print(f"[SUCCESS] Data quality report written to {output_path}")
 
     except Exception as e:
         print(f"[ERROR] Failed to write summary: {e}")
         raise
+
+def follow_file(
+    filepath: str,
+    state_path: str,
+    output_path: str,
+    interval: float = 5.0,
+    engine: str = "python",
+    max_updates: int = None,
+    with_stats: bool = False,
+) -> None:
+    """
+    Polls a growing readings file every interval seconds and appends a fresh report
+    with save_summary() whenever new readings arrive (see analyze_file_incremental()).
+    Runs until interrupted, or until max_updates reports have been written.
+    """
+    updates = 0
+    last_total = None
+    try:
+        while max_updates is None or updates < max_updates:
+            try:
+                summary = analyze_file_incremental(filepath, state_path, engine=engine, with_stats=with_stats)
+            except (FileNotFoundError, ValueError) as e:
+                print(f"[WARN] {e} Waiting for data...")
+                summary = None
+            if summary is not None and summary["total_readings"] != last_total:
+                save_summary(summary, output_path)
+                last_total = summary["total_readings"]
+                updates += 1
+                if max_updates is not None and updates >= max_updates:
+                    break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print("[INFO] Stopped following.")
@@ -0,0 +1,163 @@
+import hashlib
+import json
+import mmap
+import os
+import time
+from array import array
+from typing import Dict, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # numpy is only needed for engine="numpy"
+    np = None
+
+# bytes hashed at each end of the source file for its fingerprint
+FINGERPRINT_BYTES = 64 * 1024
+# default cap on the total size of cached arrays
+DEFAULT_CACHE_BYTES = 1024 * 1024 * 1024
+
+
+def fingerprint(filepath: str) -> str:
+    """
+    Returns a cheap fingerprint of a readings file: its size, mtime and a SHA-256
+    of the first and last FINGERPRINT_BYTES. Any append, truncation or rewrite
+    changes the fingerprint without hashing the whole (possibly huge) file.
+
+    Raises:
+        FileNotFoundError: If the file path is invalid.
+    """
+    try:
+        f = open(filepath, "rb")
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    with f:
+        stat = os.fstat(f.fileno())
+        digest = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}:".encode())
+        digest.update(f.read(FINGERPRINT_BYTES))
+        if stat.st_size > FINGERPRINT_BYTES:
+            f.seek(max(FINGERPRINT_BYTES, stat.st_size - FINGERPRINT_BYTES))
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class ReadingCache:
+    """
+    On-disk cache of parsed readings, stored as raw int64 arrays (array('q') layout,
+    native byte order) and keyed by the source file's fingerprint. A hit memory-maps
+    the array instead of re-parsing the text. The total size is capped, and
+    least-recently-used entries are evicted across all source files.
+
+    Args:
+        cache_dir (str): Directory holding the .bin arrays and index.json (created if missing).
+        max_bytes (int): Cap on the total size of cached arrays.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._index = self._load_index()
+
+    def _load_index(self) -> Dict:
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            print(f"[WARN] Ignoring unreadable cache index {self._index_path}: {e}")
+            return {}
+
+    def _save_index(self) -> None:
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.bin")
+
+    def _remove(self, key: str) -> None:
+        self._index.pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry["nbytes"] for entry in self._index.values())
+
+    def get(self, filepath: str, engine: str = "python"):
+        """
+        Returns the cached readings for filepath, or None on a miss.
+        engine="numpy" returns a read-only int64 array backed by the memory-mapped
+        cache file; engine="python" returns a list of ints copied from the mapping.
+        """
+        key = fingerprint(filepath)
+        entry = self._index.get(key)
+        if entry is None or not os.path.exists(self._entry_path(key)):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        entry["last_used"] = time.time()
+        self._save_index()
+        if entry["nbytes"] == 0:  # an empty file cannot be memory-mapped
+            return np.empty(0, dtype=np.int64) if engine == "numpy" else []
+        with open(self._entry_path(key), "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if engine == "numpy":
+            # the array keeps the mapping alive; nothing is copied
+            readings = np.frombuffer(mm, dtype=np.int64)
+        else:
+            view = memoryview(mm).cast("q")
+            readings = view.tolist()
+            view.release()
+            mm.close()
+        return readings
+
+    def put(self, filepath: str, readings: Iterable[int]) -> bool:
+        """
+        Stores the parsed readings of filepath, evicting least-recently-used entries
+        to stay under max_bytes. Returns False (and caches nothing) if the readings
+        do not fit the cap or the int64 range.
+        """
+        key = fingerprint(filepath)
+        if np is not None and isinstance(readings, np.ndarray):
+            data = readings.astype(np.int64, copy=False).tobytes()
+        else:
+            try:
+                data = array("q", readings).tobytes()
+            except OverflowError:
+                print("[WARN] Readings outside the int64 range are not cached.")
+                return False
+        if len(data) > self.max_bytes:
+            print(f"[WARN] {filepath} is larger than the cache cap; not cached.")
+            return False
+
+        source = os.path.abspath(filepath)
+        # an older fingerprint of the same file can never be hit again
+        for old_key in [k for k, entry in self._index.items() if entry["source"] == source]:
+            self._remove(old_key)
+        for old_key in sorted(self._index, key=lambda k: self._index[k]["last_used"]):
+            if self.total_bytes + len(data) <= self.max_bytes:
+                break
+            self._remove(old_key)
+
+        tmp_path = f"{self._entry_path(key)}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self._entry_path(key))
+        self._index[key] = {"source": source, "nbytes": len(data), "last_used": time.time()}
+        self._save_index()
+        return True
+
+    def clear(self) -> None:
+        for key in list(self._index):
+            self._remove(key)
+        self._save_index()
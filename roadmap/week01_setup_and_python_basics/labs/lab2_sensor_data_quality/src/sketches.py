@@ -0,0 +1,223 @@
+import math
+import random
+from typing import Dict, Iterable, List, Optional
+
+# default KLL accuracy parameter: ~3*k items retained, rank error roughly 1.7/k
+DEFAULT_SKETCH_K = 200
+# capacity shrink factor between consecutive KLL levels
+_KLL_C = 2 / 3
+
+
+class Moments:
+    """
+    Streaming count/min/max/mean/variance using Welford's algorithm.
+    Two Moments objects merge exactly (Chan et al. parallel update), so partial
+    results from different shards or files combine into the same numbers a single
+    pass would have produced (up to float rounding).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # sum of squared differences from the mean
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def add_array(self, values) -> None:
+        """Vectorized add() for numpy arrays: summarizes the array, then merges it."""
+        if values.size == 0:
+            return
+        batch = Moments()
+        batch.count = int(values.size)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min = values.min().item()
+        batch.max = values.max().item()
+        self.merge(batch)
+
+    def merge(self, other: "Moments") -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Population variance (0 for fewer than two values)."""
+        return self.m2 / self.count if self.count > 1 else 0.0
+
+    def to_state(self) -> Dict:
+        return {"count": self.count, "mean": self.mean, "m2": self.m2, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "Moments":
+        moments = cls()
+        moments.count = state["count"]
+        moments.mean = state["mean"]
+        moments.m2 = state["m2"]
+        moments.min = state["min"]
+        moments.max = state["max"]
+        return moments
+
+
+class KLLSketch:
+    """
+    KLL quantile sketch (Karnin, Lang, Liberty 2016).
+    Values are kept in a stack of compactors; when a level fills up it is sorted and
+    every other item is promoted to the next level with twice the weight. Memory
+    stays at about 3*k items however many values are added, and sketches built
+    on different shards merge with the same bounded rank error.
+
+    Args:
+        k (int): Accuracy parameter; larger k means more memory and smaller error.
+        seed (int): Seed for the coin flips that pick which half is promoted.
+    """
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K, seed: int = 0):
+        self.k = k
+        self.count = 0
+        self.compactors: List[List[float]] = [[]]
+        self._rng = random.Random(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(2, int(math.ceil(self.k * _KLL_C ** depth)))
+
+    def _size(self) -> int:
+        return sum(len(compactor) for compactor in self.compactors)
+
+    def _max_size(self) -> int:
+        return sum(self._capacity(level) for level in range(len(self.compactors)))
+
+    def add(self, value: float) -> None:
+        self.compactors[0].append(value)
+        self.count += 1
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+
+    def update(self, values: Iterable[float]) -> None:
+        # same as add() in a loop, without the per-call overhead
+        level0 = self.compactors[0]
+        for value in values:
+            level0.append(value)
+            self.count += 1
+            if len(level0) >= self._capacity(0):
+                self._compress()
+                level0 = self.compactors[0]
+
+    def _compress(self) -> None:
+        while self._size() >= self._max_size():
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) >= self._capacity(level):
+                    if level + 1 == len(self.compactors):
+                        self.compactors.append([])
+                    compactor.sort()
+                    # an odd leftover stays behind so no weight is lost
+                    leftover = [compactor.pop()] if len(compactor) % 2 else []
+                    offset = self._rng.randint(0, 1)
+                    self.compactors[level + 1].extend(compactor[offset::2])
+                    self.compactors[level] = leftover
+                    break
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for level, compactor in enumerate(other.compactors):
+            self.compactors[level].extend(compactor)
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Returns the approximate q-quantile (0 <= q <= 1): the smallest retained value
+        whose cumulative weight reaches q of the total. None if the sketch is empty.
+        """
+        weighted = sorted(
+            (value, 1 << level) for level, compactor in enumerate(self.compactors) for value in compactor
+        )
+        if not weighted:
+            return None
+        total = sum(weight for _, weight in weighted)
+        target = q * total
+        cumulative = 0
+        for value, weight in weighted:
+            cumulative += weight
+            if cumulative >= target:
+                return value
+        return weighted[-1][0]
+
+    def to_state(self) -> Dict:
+        return {"k": self.k, "count": self.count, "compactors": self.compactors}
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "KLLSketch":
+        sketch = cls(k=state["k"])
+        sketch.count = state["count"]
+        sketch.compactors = [list(compactor) for compactor in state["compactors"]]
+        return sketch
+
+
+class ReadingStats:
+    """
+    Mergeable distribution summary of a set of readings: exact Welford moments
+    plus a KLL sketch for p50/p95/p99.
+    """
+
+    QUANTILES = {"p50": 0.50, "p95": 0.95, "p99": 0.99}
+
+    def __init__(self, k: int = DEFAULT_SKETCH_K):
+        self.moments = Moments()
+        self.sketch = KLLSketch(k=k)
+
+    def add(self, value: float) -> None:
+        self.moments.add(value)
+        self.sketch.add(value)
+
+    def add_array(self, values) -> None:
+        self.moments.add_array(values)
+        self.sketch.update(values.tolist())
+
+    def merge(self, other: "ReadingStats") -> None:
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+
+    def summary(self) -> Dict:
+        """Returns min, max, mean, variance (population) and the p50/p95/p99 estimates."""
+        stats = {
+            "min": self.moments.min,
+            "max": self.moments.max,
+            "mean": round(self.moments.mean, 1) if self.moments.count else None,
+            "variance": round(self.moments.variance, 2),
+        }
+        for name, q in self.QUANTILES.items():
+            stats[name] = self.sketch.quantile(q)
+        return stats
+
+    def to_state(self) -> Dict:
+        return {"moments": self.moments.to_state(), "sketch": self.sketch.to_state()}
+
+    @classmethod
+    def from_state(cls, state: Dict) -> "ReadingStats":
+        stats = cls(k=state["sketch"]["k"])
+        stats.moments = Moments.from_state(state["moments"])
+        stats.sketch = KLLSketch.from_state(state["sketch"])
+        return stats
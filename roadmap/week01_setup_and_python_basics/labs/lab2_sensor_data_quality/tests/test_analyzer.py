@@ -1,6 +1,7 @@
 import pytest
-from src.analyzer import analyze_readings, load_readings, save_summary, load_readings
+from src.analyzer import analyze_readings, load_readings, save_summary, load_readings, iter_readings, analyze_file, ReadingAccumulator
 import tempfile, os
+from src.error_sink import ErrorSink
 from pathlib import Path
 
 def test_load_readings_valid_file():
@@ -21,7 +22,7 @@ def test_empty_readings_error():
 
 def test_analyze_readings():
     readings = [72, 74, 71, 73, 70, 75]
-    summary = analyze_readings(readings)
+    summary = analyze_readings(readings, keep_stable_values=True)
 
     assert summary["total_readings"] == 6
     assert summary["stable_values"] == [74, 73, 75]    # even-indexed using 0-based indexes -> indices 1,3,5
@@ -59,4 +60,287 @@ def test_save_summary_creates_file(tmp_path):
     assert "Sensor Data Quality Report" in text
     assert "Total Readings: 6" in text
     assert "Stable Readings Count: 3" in text
-    assert "Average Stable Reading: 74.0" in text
\ No newline at end of file
+    assert "Average Stable Reading: 74.0" in text
+
+def test_iter_readings_is_lazy_and_skips_invalid(tmp_path):
+    """Should yield readings one at a time, skipping bad and blank lines."""
+    file_path = tmp_path / "readings.txt"
+    file_path.write_text("10\nabc\n20\n \n-5\n")
+
+    readings = iter_readings(str(file_path))
+
+    assert not isinstance(readings, list)
+    assert list(readings) == [10, 20, -5]
+
+def test_load_readings_reports_rejects_to_error_sink(tmp_path):
+    """Ignored entries should reach the hook with their line numbers; numpy has no hook."""
+    file_path = tmp_path / "readings.txt"
+    file_path.write_text("10\nabc\n\n20\n1.5\n")
+    with ErrorSink(str(tmp_path / "rejects")) as sink:
+        assert load_readings(str(file_path), on_reject=sink.on_reject) == [10, 20]
+    assert sink.summary()["by_code"] == {"invalid entry": 2}
+    assert open(sink.paths[0]).read().splitlines()[1:] == ["invalid entry,2,abc,invalid entry", "invalid entry,5,1.5,invalid entry"]
+    with pytest.raises(ValueError):
+        load_readings(str(file_path), engine="numpy", on_reject=sink.on_reject)
+
+def test_iter_readings_missing_file():
+    """Should raise FileNotFoundError once iteration starts on a missing file."""
+    with pytest.raises(FileNotFoundError):
+        list(iter_readings("non_existent_file.txt"))
+
+def test_analyze_readings_accepts_generator_without_stable_values():
+    """Should compute the same metrics from an iterator and drop stable_values on request."""
+    summary = analyze_readings(iter([72, 74, 71, 73, 70, 75]), keep_stable_values=False)
+
+    assert summary == {
+        "total_readings": 6,
+        "stable_count": 3,
+        "sum_stable": 222,
+        "average_stable": 74.0,
+    }
+
+def test_reading_accumulator_matches_batch_analysis():
+    """Feeding readings one by one should give the same summary as analyze_readings."""
+    readings = [72, 74, 71, 73, 70, 75, 80]
+    accumulator = ReadingAccumulator(keep_stable_values=True)
+    for value in readings:
+        accumulator.add(value)
+
+    assert accumulator.summary() == analyze_readings(readings, keep_stable_values=True)
+
+def test_analyze_file_streams_and_saves_summary(tmp_path):
+    """Should stream a file end to end and write a report without the Stable Values line."""
+    input_path = tmp_path / "readings.txt"
+    input_path.write_text("72\n74\n71\n#@$\n73\n70\n75\n")
+    output_path = tmp_path / "sensor_summary.txt"
+
+    summary = analyze_file(str(input_path))
+    save_summary(summary, str(output_path))
+
+    assert "stable_values" not in summary
+    text = output_path.read_text()
+    assert "Sum of Stable Readings: 222" in text
+    assert "Stable Values" not in text
+
+def test_analyze_file_no_valid_readings(tmp_path):
+    """Should raise ValueError when the file has no numeric readings."""
+    input_path = tmp_path / "readings.txt"
+    input_path.write_text("abc\n\n#@$\n")
+    with pytest.raises(ValueError):
+        analyze_file(str(input_path))
+
+def test_load_readings_numpy_engine_matches_python(tmp_path):
+    """The numpy engine should skip the same invalid entries and return an int64 array."""
+    np = pytest.importorskip("numpy")
+    file_path = tmp_path / "readings.txt"
+    file_path.write_text("72\n74\n71\n#@$\n73\ndxjik\n 70 \n\n+75\n--3\n-5")
+
+    values = load_readings(str(file_path), engine="numpy")
+
+    assert isinstance(values, np.ndarray)
+    assert values.dtype == np.int64
+    assert values.tolist() == load_readings(str(file_path)) == [72, 74, 71, 73, 70, 75, -5]
+
+def test_load_readings_numpy_engine_small_blocks(tmp_path):
+    """Lines split across block boundaries should still parse correctly."""
+    pytest.importorskip("numpy")
+    from src.analyzer import load_readings_numpy
+    file_path = tmp_path / "readings.txt"
+    file_path.write_text("1200\nabc\n-34\n5\n\n67890\n")
+
+    assert load_readings_numpy(str(file_path), block_size=3).tolist() == [1200, -34, 5, 67890]
+
+def test_analyze_readings_numpy_array():
+    """An ndarray should be analyzed with slicing and give the same summary as a list."""
+    np = pytest.importorskip("numpy")
+    readings = [72, 74, 71, 73, 70, 75]
+
+    assert analyze_readings(np.array(readings)) == analyze_readings(readings)
+    with pytest.raises(ValueError):
+        analyze_readings(np.array([], dtype=np.int64))
+
+def test_analyze_readings_numpy_array_sums_do_not_wrap():
+    """Sums past the int64 range must stay exact, as they are for a list of Python ints."""
+    np = pytest.importorskip("numpy")
+    readings = [2**62 + i for i in range(8)]
+
+    summary = analyze_readings(np.array(readings, dtype=np.int64))
+    assert summary == analyze_readings(readings)
+    assert summary["average_stable"] == round((4 * 2**62 + 16) / 4, 2)
+
+def test_load_readings_unknown_engine(tmp_path):
+    """Should raise ValueError for an unsupported engine name."""
+    file_path = tmp_path / "readings.txt"
+    file_path.write_text("10\n")
+    with pytest.raises(ValueError):
+        load_readings(str(file_path), engine="fortran")
+
+def test_analyze_file_parallel_matches_sequential(tmp_path):
+    """Chunks with odd reading counts must not shift which readings are stable."""
+    input_path = tmp_path / "readings.txt"
+    lines = [str(n) for n in range(1, 200)]
+    lines[10] = "#@$"
+    lines[57] = ""
+    input_path.write_text("\n".join(lines))
+
+    expected = analyze_file(str(input_path))
+    # tiny chunks force many ranges, most of which hold an odd number of readings
+    summary = analyze_file(str(input_path), workers=3, chunk_size=17)
+
+    assert summary == expected
+
+def test_analyze_file_parallel_rejects_stable_values(tmp_path):
+    """Parallel mode cannot retain stable values."""
+    input_path = tmp_path / "readings.txt"
+    input_path.write_text("1\n2\n")
+    with pytest.raises(ValueError):
+        analyze_file(str(input_path), keep_stable_values=True, workers=2)
+
+def test_reading_accumulator_merge_fixes_parity():
+    """Merging partials split at an odd position should equal one pass over everything."""
+    readings = [72, 74, 71, 73, 70, 75, 80]
+    left, right = ReadingAccumulator(), ReadingAccumulator()
+    left.update(readings[:3])
+    right.update(readings[3:])
+    left.merge(right)
+
+    assert left.summary() == analyze_readings(readings, keep_stable_values=False)
+
+def test_analyze_file_incremental_parses_only_appended_lines(tmp_path):
+    """A second run should resume from the saved offset and keep the global parity."""
+    from src.analyzer import analyze_file_incremental
+    input_path = tmp_path / "readings.txt"
+    state_path = tmp_path / "state.json"
+    input_path.write_text("72\n74\n71\n")
+
+    first = analyze_file_incremental(str(input_path), str(state_path))
+    assert first["total_readings"] == 3
+
+    with open(input_path, "a") as f:
+        f.write("73\n70\n75\n76")  # the last line is still being written
+    second = analyze_file_incremental(str(input_path), str(state_path))
+
+    assert second == analyze_readings([72, 74, 71, 73, 70, 75], keep_stable_values=False)
+
+def test_analyze_file_incremental_rescans_truncated_file(tmp_path):
+    """A file shorter than the saved offset should be rescanned from the start."""
+    from src.analyzer import analyze_file_incremental
+    input_path = tmp_path / "readings.txt"
+    state_path = tmp_path / "state.json"
+    input_path.write_text("72\n74\n71\n73\n")
+    analyze_file_incremental(str(input_path), str(state_path))
+
+    input_path.write_text("10\n20\n")
+    summary = analyze_file_incremental(str(input_path), str(state_path))
+
+    assert summary["total_readings"] == 2
+    assert summary["sum_stable"] == 20
+
+def test_follow_file_writes_report(tmp_path):
+    """follow_file should append a report once readings are available."""
+    from src.analyzer import follow_file
+    input_path = tmp_path / "readings.txt"
+    output_path = tmp_path / "sensor_summary.txt"
+    input_path.write_text("72\n74\n")
+
+    follow_file(str(input_path), str(tmp_path / "state.json"), str(output_path), interval=0, max_updates=1)
+
+    assert "Sum of Stable Readings: 74" in output_path.read_text()
+
+def test_analyze_readings_with_stats():
+    """with_stats should add distribution stats for all and stable readings."""
+    summary = analyze_readings([72, 74, 71, 73, 70, 75], with_stats=True)
+
+    assert summary["reading_stats"]["min"] == 70
+    assert summary["reading_stats"]["max"] == 75
+    assert summary["reading_stats"]["p50"] == 72
+    assert summary["stable_stats"]["min"] == 73
+    assert summary["stable_stats"]["mean"] == 74.0
+    assert summary["stable_stats"]["variance"] == pytest.approx(0.67)
+
+def test_analyze_file_parallel_stats_match_sequential(tmp_path):
+    """Stats merged across parallel chunks should keep stable and unstable readings apart."""
+    input_path = tmp_path / "readings.txt"
+    input_path.write_text("\n".join(str(n % 37) for n in range(300)))
+
+    expected = analyze_file(str(input_path), with_stats=True)
+    summary = analyze_file(str(input_path), workers=2, chunk_size=31, with_stats=True)
+
+    assert summary["stable_stats"]["min"] == expected["stable_stats"]["min"]
+    assert summary["stable_stats"]["mean"] == expected["stable_stats"]["mean"]
+    assert summary["reading_stats"]["variance"] == expected["reading_stats"]["variance"]
+    assert summary["stable_stats"]["p50"] == expected["stable_stats"]["p50"]
+
+def test_analyze_stability_flags_spike():
+    """A reading far outside the rolling band should be flagged; warm-up readings are not evaluated."""
+    from src.analyzer import analyze_stability
+    readings = [70, 71, 70, 71, 70, 71, 120, 70, 71]
+
+    summary = analyze_stability(readings, window=4, sigma=3.0)
+
+    assert summary["evaluated_readings"] == 5
+    assert summary["flagged_count"] == 1
+    assert summary["flagged_indices"] == [6]
+    assert summary["stable_count"] == 4
+    assert summary["sum_stable"] == 70 + 71 + 70 + 71
+
+def test_analyze_stability_vectorized_matches_streaming():
+    """The cumulative-sum implementation should return exactly the streaming schema and values."""
+    np = pytest.importorskip("numpy")
+    from src.analyzer import analyze_stability
+    import random
+    rng = random.Random(3)
+    readings = [rng.choice([rng.randint(60, 80), rng.randint(-500, 500)]) for _ in range(500)]
+
+    assert analyze_stability(np.array(readings), window=12, sigma=2.0) == analyze_stability(iter(readings), window=12, sigma=2.0)
+
+def test_rolling_window_stats():
+    """Rolling mean/std should describe the window before each evaluated reading."""
+    np = pytest.importorskip("numpy")
+    from src.analyzer import rolling_window_stats
+
+    means, stds = rolling_window_stats(np.array([1, 2, 3, 4, 5, 6]), window=3)
+
+    assert means.tolist() == [2.0, 3.0, 4.0]
+    assert stds.tolist() == pytest.approx([0.8165] * 3, abs=1e-4)
+
+def test_save_summary_reports_stability(tmp_path):
+    """save_summary should write a stability summary with its flagged readings."""
+    from src.analyzer import analyze_stability
+    file_path = tmp_path / "sensor_summary.txt"
+
+    save_summary(analyze_stability([70, 71, 70, 71, 70, 71, 120], window=4), str(file_path))
+
+    text = file_path.read_text()
+    assert "Stability Mode: rolling window=4, sigma=3.0" in text
+    assert "Flagged Readings: 1 of 3 evaluated" in text
+    assert "Flagged Positions: [6]" in text
+
+def test_analyze_file_incremental_streams_in_blocks(tmp_path):
+    """A cold run and a rescan read the file in many small blocks with the same result."""
+    from src.analyzer import analyze_file_incremental
+    input_path = tmp_path / "readings.txt"
+    state_path = tmp_path / "state.json"
+    readings = [(i * 37) % 101 - 20 for i in range(500)]
+    input_path.write_text("".join(f"{value}\n" for value in readings) + "bad\n")
+
+    cold = analyze_file_incremental(str(input_path), str(state_path), block_size=64)
+    assert cold == analyze_readings(readings, keep_stable_values=False)
+
+    input_path.write_text("".join(f"{value}\n" for value in readings[:300]))
+    rescanned = analyze_file_incremental(str(input_path), str(state_path), block_size=7)
+    assert rescanned == analyze_readings(readings[:300], keep_stable_values=False)
+
+def test_accumulator_update_batches_keep_parity(monkeypatch):
+    """Iterators are consumed in odd-sized slices; the list fast path must agree with add()."""
+    from src import analyzer
+    monkeypatch.setattr(analyzer, "UPDATE_BATCH_SIZE", 3)
+    readings = [5, -2, 7, 7, 0, 13, 4, 9, 1, 8, 6]
+    one_by_one = ReadingAccumulator(keep_stable_values=True, with_stats=True)
+    for value in readings:
+        one_by_one.add(value)
+    batched = ReadingAccumulator(keep_stable_values=True, with_stats=True)
+    batched.update(iter(readings[:4]))
+    batched.update(readings[4:])
+    assert batched.summary() == one_by_one.summary()
+    assert analyze_readings(iter(readings)) == analyze_readings(readings)
@@ -0,0 +1,68 @@
+import os
+
+import pytest
+from src.analyzer import load_readings
+from src.cache import ReadingCache, fingerprint
+
+
+def test_load_readings_cache_hit_skips_parsing(tmp_path, capsys):
+    """The second load should come from the cache with identical readings."""
+    input_path = tmp_path / "readings.txt"
+    input_path.write_text("72\n74\n#@$\n71\n")
+    cache = ReadingCache(str(tmp_path / "cache"))
+
+    first = load_readings(str(input_path), cache=cache)
+    capsys.readouterr()
+    second = load_readings(str(input_path), cache=cache)
+
+    assert first == second == [72, 74, 71]
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert "Ignored invalid entry" not in capsys.readouterr().out
+
+def test_cache_is_invalidated_when_file_changes(tmp_path):
+    """Appending to the source changes its fingerprint and replaces the old entry."""
+    input_path = tmp_path / "readings.txt"
+    input_path.write_text("72\n74\n")
+    cache = ReadingCache(str(tmp_path / "cache"))
+    load_readings(str(input_path), cache=cache)
+    old_key = fingerprint(str(input_path))
+
+    with open(input_path, "a") as f:
+        f.write("71\n")
+
+    assert fingerprint(str(input_path)) != old_key
+    assert load_readings(str(input_path), cache=cache) == [72, 74, 71]
+    assert not os.path.exists(tmp_path / "cache" / f"{old_key}.bin")
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """With room for two arrays, adding a third evicts the least recently used one."""
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.txt"
+        path.write_text("1\n2\n3\n")
+        paths.append(str(path))
+    cache = ReadingCache(str(tmp_path / "cache"), max_bytes=2 * 3 * 8)
+
+    cache.put(paths[0], [1, 2, 3])
+    cache.put(paths[1], [1, 2, 3])
+    assert cache.get(paths[0]) == [1, 2, 3]  # a is now more recent than b
+    cache.put(paths[2], [1, 2, 3])
+
+    assert cache.get(paths[1]) is None
+    assert cache.get(paths[0]) == [1, 2, 3]
+    assert cache.get(paths[2]) == [1, 2, 3]
+    assert cache.total_bytes <= cache.max_bytes
+
+def test_cache_memory_maps_numpy_arrays(tmp_path):
+    """A numpy hit should be a read-only int64 view of the cache file."""
+    np = pytest.importorskip("numpy")
+    input_path = tmp_path / "readings.txt"
+    input_path.write_text("72\n74\n71\n")
+    cache = ReadingCache(str(tmp_path / "cache"))
+    load_readings(str(input_path), engine="numpy", cache=cache)
+
+    readings = load_readings(str(input_path), engine="numpy", cache=cache)
+
+    assert readings.dtype == np.int64
+    assert readings.tolist() == [72, 74, 71]
+    assert not readings.flags.writeable
@@ -0,0 +1,73 @@
+import random
+import statistics
+
+import pytest
+from src.sketches import KLLSketch, Moments, ReadingStats
+
+
+def test_moments_match_statistics_module():
+    """Welford moments should match a two-pass computation."""
+    values = [72, 74, 71, 73, 70, 75]
+    moments = Moments()
+    for value in values:
+        moments.add(value)
+
+    assert moments.count == 6
+    assert moments.min == 70
+    assert moments.max == 75
+    assert moments.mean == pytest.approx(statistics.mean(values))
+    assert moments.variance == pytest.approx(statistics.pvariance(values))
+
+def test_moments_merge_is_exact():
+    """Merging shard moments should equal the moments of the concatenated data."""
+    rng = random.Random(7)
+    values = [rng.uniform(-50, 150) for _ in range(1000)]
+    left, right, whole = Moments(), Moments(), Moments()
+    for value in values[:313]:
+        left.add(value)
+    for value in values[313:]:
+        right.add(value)
+    for value in values:
+        whole.add(value)
+    left.merge(right)
+
+    assert left.count == whole.count
+    assert left.mean == pytest.approx(whole.mean)
+    assert left.variance == pytest.approx(whole.variance)
+    assert (left.min, left.max) == (whole.min, whole.max)
+
+def test_kll_sketch_is_exact_for_small_inputs():
+    """Below the first compaction the sketch holds every value."""
+    sketch = KLLSketch()
+    sketch.update([72, 74, 71, 73, 70, 75])
+
+    assert sketch.quantile(0.5) == 72
+    assert sketch.quantile(1.0) == 75
+    assert KLLSketch().quantile(0.5) is None
+
+def test_kll_sketch_merge_has_bounded_rank_error():
+    """Quantiles of merged shard sketches should be within a few percent in rank, with bounded memory."""
+    rng = random.Random(1)
+    values = [rng.gauss(70, 10) for _ in range(50_000)]
+    shards = [KLLSketch(seed=i) for i in range(4)]
+    for i, value in enumerate(values):
+        shards[i % 4].add(value)
+    merged = shards[0]
+    for shard in shards[1:]:
+        merged.merge(shard)
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        estimate = merged.quantile(q)
+        rank = sum(1 for value in ordered if value <= estimate) / len(ordered)
+        assert abs(rank - q) < 0.02
+    assert merged.count == len(values)
+    assert sum(len(level) for level in merged.compactors) < 4 * merged.k
+
+def test_reading_stats_state_round_trip():
+    """Stats saved with to_state() should restore to the same summary."""
+    stats = ReadingStats()
+    for value in range(1000):
+        stats.add(value)
+
+    assert ReadingStats.from_state(stats.to_state()).summary() == stats.summary()
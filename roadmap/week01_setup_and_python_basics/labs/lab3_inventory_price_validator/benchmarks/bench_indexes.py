@@ -0,0 +1,74 @@
+"""
+Benchmark: ProductIndex queries vs a linear scan of the load_products() dict.
+
+Run from the lab root:
+    python -m benchmarks.bench_indexes                  # 10^5 and 10^6 products
+    python -m benchmarks.bench_indexes --sizes 100000
+"""
+import argparse
+import heapq
+import random
+import time
+
+from src.indexes import ProductIndex
+
+
+def best_of(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**5, 10**6])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'products':>10} {'query':<22} {'scan ms':>10} {'index ms':>10} {'speedup':>9}")
+    for n in args.sizes:
+        words = ["Mon", "Key", "Lap", "Cam", "Head", "Mou", "Spk", "Tab"]
+        products = {f"{words[i % len(words)]}{i:08d}": round(rng.uniform(1, 2000), 2) for i in range(n)}
+
+        start = time.perf_counter()
+        index = ProductIndex.from_products(products)
+        build = time.perf_counter() - start
+
+        queries = {
+            "price 50..200": (
+                lambda: [(k, v) for k, v in products.items() if 50 <= v <= 200],
+                lambda: index.price_range(50, 200),
+            ),
+            "price 1000..1001": (
+                lambda: [(k, v) for k, v in products.items() if 1000 <= v <= 1001],
+                lambda: index.price_range(1000, 1001),
+            ),
+            "top 10": (
+                lambda: heapq.nlargest(10, products.items(), key=lambda item: item[1]),
+                lambda: index.most_expensive(10),
+            ),
+            "prefix 'Mon0000'": (
+                lambda: [k for k in products if k.startswith("Mon0000")],
+                lambda: index.with_prefix("Mon0000"),
+            ),
+        }
+        for label, (scan, indexed) in queries.items():
+            scan_s = best_of(scan)
+            index_s = best_of(indexed)
+            print(f"{n:>10,} {label:<22} {scan_s * 1e3:>10.3f} {index_s * 1e3:>10.3f} {scan_s / index_s:>8.0f}x")
+
+        names = rng.sample(list(products), 1000)
+        start = time.perf_counter()
+        for name in names:
+            new_price = round(rng.uniform(1, 2000), 2)
+            index.reprice(name, products[name], new_price)
+            products[name] = new_price
+        reprice = (time.perf_counter() - start) / 1000
+        print(f"{n:>10,} build {build * 1e3:.0f} ms, incremental reprice {reprice * 1e6:.1f} us each\n")
+
+
+if __name__ == "__main__":
+    main()
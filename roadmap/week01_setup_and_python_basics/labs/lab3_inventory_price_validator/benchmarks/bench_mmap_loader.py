@@ -0,0 +1,77 @@
+"""
+Benchmark: load_products() vs load_products_mmap() throughput.
+
+load_products() is the original inline loop over the lines (the baseline loader), not a
+wrapper around iter_products().
+
+The generated file mixes valid rows with the kinds of rows the validator rejects
+(non-numeric, negative, wrong field count) and rows padded with spaces. The
+[WARN] lines are discarded so terminal output is not part of the timing.
+
+Run from the lab root:
+    python -m benchmarks.bench_mmap_loader                      # 10^6 rows, 1% rejected
+    python -m benchmarks.bench_mmap_loader --rows 5000000 --bad 0.05
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from src.mmap_loader import load_products_mmap
+from src.validator import load_products
+
+
+def write_products(path: str, rows: int, bad: float) -> None:
+    rng = random.Random(0)
+    with open(path, "w") as f:
+        for i in range(rows):
+            r = rng.random()
+            if r < bad / 3:
+                f.write(f"Product {i},not_available\n")
+            elif r < 2 * bad / 3:
+                f.write(f"Product {i},-{rng.randrange(1, 500)}\n")
+            elif r < bad:
+                f.write(f"Product {i},{rng.randrange(1, 500)},extra\n")
+            elif r < bad + 0.05:
+                f.write(f" Product {i} , {rng.randrange(1, 100000) / 100} \n")
+            else:
+                f.write(f"Product {i},{rng.randrange(1, 100000) / 100}\n")
+
+
+def best_of(fn, path: str, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = fn(path)
+            best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10**6)
+    parser.add_argument("--bad", type=float, default=0.01, help="fraction of rejected rows")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "products.txt")
+        write_products(path, args.rows, args.bad)
+        size_mb = os.path.getsize(path) / 1e6
+
+        baseline, baseline_s = best_of(load_products, path, args.repeat)
+        fast, fast_s = best_of(load_products_mmap, path, args.repeat)
+        assert fast == baseline, "load_products_mmap() disagrees with load_products()"
+
+        print(f"{args.rows:,} rows, {size_mb:.1f} MB, {args.bad:.0%} rejected, best of {args.repeat}")
+        print(f"{'loader':<22} {'seconds':>8} {'MB/s':>8} {'speedup':>8}")
+        for label, seconds in (("load_products", baseline_s), ("load_products_mmap", fast_s)):
+            print(f"{label:<22} {seconds:>8.3f} {size_mb / seconds:>8.1f} {baseline_s / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark: parsing and totalling price text as float, Decimal and integer cents.
+
+Parsing and summation are timed separately: a price is parsed once when the
+catalog is loaded, but totals are recomputed on every analysis. The prices are
+generated as whole cents, so the exact total is known. The whole
+load_products() + analyze_products() pipeline is then timed on a catalog file,
+with float prices and with decimals=2.
+
+Run from the lab root:
+    python -m benchmarks.bench_money                  # 10^6 prices
+    python -m benchmarks.bench_money --sizes 10000000
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from contextlib import redirect_stdout
+from decimal import Decimal
+
+from src.money import parse_minor_units, parse_minor_units_array, sum_minor_units, to_decimal
+from src.validator import analyze_products, load_products
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**6])
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'prices':>12} {'engine':<14} {'parse s':>8} {'sum s':>8} {'sum vs Decimal':>15}  {'total':<24} exact")
+    for n in args.sizes:
+        cents = [rng.randrange(1, 500_000) for _ in range(n)]
+        texts = [f"{c // 100}.{c % 100:02d}" for c in cents]
+        exact = to_decimal(sum(cents))
+
+        engines = {
+            "float": (lambda: list(map(float, texts)), sum, str),
+            "Decimal": (lambda: list(map(Decimal, texts)), sum, str),
+            "cents (int)": (lambda: list(map(parse_minor_units, texts)), sum_minor_units, to_decimal),
+            "cents (numpy)": (lambda: parse_minor_units_array(texts), sum_minor_units, to_decimal),
+        }
+        results = {}
+        for label, (parse, total_of, show) in engines.items():
+            values, parse_s = timed(parse)
+            total, sum_s = timed(lambda: total_of(values))
+            results[label] = (parse_s, sum_s, show(total))
+            del values
+
+        decimal_sum_s = results["Decimal"][1]
+        for label, (parse_s, sum_s, total) in results.items():
+            is_exact = Decimal(total) == exact
+            print(
+                f"{n:>12,} {label:<14} {parse_s:>8.3f} {sum_s:>8.4f} {decimal_sum_s / sum_s:>14.1f}x"
+                f"  {total:<24} {is_exact}"
+            )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "products.txt")
+            with open(path, "w") as file:
+                file.writelines(f"product{i},{text}\n" for i, text in enumerate(texts))
+            for decimals in (None, 2):
+                with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                    products, load_s = timed(lambda: load_products(path, decimals=decimals))
+                    summary, analyze_s = timed(lambda: analyze_products(products, decimals=decimals))
+                print(
+                    f"{n:>12,} load_products(decimals={decimals}): load {load_s:.3f} s,"
+                    f" analyze {analyze_s:.4f} s, total {summary['total_inventory_value']}"
+                )
+                del products
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: memory footprint of Dict[str, float] vs ProductTable.
+
+Run from the lab root:
+    python -m benchmarks.bench_product_table                    # 10^6 and 10^7 products
+    python -m benchmarks.bench_product_table --sizes 1000000
+"""
+import argparse
+import gc
+import tracemalloc
+
+from src.product_table import ProductTable
+
+
+def measure(build) -> int:
+    gc.collect()
+    tracemalloc.start()
+    container = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del container
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10**6, 10**7])
+    args = parser.parse_args()
+
+    print(f"{'products':>12} {'dict MB':>10} {'table MB':>10} {'saved':>7}   (excluding the shared name strings)")
+    for n in args.sizes:
+        # the name strings exist either way, so build them outside the measured region;
+        # prices are parsed inside it, as load_products() does
+        names = [f"Product {i:08d}" for i in range(n)]
+        prices = [f"{i % 5000}.99" for i in range(n)]
+
+        def build_dict():
+            return {name: float(price) for name, price in zip(names, prices)}
+
+        def build_table():
+            table = ProductTable()
+            for name, price in zip(names, prices):
+                table.add(name, float(price))
+            return table
+
+        dict_bytes = measure(build_dict)
+        table_bytes = measure(build_table)
+        print(f"{n:>12,} {dict_bytes / 1e6:>10.1f} {table_bytes / 1e6:>10.1f} {1 - table_bytes / dict_bytes:>6.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,21 @@
+import argparse
+
 from src.validator import load_products, analyze_products, save_summary
+from src.snapshot_diff import diff_snapshots, save_diff
+
+parser = argparse.ArgumentParser(description="Inventory Price Validator")
+parser.add_argument("--input", default='data/products.txt', help="products file to validate")
+parser.add_argument("--output", default='inventory_summary.txt', help="report file to append to")
+parser.add_argument("--previous", help="diff mode: previous snapshot to compare --input against")
+parser.add_argument("--partitions", type=int, default=1, help="diff mode: hash partitions spilled to temp files")
+args = parser.parse_args()
 
 print("[INFO]Starting Inventory Price Validator...")
-input_file = 'data/products.txt'
-data = load_products(input_file)
-summary = analyze_products(data)
-save_summary(summary, input_file, 'inventory_summary.txt')
+input_file = args.input
+if args.previous:
+    diff = diff_snapshots(args.previous, input_file, partitions=args.partitions)
+    save_diff(diff, args.previous, input_file, args.output)
+else:
+    data = load_products(input_file)
+    summary = analyze_products(data)
+    save_summary(summary, input_file, args.output)
@@ -0,0 +1,113 @@
+# Each lab runs on its own from its own directory (python main.py, pytest, with src/ as the
+# package), so lab2, lab3 and lab4 each keep a copy of this module rather than importing from
+# a sibling lab. The three copies are identical: change them together.
+import csv
+from collections import Counter
+from datetime import datetime
+from typing import Optional
+
+# an error file is closed and the next one started once it reaches this size
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# write buffer of the open error file; records reach the disk each time it fills
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+# distinct error codes counted separately; any further codes are counted as "other"
+DEFAULT_MAX_CODES = 64
+
+FIELDS = ["code", "key", "value", "message"]
+
+
+class ErrorSink:
+    """
+    Writes rejected records as structured CSV rows (code, key, value, message) instead of
+    collecting error strings in memory.
+
+    - Rows go through a large write buffer straight to {path_prefix}_{timestamp}.{n}.csv,
+      so a crash loses at most the last buffer, not every error of the run
+    - A file that reaches max_bytes is closed and the next part started (.1.csv, .2.csv, ...)
+    - Memory stays bounded: only a count per error code is kept for summary(), with codes
+      past max_codes counted together as "other"
+    - No file is created until the first error
+    - Files are created exclusively: a second sink with the same prefix started in the same
+      second gets a "-2" after the timestamp instead of overwriting the first one's files
+    - on_reject(line_no, line, reason) matches the loader hooks of lab2 and lab3, so the same
+      sink can record their skipped lines
+
+    Args:
+        path_prefix (str): path and file name prefix of the error files.
+        max_bytes (int): size at which an error file is rotated.
+        buffer_size (int): write buffer of the open file.
+        max_codes (int): error codes counted separately in summary().
+    """
+
+    def __init__(
+        self,
+        path_prefix: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        max_codes: int = DEFAULT_MAX_CODES,
+    ):
+        self.path_prefix = path_prefix
+        self.max_bytes = max_bytes
+        self.buffer_size = buffer_size
+        self.max_codes = max_codes
+        self.counts: Counter = Counter()
+        self.paths: list[str] = []
+        self._timestamp: Optional[str] = None
+        self._run = 1
+        self._file = None
+        self._writer = None
+        self._written = 0
+
+    def _rotate(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        if self._timestamp is None:
+            self._timestamp = datetime.now().strftime("%m-%d-%Y_%H:%M:%S")
+        while True:
+            stamp = self._timestamp if self._run == 1 else f"{self._timestamp}-{self._run}"
+            path = f"{self.path_prefix}_{stamp}.{len(self.paths) + 1}.csv"
+            try:
+                self._file = open(path, "x", newline="", buffering=self.buffer_size)
+                break
+            except FileExistsError:
+                # another sink with this prefix started in the same second
+                self._run += 1
+        self._writer = csv.writer(self._file)
+        self._written = self._writer.writerow(FIELDS)
+        self.paths.append(path)
+
+    def record(self, code: str, key, value, message: str = "") -> None:
+        """Writes one rejected record and counts it under its code."""
+        if code not in self.counts and len(self.counts) >= self.max_codes:
+            code_counted = "other"
+        else:
+            code_counted = code
+        self.counts[code_counted] += 1
+        if self._file is None or self._written >= self.max_bytes:
+            self._rotate()
+        # writerow() returns the number of characters written
+        self._written += self._writer.writerow([code, "" if key is None else key, "" if value is None else value, message])
+
+    def on_reject(self, line_no: int, line: str, reason: str) -> None:
+        """Loader hook: records a skipped line, with the reason up to any ':' as its code."""
+        self.record(reason.partition(":")[0], line_no, line, reason)
+
+    def summary(self) -> dict:
+        """Returns the total error count, the count per code and the files written."""
+        return {"total": sum(self.counts.values()), "by_code": dict(self.counts), "files": list(self.paths)}
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def __enter__(self) -> "ErrorSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,190 @@
+from bisect import bisect_left, bisect_right, insort
+from itertools import chain, islice
+from typing import Callable, Generic, Iterable, Iterator, List, Mapping, Tuple, TypeVar
+
+# sorts after every character a product name can contain, used as an open upper bound
+_MAX_CHAR = "\U0010ffff"
+# items per block of a _BlockedList; a block is split in two once it reaches twice this
+DEFAULT_BLOCK_LOAD = 1000
+
+T = TypeVar("T")
+
+
+class _BlockedList(Generic[T]):
+    """
+    A sorted list stored as a list of short sorted blocks plus the largest item of each
+    block. An insert or delete bisects the block maxima, then the block, and only moves
+    the tail of that one block, so it stays O(log n + load) instead of O(n) for a flat list.
+    """
+
+    def __init__(self, items: Iterable[T] = (), load: int = DEFAULT_BLOCK_LOAD):
+        self._load = load
+        items = sorted(items)
+        self._blocks: List[List[T]] = [items[i:i + load] for i in range(0, len(items), load)]
+        self._maxes: List[T] = [block[-1] for block in self._blocks]
+        self._len = len(items)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._blocks)
+
+    def add(self, item: T) -> None:
+        blocks, maxes = self._blocks, self._maxes
+        self._len += 1
+        if not blocks:
+            blocks.append([item])
+            maxes.append(item)
+            return
+        i = bisect_left(maxes, item)
+        if i == len(maxes):
+            # larger than everything: goes at the end of the last block
+            i -= 1
+            blocks[i].append(item)
+            maxes[i] = item
+        else:
+            insort(blocks[i], item)
+        block = blocks[i]
+        if len(block) >= 2 * self._load:
+            blocks.insert(i + 1, block[self._load:])
+            del block[self._load:]
+            maxes.insert(i, block[-1])
+
+    def remove(self, item: T) -> None:
+        """Raises KeyError if item is not in the list."""
+        blocks, maxes = self._blocks, self._maxes
+        i = bisect_left(maxes, item)
+        if i == len(maxes):
+            raise KeyError(item)
+        block = blocks[i]
+        pos = bisect_left(block, item)
+        if block[pos] != item:
+            raise KeyError(item)
+        del block[pos]
+        self._len -= 1
+        if not block:
+            del blocks[i]
+            del maxes[i]
+        elif pos == len(block):
+            maxes[i] = block[-1]
+
+    def _locate(self, item: T, bisect: Callable) -> Tuple[int, int]:
+        # (block, position in block) of bisect_left/bisect_right over the whole list
+        i = bisect(self._maxes, item)
+        if i == len(self._maxes):
+            return i, 0
+        return i, bisect(self._blocks[i], item)
+
+    def between(self, low: T, high: T, include_high: bool = False) -> List[T]:
+        """Items with low <= item < high (item <= high if include_high), in order."""
+        i, start = self._locate(low, bisect_left)
+        j, end = self._locate(high, bisect_right if include_high else bisect_left)
+        blocks = self._blocks
+        if i == j:
+            return blocks[i][start:end] if i < len(blocks) else []
+        result = blocks[i][start:]
+        for block in islice(blocks, i + 1, j):
+            result.extend(block)
+        if j < len(blocks):
+            result.extend(blocks[j][:end])
+        return result
+
+    def head(self, n: int) -> List[T]:
+        """The n smallest items, smallest first."""
+        result: List[T] = []
+        for block in self._blocks:
+            if len(result) >= n:
+                break
+            result.extend(block[:n - len(result)])
+        return result
+
+    def tail(self, n: int) -> List[T]:
+        """The n largest items, largest first."""
+        result: List[T] = []
+        for block in reversed(self._blocks):
+            if len(result) >= n:
+                break
+            result.extend(reversed(block[-(n - len(result)):]))
+        return result
+
+
+class ProductIndex:
+    """
+    Sorted secondary indexes over a product catalog, for the questions that would
+    otherwise scan every product:
+
+    - price_range(low, high): products priced in [low, high], using bisect on a
+      list of (price, name) pairs kept in price order
+    - most_expensive(n) / cheapest(n): a slice off either end of the same list
+    - with_prefix(prefix): names starting with prefix, using bisect on a sorted name list
+
+    Queries cost O(log n + matches). Both lists are _BlockedList: blocks of about
+    DEFAULT_BLOCK_LOAD items, so add/remove/reprice only shift the tail of one block
+    (a few microseconds per reprice at 10^6 products) instead of the whole list.
+    """
+
+    def __init__(self):
+        self._by_price: _BlockedList[Tuple[float, str]] = _BlockedList()
+        self._names: _BlockedList[str] = _BlockedList()
+
+    @classmethod
+    def from_products(cls, products: Mapping[str, float]) -> "ProductIndex":
+        """Builds the index in one sort from a dict or ProductTable."""
+        index = cls()
+        index._by_price = _BlockedList((price, name) for name, price in products.items())
+        index._names = _BlockedList(products.keys())
+        return index
+
+    def add(self, name: str, price: float) -> None:
+        """Indexes a new product. The name must not be indexed already."""
+        self._by_price.add((price, name))
+        self._names.add(name)
+
+    def remove(self, name: str, price: float) -> None:
+        """
+        Drops a product indexed at the given (current) price.
+        Raises:
+            KeyError: if the product is not indexed at that price
+        """
+        try:
+            self._by_price.remove((price, name))
+        except KeyError:
+            raise KeyError(name) from None
+        self._names.remove(name)
+
+    def reprice(self, name: str, old_price: float, new_price: float) -> None:
+        """Moves a product from old_price to new_price; the name index is unchanged."""
+        try:
+            self._by_price.remove((old_price, name))
+        except KeyError:
+            raise KeyError(name) from None
+        self._by_price.add((new_price, name))
+
+    def __len__(self) -> int:
+        return len(self._by_price)
+
+    def price_range(self, low: float, high: float) -> List[Tuple[str, float]]:
+        """Returns (name, price) for every product with low <= price <= high, cheapest first."""
+        pairs = self._by_price.between((low, ""), (high, _MAX_CHAR), include_high=True)
+        return [(name, price) for price, name in pairs]
+
+    def most_expensive(self, n: int) -> List[Tuple[str, float]]:
+        """Returns the n most expensive (name, price) pairs, most expensive first."""
+        if n <= 0:
+            return []
+        return [(name, price) for price, name in self._by_price.tail(n)]
+
+    def cheapest(self, n: int) -> List[Tuple[str, float]]:
+        """Returns the n cheapest (name, price) pairs, cheapest first."""
+        if n <= 0:
+            return []
+        return [(name, price) for price, name in self._by_price.head(n)]
+
+    def with_prefix(self, prefix: str) -> List[str]:
+        """Returns the names starting with prefix (case-sensitive), in sorted order."""
+        return self._names.between(prefix, prefix + _MAX_CHAR)
+
+    def names(self) -> Iterable[str]:
+        """All indexed names in sorted order."""
+        return iter(self._names)
@@ -0,0 +1,153 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.indexes import ProductIndex
+from src.product_table import ProductTable
+from src.validator import iter_products
+
+# what insert() does with a name that is already in the inventory
+DUPLICATE_POLICIES = ("last_wins", "reject")
+
+
+class Inventory:
+    """
+    Product catalog that keeps total value, count and average price up to date in
+    O(1) per insert, reprice and delete, instead of re-summing every product the
+    way analyze_products() does. Products live in a ProductTable.
+
+    The running total uses Neumaier compensated summation, so thousands of price
+    changes per second do not let float rounding error build up in the total.
+
+    Args:
+        on_duplicate (str): "last_wins" to overwrite an existing product's price
+            (load_products() behaviour), or "reject" to refuse repeated names.
+        indexed (bool): Also maintain a ProductIndex (self.index) for price-range,
+            top-N and name-prefix queries, updated on every change.
+    """
+
+    def __init__(self, on_duplicate: str = "last_wins", indexed: bool = False):
+        if on_duplicate not in DUPLICATE_POLICIES:
+            raise ValueError(f"Unknown duplicate policy: {on_duplicate}. Expected one of {DUPLICATE_POLICIES}")
+        self.on_duplicate = on_duplicate
+        self.products = ProductTable()
+        self.index: Optional[ProductIndex] = ProductIndex() if indexed else None
+        self._total = 0.0
+        self._compensation = 0.0
+
+    @classmethod
+    def from_file(cls, filepath: str, on_duplicate: str = "last_wins", indexed: bool = False) -> "Inventory":
+        """
+        - Loads a products file with the same validation as load_products().
+        - With on_duplicate="reject", repeated names are skipped with a warning (the first one is kept).
+        Raises:
+            FileNotFoundError: if the file does not exist
+        """
+        inventory = cls(on_duplicate=on_duplicate, indexed=indexed)
+        for name, price in iter_products(filepath):
+            try:
+                inventory.insert(name, price)
+            except ValueError:
+                print(f"[WARN]Skipping duplicate entry: {name},{price}")
+        return inventory
+
+    def _add_to_total(self, amount: float) -> None:
+        total = self._total + amount
+        if abs(self._total) >= abs(amount):
+            self._compensation += (self._total - total) + amount
+        else:
+            self._compensation += (amount - total) + self._total
+        self._total = total
+
+    def insert(self, name: str, price: float) -> None:
+        """
+        Adds a product. An existing name is repriced ("last_wins") or refused ("reject").
+        Raises:
+            ValueError: if the price is negative, or the name exists under the "reject" policy
+        """
+        if price < 0:
+            raise ValueError(f"Negative price for {name}: {price}")
+        old_price = self.products.get(name)
+        if old_price is not None:
+            if self.on_duplicate == "reject":
+                raise ValueError(f"Duplicate product: {name}")
+            self._add_to_total(-old_price)
+            if self.index is not None:
+                self.index.reprice(name, old_price, price)
+        elif self.index is not None:
+            self.index.add(name, price)
+        self.products.add(name, price)
+        self._add_to_total(price)
+
+    def update(self, name: str, price: float) -> None:
+        """
+        Reprices an existing product.
+        Raises:
+            KeyError: if the product does not exist
+            ValueError: if the price is negative
+        """
+        if price < 0:
+            raise ValueError(f"Negative price for {name}: {price}")
+        old_price = self.products[name]
+        if self.index is not None:
+            self.index.reprice(name, old_price, price)
+        self.products.add(name, price)
+        self._add_to_total(price - old_price)
+
+    def upsert(self, name: str, price: float) -> None:
+        """Inserts or reprices a product regardless of the duplicate policy."""
+        if name in self.products:
+            self.update(name, price)
+        else:
+            self.insert(name, price)
+
+    def delete(self, name: str) -> float:
+        """
+        Removes a product and returns its price.
+        Raises:
+            KeyError: if the product does not exist
+        """
+        price = self.products.remove(name)
+        if self.index is not None:
+            self.index.remove(name, price)
+        self._add_to_total(-price)
+        return price
+
+    def apply_changes(self, changes: Iterable[Tuple[str, Optional[float]]]) -> None:
+        """Applies a batch of (name, price) changes: upsert for a price, delete for None."""
+        for name, price in changes:
+            if price is None:
+                self.delete(name)
+            else:
+                self.upsert(name, price)
+
+    @property
+    def count(self) -> int:
+        return len(self.products)
+
+    @property
+    def total_value(self) -> float:
+        return self._total + self._compensation
+
+    @property
+    def average_price(self) -> float:
+        return round(self.total_value / self.count, 2) if self.count else 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.products
+
+    def summary(self) -> Dict:
+        """
+        - Returns the same summary dictionary as analyze_products(), from the running totals.
+        Raises:
+            ValueError: if the inventory is empty
+        """
+        if not self.count:
+            raise ValueError("No valid products to analyze.")
+        return {
+            "total_valid_products": self.count,
+            "total_inventory_value": self.total_value,
+            "average_price": self.average_price,
+            "product_names": list(self.products.keys()),
+        }
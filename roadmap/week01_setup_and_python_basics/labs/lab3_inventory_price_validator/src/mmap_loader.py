@@ -0,0 +1,131 @@
+import mmap
+import os
+import re
+from bisect import bisect_right
+from itertools import compress, repeat
+from operator import gt, not_
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.validator import _parse_product_line, _reject
+
+# bytes parsed per block: big enough to amortize the bulk calls, small enough that the
+# per-block lists stay in cache
+DEFAULT_BLOCK_SIZE = 64 * 1024
+# every byte except ',' and '\n', deleted by bytes.translate() to leave only the separators
+_NOT_SEPARATORS = bytes(b for b in range(256) if b not in b",\n")
+# in those separators, a line with no comma or with several
+_WRONG_FIELD_COUNT = re.compile(rb"^(?!,\n),*\n", re.M)
+
+
+def _floats(texts: List[str], rejected: List[int]) -> List[float]:
+    # map(float, ...) runs entirely in C; when one value fails, note its position,
+    # put a placeholder in its place and resume with the same iterator
+    values: List[float] = []
+    remaining = iter(texts)
+    while True:
+        try:
+            values.extend(map(float, remaining))
+            return values
+        except ValueError:
+            rejected.append(len(values))
+            values.append(0.0)
+
+
+def _parse_block(data: bytes) -> Tuple[List[str], List[float], List[Tuple[int, str]], int]:
+    """
+    Validates a block of whole lines in bulk. Returns the kept names and prices in file
+    order, the (line index, line) pairs that were rejected, and the number of lines.
+    """
+    if b"\r" in data:
+        # text-mode reads treat "\r\n" and a lone "\r" as line ends too
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    if not data.endswith(b"\n"):
+        data += b"\n"
+    text = data.decode()
+    line_count = data.count(b"\n")
+
+    # with everything but ',' and '\n' deleted, a line with two fields leaves ",\n"
+    seps = data.translate(None, _NOT_SEPARATORS)
+    rejected: List[Tuple[int, str]] = []
+    wrong_count: List[int] = []
+    if seps != b",\n" * line_count:
+        line = 0
+        previous = 0
+        for match in _WRONG_FIELD_COUNT.finditer(seps):
+            line += seps.count(b"\n", previous, match.start())
+            previous = match.start()
+            wrong_count.append(line)
+        lines = text.split("\n")
+        lines.pop()
+        keep = [True] * line_count
+        for line in wrong_count:
+            keep[line] = False
+            rejected.append((line, lines[line]))
+        if len(wrong_count) == line_count:
+            return [], [], rejected, line_count
+        fields = ",".join(compress(lines, keep)).split(",")
+    else:
+        # every line has exactly one comma: split the whole block into fields at once
+        fields = text.replace("\n", ",").split(",")
+        fields.pop()  # the empty string after the final separator
+    raw_names = fields[0::2]
+    raw_prices = fields[1::2]
+    names = list(map(str.strip, raw_names))
+    # float() ignores surrounding whitespace exactly like float(price.strip())
+    bad: List[int] = []
+    prices = _floats(raw_prices, bad)
+    if not all(names):
+        bad.extend(compress(range(len(names)), map(not_, names)))
+    bad.extend(compress(range(len(prices)), map(gt, repeat(0.0), prices)))
+    if bad:
+        keep = [True] * len(names)
+        # position among the two-field lines -> line index in the block
+        shifted = [line - n for n, line in enumerate(wrong_count)]
+        for i in sorted(set(bad)):
+            keep[i] = False
+            rejected.append((i + bisect_right(shifted, i), f"{raw_names[i]},{raw_prices[i]}"))
+        names = list(compress(names, keep))
+        prices = list(compress(prices, keep))
+    return names, prices, rejected, line_count
+
+
+def load_products_mmap(
+    filepath: str,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    on_reject: Optional[Callable[[int, str, str], None]] = None,
+) -> Dict[str, float]:
+    """
+    - Bulk-parsing alternative to load_products(): memory-maps the file and validates it in
+      blocks of whole lines with bulk C-level operations (translate/split/map) instead of a
+      Python loop per line. Only the fields of rejected lines are looked at one by one.
+    - Not a fast path: inserting every product into the dict costs about as much as the
+      whole per-line loop saves, so it is only ahead on files with almost no rejected rows
+      (see benchmarks/bench_mmap_loader.py). load_products() stays the default loader.
+    - Same result, rejection rules and [WARN] lines as load_products() (the file is read
+      as UTF-8); on_reject works like iter_products()'s.
+    Raises:
+        FileNotFoundError: if the file does not exist
+    """
+    products: Dict[str, float] = {}
+    with open(filepath, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:  # an empty file cannot be memory-mapped
+            return products
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            first_line = 1
+            while start < size:
+                end = min(start + block_size, size)
+                if end < size:
+                    # end the block after its last whole line
+                    newline = mm.rfind(b"\n", start, end)
+                    if newline == -1:  # a single line longer than a block
+                        newline = mm.find(b"\n", end)
+                    end = size if newline == -1 else newline + 1
+                names, prices, rejected, line_count = _parse_block(mm[start:end])
+                for index, line in sorted(rejected):
+                    _reject(first_line + index, line, _parse_product_line(line), on_reject)
+                products.update(zip(names, prices))
+                first_line += line_count
+                start = end
+    return products
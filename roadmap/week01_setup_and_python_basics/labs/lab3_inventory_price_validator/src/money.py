@@ -0,0 +1,147 @@
+from array import array
+from decimal import Decimal
+from typing import Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy only speeds up parsing and summing whole price columns
+    np = None
+
+# decimal places of the minor unit: 2 means prices are stored as integer cents
+DEFAULT_DECIMALS = 2
+
+
+def _ascii_digits(text: str) -> bool:
+    # isdigit() alone also accepts other scripts' digits ("١٢"), and int() accepts "_"
+    return text.isascii() and text.isdigit()
+
+
+def _unsigned_minor_units(whole: str, frac: str, decimals: int) -> int:
+    if len(frac) <= decimals:
+        return int(whole + frac.ljust(decimals, "0"))
+    rest = frac[decimals:]
+    value = int(whole + frac[:decimals] or "0")
+    tail = int(rest)
+    half = 5 * 10 ** (len(rest) - 1)
+    if tail > half or (tail == half and value % 2):
+        value += 1
+    return value
+
+
+def parse_minor_units(text: str, decimals: int = DEFAULT_DECIMALS) -> int:
+    """
+    - Parses a decimal price string straight to an int of minor units ("12.34" -> 1234
+      for decimals=2), without going through float, so no binary rounding error.
+    - Digits beyond `decimals` places are rounded half to even, like round().
+    - Accepts what float() accepts for plain decimals (sign, ".5", "5.", surrounding
+      whitespace), with ASCII digits only: not exponents, inf, nan or "_" separators.
+    Raises:
+        ValueError: if text is not a plain decimal number
+    """
+    whole, _, frac = text.partition(".")
+    digits = whole + frac
+    if digits.isascii() and digits.isdigit():
+        if len(frac) == decimals:
+            # the common case: "19.99" -> int("1999")
+            return int(digits)
+        return _unsigned_minor_units(whole, frac, decimals)
+    # a sign or surrounding whitespace; both parts must still be digits only
+    stripped = text.strip()
+    sign = stripped[:1]
+    whole, _, frac = (stripped[1:] if sign in ("+", "-") else stripped).partition(".")
+    if not _ascii_digits(whole + frac):
+        raise ValueError(f"could not convert string to minor units: {text!r}")
+    value = _unsigned_minor_units(whole, frac, decimals)
+    return -value if sign == "-" else value
+
+
+def _parse_column_numpy(texts: Sequence[str], decimals: int):
+    # the common case for a whole column: unsigned, exactly `decimals` places, at most 18
+    # digits. Validate that shape on the joined bytes, drop the dots and let numpy parse
+    # the digits in C. Returns (int64 values, bool mask of the values in that shape); the
+    # caller parses the rest, whose slots hold 0.
+    data = "\n".join(texts).encode()
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == ord("\n"))
+    ends = np.append(newlines, len(buf))
+    dots = np.flatnonzero(buf == ord("."))
+    ok = np.ones(len(texts), dtype=bool)
+    if not (
+        len(dots) == len(texts)
+        and np.array_equal(dots, ends - decimals - 1)
+        and np.count_nonzero((buf - ord("0")) < 10) == len(buf) - len(dots) - len(newlines)
+        and np.diff(ends, prepend=-1).max() <= 20  # 18 digits + dot + separator
+    ):
+        # mark the values of another shape and parse the column with a filler in their place
+        lengths = np.diff(ends, prepend=-1) - 1
+        ok = (lengths >= decimals + 2) & (lengths <= 19)
+        ok[ok] = buf[(ends - decimals - 1)[ok]] == ord(".")
+        other = np.flatnonzero(((buf - ord("0")) >= 10) & (buf != ord("\n")))
+        ok &= np.bincount(np.searchsorted(newlines, other), minlength=len(texts)) == 1
+        filled = list(texts)
+        for i in np.flatnonzero(~ok).tolist():
+            filled[i] = "0." + "0" * decimals
+        data = "\n".join(filled).encode()
+    return np.fromstring(data.replace(b".", b""), dtype=np.int64, sep="\n"), ok
+
+
+def _minor_units_or_reject(text: str, decimals: int, index: int, rejected: Optional[List[int]]) -> int:
+    if rejected is None:
+        return parse_minor_units(text, decimals)
+    try:
+        return parse_minor_units(text, decimals)
+    except ValueError:
+        rejected.append(index)
+        return 0
+
+
+def parse_minor_units_array(
+    texts: Sequence[str],
+    decimals: int = DEFAULT_DECIMALS,
+    rejected: Optional[List[int]] = None,
+) -> array:
+    """
+    - Parses a whole column of price strings into an array('q') of minor units.
+    - With numpy installed, the values that look like "123.45" are parsed in one vectorized
+      pass; the others (and every value without numpy) go through parse_minor_units().
+    - rejected, if given, collects the indexes of texts that are not numbers (their slots
+      hold 0) instead of raising.
+    Raises:
+        ValueError: if any text is not a plain decimal number and rejected is None
+    """
+    column = array("q")
+    if np is not None and decimals > 0 and texts:
+        values, ok = _parse_column_numpy(texts, decimals)
+        for i in np.flatnonzero(~ok).tolist():
+            values[i] = _minor_units_or_reject(texts[i], decimals, i, rejected)
+        column.frombytes(values.tobytes())
+        return column
+    column.extend(_minor_units_or_reject(text, decimals, i, rejected) for i, text in enumerate(texts))
+    return column
+
+
+def to_decimal(amount: int, decimals: int = DEFAULT_DECIMALS) -> Decimal:
+    """Converts minor units to an exact Decimal (1234 -> Decimal("12.34")) for reporting."""
+    return Decimal(amount).scaleb(-decimals)
+
+
+def sum_minor_units(values: Iterable[int]) -> int:
+    """
+    - Returns the exact sum of minor-unit amounts.
+    - An array('q') or int64 numpy array is summed in one vectorized numpy call when numpy
+      is installed; anything else uses the builtin sum(), which is exact for ints too.
+    """
+    if np is not None:
+        if isinstance(values, array) and values.typecode == "q":
+            return int(np.frombuffer(values, dtype=np.int64).sum())
+        if isinstance(values, np.ndarray):
+            return int(values.sum(dtype=np.int64))
+    return sum(values)
+
+
+def mean_minor_units(total: int, count: int) -> int:
+    """Returns total / count in whole minor units, rounded half to even, using only integer math."""
+    quotient, remainder = divmod(total, count)
+    if 2 * remainder > count or (2 * remainder == count and quotient % 2):
+        quotient += 1
+    return quotient
@@ -0,0 +1,125 @@
+import sqlite3
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.validator import iter_products
+
+# rows sent to SQLite per executemany() call while bulk loading
+DEFAULT_BATCH_SIZE = 10_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    name  TEXT NOT NULL,
+    price REAL NOT NULL CHECK (price >= 0)
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_products_name ON products (name);
+CREATE TABLE IF NOT EXISTS rejected_rows (
+    source  TEXT NOT NULL,
+    line_no INTEGER NOT NULL,
+    line    TEXT NOT NULL,
+    reason  TEXT NOT NULL
+);
+"""
+
+# a repeated name keeps its first position (rowid) but takes the later price,
+# the same "last wins" result as load_products() building a dict
+_UPSERT = "INSERT INTO products (name, price) VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET price = excluded.price"
+
+
+class ProductStore:
+    """
+    Out-of-core product catalog in a local SQLite database, for catalogs that do not
+    fit in the dict returned by load_products().
+
+    - load_file() streams validated rows from iter_products() into the products table
+      with batched executemany() calls inside one transaction
+    - rejected lines go to the rejected_rows table with their reason
+    - summary() computes the analyze_products() metrics with SQL aggregates, so the
+      catalog is never held in Python memory
+
+    Args:
+        db_path (str): SQLite database file (created if missing); ":memory:" works for tests.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "ProductStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def load_file(self, filepath: str, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """
+        - Bulk-loads a products file with the same validation as load_products().
+        - Everything is committed in one transaction, or nothing if loading fails.
+        - Returns the number of valid rows read (repeated names count each time).
+        Raises:
+            FileNotFoundError: if the file does not exist
+        """
+        rejected: List[Tuple[str, int, str, str]] = []
+        batch: List[Tuple[str, float]] = []
+        loaded = 0
+
+        def on_reject(line_no: int, line: str, reason: str) -> None:
+            rejected.append((filepath, line_no, line, reason))
+
+        # the connection context manager commits on success and rolls back on error
+        with self.conn:
+            for row in iter_products(filepath, on_reject=on_reject):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    self.conn.executemany(_UPSERT, batch)
+                    loaded += len(batch)
+                    batch.clear()
+                if len(rejected) >= batch_size:
+                    self.conn.executemany("INSERT INTO rejected_rows VALUES (?, ?, ?, ?)", rejected)
+                    rejected.clear()
+            self.conn.executemany(_UPSERT, batch)
+            self.conn.executemany("INSERT INTO rejected_rows VALUES (?, ?, ?, ?)", rejected)
+            loaded += len(batch)
+        print(f"[INFO]Loaded {loaded} rows from {filepath} into {self.db_path}")
+        return loaded
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def get(self, name: str) -> Optional[float]:
+        row = self.conn.execute("SELECT price FROM products WHERE name = ?", (name,)).fetchone()
+        return None if row is None else row[0]
+
+    def iter_names(self) -> Iterator[str]:
+        """Streams product names in load order without materializing them."""
+        for (name,) in self.conn.execute("SELECT name FROM products ORDER BY rowid"):
+            yield name
+
+    def summary(self, include_names: bool = True) -> Dict:
+        """
+        - Returns the same summary dictionary as analyze_products(), computed in SQL.
+        - include_names=False leaves product_names empty for catalogs too big to list.
+        Raises:
+            ValueError: if the store holds no products
+        """
+        count, total = self.conn.execute("SELECT COUNT(*), SUM(price) FROM products").fetchone()
+        if not count:
+            raise ValueError("No valid products to analyze.")
+        summary = {
+            "total_valid_products": count,
+            "total_inventory_value": total,
+            "average_price": round(total / count, 2),
+            "product_names": list(self.iter_names()) if include_names else [],
+        }
+        print(f"[INFO]Analysis Complete")
+        return summary
+
+    def rejected_rows(self, limit: Optional[int] = None) -> List[Tuple[str, int, str, str]]:
+        """Returns (source, line_no, line, reason) rows for rejected lines, in load order."""
+        query = "SELECT source, line_no, line, reason FROM rejected_rows ORDER BY rowid"
+        if limit is not None:
+            return self.conn.execute(f"{query} LIMIT ?", (limit,)).fetchall()
+        return self.conn.execute(query).fetchall()
@@ -0,0 +1,162 @@
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# empty slot marker in the open-addressing index
+_EMPTY = -1
+
+
+class ProductTable:
+    """
+    Compact, array-backed alternative to the Dict[str, float] returned by load_products().
+
+    - names: one list holding each product name once, in insertion order
+    - prices: one array('d') of prices, 8 bytes each instead of a float object per product
+    - name -> row lookups use an open-addressing hash index of 4-byte row numbers in an
+      array('i'), so there is no per-product dict entry or int object either
+
+    It supports the read-only dict operations the validator uses (len, in, [],
+    get, keys, values, items), so analyze_products() and save_summary() accept
+    it in place of a dict. Adding an existing name overwrites its price, like a dict.
+    remove() moves the last row into the freed one, so removals change the order.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self.names: List[str] = []
+        self.prices = array("d")
+        size = 8
+        while size * 2 < capacity * 3:
+            size *= 2
+        self._slots = array("i", [_EMPTY]) * size
+
+    @classmethod
+    def from_items(cls, items: Iterable[Tuple[str, float]]) -> "ProductTable":
+        table = cls()
+        for name, price in items:
+            table.add(name, price)
+        return table
+
+    def _find(self, name: str) -> int:
+        """Returns the slot holding name, or the empty slot where it would go."""
+        mask = len(self._slots) - 1
+        slot = hash(name) & mask
+        while True:
+            row = self._slots[slot]
+            if row == _EMPTY or self.names[row] == name:
+                return slot
+            slot = (slot + 1) & mask
+
+    def _grow(self) -> None:
+        self._slots = array("i", [_EMPTY]) * (len(self._slots) * 2)
+        mask = len(self._slots) - 1
+        for row, name in enumerate(self.names):
+            slot = hash(name) & mask
+            while self._slots[slot] != _EMPTY:
+                slot = (slot + 1) & mask
+            self._slots[slot] = row
+
+    def add(self, name: str, price: float) -> None:
+        """Adds a product, or overwrites the price if the name already exists."""
+        slot = self._find(name)
+        row = self._slots[slot]
+        if row != _EMPTY:
+            self.prices[row] = price
+            return
+        self._slots[slot] = len(self.names)
+        # the index already dedupes names; sys.intern() would add a global dict entry per name
+        self.names.append(name)
+        self.prices.append(price)
+        # keep the index at most 2/3 full so linear probe chains stay short
+        if len(self.names) * 3 > len(self._slots) * 2:
+            self._grow()
+
+    def remove(self, name: str) -> float:
+        """
+        Removes a product and returns its price. The last row is moved into the
+        freed row, so both arrays stay dense.
+        Raises:
+            KeyError: if the product does not exist
+        """
+        slot = self._find(name)
+        row = self._slots[slot]
+        if row == _EMPTY:
+            raise KeyError(name)
+        price = self.prices[row]
+        self._delete_slot(slot)
+
+        last = len(self.names) - 1
+        if row != last:
+            self._slots[self._find(self.names[last])] = row
+            self.names[row] = self.names[last]
+            self.prices[row] = self.prices[last]
+        self.names.pop()
+        self.prices.pop()
+        return price
+
+    def _delete_slot(self, slot: int) -> None:
+        # backward-shift deletion: pull later entries of the probe chain into the hole,
+        # so lookups never stop early at a gap (no tombstones needed)
+        mask = len(self._slots) - 1
+        hole = slot
+        probe = slot
+        while True:
+            probe = (probe + 1) & mask
+            row = self._slots[probe]
+            if row == _EMPTY:
+                break
+            home = hash(self.names[row]) & mask
+            # the entry may move back unless its home lies cyclically in (hole, probe]
+            if hole < probe:
+                reachable = hole < home <= probe
+            else:
+                reachable = home > hole or home <= probe
+            if not reachable:
+                self._slots[hole] = row
+                hole = probe
+        self._slots[hole] = _EMPTY
+
+    def row_of(self, name: str) -> Optional[int]:
+        row = self._slots[self._find(name)]
+        return None if row == _EMPTY else row
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return self.row_of(name) is not None
+
+    def __getitem__(self, name: str) -> float:
+        row = self.row_of(name)
+        if row is None:
+            raise KeyError(name)
+        return self.prices[row]
+
+    def get(self, name: str, default: Optional[float] = None) -> Optional[float]:
+        row = self.row_of(name)
+        return default if row is None else self.prices[row]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.names)
+
+    def keys(self) -> List[str]:
+        return self.names
+
+    def values(self) -> array:
+        return self.prices
+
+    def items(self) -> Iterator[Tuple[str, float]]:
+        return zip(self.names, self.prices)
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self.items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ProductTable):
+            return self.names == other.names and self.prices == other.prices
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def nbytes(self) -> int:
+        """Bytes held by the table's containers (names list, price array, index), excluding the name strings."""
+        return sys.getsizeof(self.names) + sys.getsizeof(self.prices) + sys.getsizeof(self._slots)
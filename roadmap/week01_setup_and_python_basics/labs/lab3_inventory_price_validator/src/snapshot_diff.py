@@ -0,0 +1,146 @@
+import math
+import os
+import tempfile
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.validator import iter_products
+
+
+def _partition_of(name: str, partitions: int) -> int:
+    # crc32 rather than hash(): str hashes are salted per process, and the partition
+    # of a name must be the same for both snapshots
+    return zlib.crc32(name.encode()) % partitions
+
+
+def _join(old: Dict[str, float], new_rows: Iterable[Tuple[str, float]], diff: Dict) -> None:
+    """Probes new_rows against the old name -> price table; whatever stays unmatched was removed."""
+    new: Dict[str, float] = {}
+    for name, price in new_rows:
+        new[name] = price  # a repeated name in one snapshot: last wins, as in load_products()
+    for name, price in new.items():
+        old_price = old.pop(name, None)
+        if old_price is None:
+            diff["added"].append((name, price))
+        elif old_price != price:
+            diff["repriced"].append((name, old_price, price))
+        else:
+            diff["unchanged"] += 1
+    diff["removed"].extend(old.items())
+
+
+def _write_partitions(filepath: str, partitions: int, tmp_dir: str, label: str) -> List[str]:
+    paths = [os.path.join(tmp_dir, f"{label}-{i}.txt") for i in range(partitions)]
+    files = [open(path, "w") for path in paths]
+    try:
+        for name, price in iter_products(filepath):
+            # repr() round-trips the float exactly
+            files[_partition_of(name, partitions)].write(f"{name},{price!r}\n")
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def _read_partition(path: str) -> Iterator[Tuple[str, float]]:
+    with open(path, "r") as f:
+        for line in f:
+            name, price = line.rstrip("\n").rsplit(",", 1)
+            yield name, float(price)
+
+
+def diff_snapshots(old_path: str, new_path: str, partitions: int = 1, tmp_dir: Optional[str] = None) -> Dict:
+    """
+    - Compares two product snapshots (validated like load_products()) with a hash join on
+      the product name: the old snapshot is the build side, the new one the probe side.
+    - Returns a dict with:
+        - added: [(name, price)] products only in the new snapshot
+        - removed: [(name, price)] products only in the old snapshot
+        - repriced: [(name, old_price, new_price)] products whose price changed
+        - unchanged: number of products present in both with the same price
+      Each list is sorted by name.
+    - partitions > 1 first splits both snapshots into that many temp files by a hash of the
+      name and joins one partition pair at a time, so only about 1/partitions of the old
+      snapshot is in memory at once. The temp files are removed afterwards.
+    Raises:
+        FileNotFoundError: if either snapshot does not exist
+    """
+    if partitions < 1:
+        raise ValueError(f"partitions must be at least 1, got {partitions}")
+    diff: Dict = {"added": [], "removed": [], "repriced": [], "unchanged": 0}
+
+    if partitions == 1:
+        old = dict(iter_products(old_path))
+        _join(old, iter_products(new_path), diff)
+    else:
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+            old_parts = _write_partitions(old_path, partitions, work_dir, "old")
+            new_parts = _write_partitions(new_path, partitions, work_dir, "new")
+            for old_part, new_part in zip(old_parts, new_parts):
+                _join(dict(_read_partition(old_part)), _read_partition(new_part), diff)
+
+    for key in ("added", "removed", "repriced"):
+        diff[key].sort()
+    print(
+        f"[INFO]Diff Complete: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+        f"{len(diff['repriced'])} repriced, {diff['unchanged']} unchanged"
+    )
+    return diff
+
+
+def apply_diff(summary: Dict, diff: Dict) -> Dict:
+    """
+    - Updates a summary from analyze_products() on the old snapshot to the new snapshot
+      using only the diff, without re-reading or re-summing the unchanged products.
+    - Removed names are dropped from product_names and added names are appended, so the
+      order can differ from a full re-analysis of the new file.
+    Raises:
+        ValueError: if the updated snapshot has no products
+    """
+    count = summary["total_valid_products"] + len(diff["added"]) - len(diff["removed"])
+    if count <= 0:
+        raise ValueError("No valid products to analyze.")
+    delta = math.fsum(
+        [price for _, price in diff["added"]]
+        + [-price for _, price in diff["removed"]]
+        + [new - old for _, old, new in diff["repriced"]]
+    )
+    total = summary["total_inventory_value"] + delta
+    removed = {name for name, _ in diff["removed"]}
+    names = [name for name in summary["product_names"] if name not in removed]
+    names.extend(name for name, _ in diff["added"])
+    return {
+        "total_valid_products": count,
+        "total_inventory_value": total,
+        "average_price": round(total / count, 2),
+        "product_names": names,
+    }
+
+
+def save_diff(diff: Dict, old_path: str, new_path: str, output_path: str) -> None:
+    """
+    - Appends a timestamped report of a snapshot diff to output_path:
+        ---- Snapshot Diff (YYYY-MM-DD HH:MM:SS) ----
+        Compared old.txt -> new.txt
+        Added: N / Removed: N / Repriced: N / Unchanged: N
+        + name: $price
+        - name: $price
+        ~ name: $old -> $new
+    """
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(output_path, 'a') as file:
+        file.write(f"---- Snapshot Diff ({timestamp}) ----\n")
+        file.write(f"Compared {old_path} -> {new_path}\n")
+        file.write(
+            f"Added: {len(diff['added'])} / Removed: {len(diff['removed'])} / "
+            f"Repriced: {len(diff['repriced'])} / Unchanged: {diff['unchanged']}\n"
+        )
+        for name, price in diff["added"]:
+            file.write(f"+ {name}: ${price}\n")
+        for name, price in diff["removed"]:
+            file.write(f"- {name}: ${price}\n")
+        for name, old_price, new_price in diff["repriced"]:
+            file.write(f"~ {name}: ${old_price} -> ${new_price}\n")
+        file.write("\n")
+    print(f"[INFO]Diff saved to {output_path}")
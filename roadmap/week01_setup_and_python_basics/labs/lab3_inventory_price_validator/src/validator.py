@@ -1,62 +1,199 @@
-from typing import Dict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
+from itertools import compress
 
-def load_products(filepath: str) -> dict:
+from src.money import mean_minor_units, parse_minor_units, parse_minor_units_array, sum_minor_units, to_decimal
+from src.product_table import ProductTable
+
+def _parse_product_line(line: str, decimals: Optional[int] = None) -> Union[Tuple[str, float], str]:
+    """
+    - Validates one "name,price" line and returns (name, price), or the rejection reason
+      used in the skip warnings as a str (no exception per rejected line).
+    - With decimals set, price is an int of minor units parsed without a float step.
+    """
+    product = line.strip().split(',')
+    # ensure there are exactly two fields before accessing them
+    if len(product) != 2:
+        return "wrong number of fields"
+    name = product[0].strip()
+    price_str = product[1].strip()
+    if name == "" or price_str == "":
+        return "empty name or price"
+    try:
+        price = float(price_str) if decimals is None else parse_minor_units(price_str, decimals)
+    except ValueError:
+        return "non-numeric price"
+    # skip negative prices
+    if price < 0:
+        return f"negative price: {price if decimals is None else to_decimal(price, decimals)}"
+    return name, price
+
+def _reject(line_no: int, line: str, reason: str, on_reject: Optional[Callable[[int, str, str], None]]) -> None:
+    print(f"[WARN]Skipping invalid entry: {line.strip()} due to {reason}")
+    if on_reject is not None:
+        on_reject(line_no, line.strip(), reason)
+
+def iter_products(
+    filepath: str,
+    on_reject: Optional[Callable[[int, str, str], None]] = None,
+    decimals: Optional[int] = None,
+) -> Iterator[Tuple[str, float]]:
+    """
+    - Yields validated (name, price) pairs from a text file, one line at a time.
+    - Applies the same rules and warnings as load_products().
+    - on_reject, if given, is also called with (line_number, line, reason) for every skipped line.
+    - decimals, if given, yields prices as int minor units (see load_products()).
+    Raises:
+        FileNotFoundError: if the file does not exist
+    """
+    with open(filepath, 'r') as file:
+        for line_no, line in enumerate(file, start=1):
+            parsed = _parse_product_line(line, decimals)
+            if parsed.__class__ is str:
+                _reject(line_no, line, parsed, on_reject)
+                continue
+            yield parsed
+
+def load_products(
+    filepath: str,
+    decimals: Optional[int] = None,
+    on_reject: Optional[Callable[[int, str, str], None]] = None,
+) -> dict:
     """
     - Load product data from a text file (one product per line in format: name,price).
     - Splits each line by comma and converts price to float.
     - Skips bad entries (missing fields, non-numeric prices, negative prices).
     - Returns a dictionary with 'name' and 'price' as key value pair.
+    - decimals=2 stores each price as an exact int of cents parsed straight from the text
+      (any number of decimal places selects the minor unit); the default keeps floats.
+    - on_reject works as in iter_products(), e.g. ErrorSink(...).on_reject (src/error_sink.py)
+      to record skipped lines as structured rows.
     
     Raises:
         FileNotFoundError: if the file does not exist
         ValueError: if no valid products are found
     """
   #  raise NotImplementedError #In user defined base classes, abstract methods should raise this exception when they require derived classes to override the method, or while the class is being developed to indicate that the real implementation still needs to be added.
+    if decimals is not None:
+        return _load_products_minor_units(filepath, decimals, on_reject)
     products: Dict[str, float] = {}
     with open(filepath, 'r') as file:
-        for line in file:
+        # the rules of _parse_product_line(), inlined: no call or generator step per valid line
+        for line_no, line in enumerate(file, start=1):
             product = line.strip().split(',')
-            # ensure there are exactly two fields before accessing them
-            if len(product) != 2:
-                print(f"[WARN]Skipping invalid entry: {line.strip()} due to wrong number of fields")
-                continue
-            name = product[0].strip()
-            price_str = product[1].strip()
-            if name == "" or price_str == "":
-                print(f"[WARN]Skipping invalid entry: {line.strip()} due to empty name or price")
-                continue
-            try:
-                price = float(price_str)
-            except ValueError:
-                print(f"[WARN]Skipping invalid entry: {line.strip()} due to non-numeric price")
-                continue
-            # skip negative prices
-            if price < 0:
-                print(f"[WARN]Skipping invalid entry: {line.strip()} due to negative price: {price}")
-                continue
-            
-            products[name] = price
-   
+            if len(product) == 2:
+                name = product[0].strip()
+                price_str = product[1].strip()
+                if name != "" and price_str != "":
+                    try:
+                        price = float(price_str)
+                    except ValueError:
+                        price = -1
+                    if not price < 0:
+                        products[name] = price
+                        continue
+            # rejected lines are rare: parse again for the reason
+            _reject(line_no, line, _parse_product_line(line), on_reject)
+
+    return products
+
+def _load_products_minor_units(
+    filepath: str,
+    decimals: int,
+    on_reject: Optional[Callable[[int, str, str], None]],
+) -> Dict[str, int]:
+    # load_products() with decimals set: split every line first, then parse the whole price
+    # column with one parse_minor_units_array() call instead of one call per line
+    names: List[str] = []
+    prices: List[str] = []
+    skipped: List[int] = []  # line numbers with a wrong field count or an empty field
+    with open(filepath, 'r') as file:
+        for line_no, line in enumerate(file, start=1):
+            product = line.strip().split(',')
+            if len(product) == 2:
+                name = product[0].strip()
+                price_str = product[1].strip()
+                if name != "" and price_str != "":
+                    names.append(name)
+                    prices.append(price_str)
+                    continue
+            skipped.append(line_no)
+
+    bad_prices: List[int] = []  # column indexes of non-numeric prices
+    column = parse_minor_units_array(prices, decimals, rejected=bad_prices)
+    rejected_lines = skipped
+    if bad_prices or (column and min(column) < 0):
+        valid = [price >= 0 for price in column]
+        for i in bad_prices:
+            valid[i] = False
+        names = list(compress(names, valid))
+        column = compress(column, valid)
+        invalid = [i for i, is_valid in enumerate(valid) if not is_valid]
+        rejected_lines = sorted(skipped + _line_numbers(invalid, skipped))
+    # same result as assigning line by line: the last valid line wins for a repeated name
+    products = dict(zip(names, column))
+
+    if rejected_lines:
+        # rejected lines are rare: read them again for the warnings and reasons
+        wanted = iter(rejected_lines)
+        next_line = next(wanted)
+        with open(filepath, 'r') as file:
+            for line_no, line in enumerate(file, start=1):
+                if line_no == next_line:
+                    _reject(line_no, line, _parse_product_line(line, decimals), on_reject)
+                    next_line = next(wanted, None)
+                    if next_line is None:
+                        break
     return products
 
-def analyze_products(products: dict) -> dict:
+def _line_numbers(indexes: List[int], skipped: List[int]) -> List[int]:
+    # line numbers of the given column indexes (sorted): column entry i comes from the
+    # (i + 1)-th line that is not in skipped (sorted)
+    numbers = []
+    passed = 0
+    for i in indexes:
+        while passed < len(skipped) and skipped[passed] <= i + 1 + passed:
+            passed += 1
+        numbers.append(i + 1 + passed)
+    return numbers
+
+def load_product_table(filepath: str) -> ProductTable:
+    """
+    - Same as load_products(), but returns a compact ProductTable (names list,
+      array('d') prices, array-backed name index) instead of a dict.
+    - Use it for catalogs with millions of products; analyze_products() accepts either.
+    Raises:
+        FileNotFoundError: if the file does not exist
+    """
+    table = ProductTable()
+    for name, price in iter_products(filepath):
+        table.add(name, price)
+    return table
+
+def analyze_products(products: dict, decimals: Optional[int] = None) -> dict:
 
     """
-    - Analyzes the products dictionary to compute:
+    - Analyzes the products dictionary (or a ProductTable) to compute:
         - total_products: total number of valid products
         - total inventory_value: sum of all product prices
         - average_price(rounded to 2 decimal places): average price of the products
         -list of product names
     - Returns a summary dictionary with these metrics.
+    - For prices loaded with decimals set (int minor units), pass the same decimals: the
+      total is an exact integer sum and the total and average are returned as Decimal.
     Raises:
         ValueError: if products is empty
     """
     if not products:
         raise ValueError("No valid products to analyze.")
     total_products = len(products)
-    total_inventory_value = sum(products.values())
-    average_price = round(total_inventory_value / total_products, 2)
+    if decimals is None:
+        total_inventory_value = sum(products.values())
+        average_price = round(total_inventory_value / total_products, 2)
+    else:
+        total_minor = sum_minor_units(products.values())
+        total_inventory_value = to_decimal(total_minor, decimals)
+        average_price = to_decimal(mean_minor_units(total_minor, total_products), decimals)
     product_names = list(products.keys())
     summary = {
         "total_valid_products": total_products,
@@ -76,6 +213,7 @@ def save_summary(summary: dict, input_file: str, output_path: str)-> None:
         Total Inventory Value: $Y
         Average Price: $Z
         Product Names: name1, name2, name3, ...
+    - Decimal totals from analyze_products(..., decimals=2) are written exactly, e.g. $1930.00.
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     try:    
@@ -0,0 +1,61 @@
+import random
+
+import pytest
+
+from src.indexes import ProductIndex
+from src.inventory import Inventory
+
+def test_product_index_queries():
+    """Range, top-N and prefix queries should match a linear scan of the dict."""
+    products = {"Monitor": 220.0, "Mouse": 25.0, "Monitor Arm": 60.0, "Laptop": 1200.0, "Keyboard": 80.0}
+    index = ProductIndex.from_products(products)
+
+    assert index.price_range(50, 220) == [("Monitor Arm", 60.0), ("Keyboard", 80.0), ("Monitor", 220.0)]
+    assert index.price_range(300, 1000) == []
+    assert index.most_expensive(2) == [("Laptop", 1200.0), ("Monitor", 220.0)]
+    assert index.cheapest(1) == [("Mouse", 25.0)]
+    assert index.with_prefix("Mon") == ["Monitor", "Monitor Arm"]
+    assert index.with_prefix("Z") == []
+
+def test_inventory_index_follows_changes():
+    """An indexed Inventory should answer queries like a fresh scan after any mix of changes."""
+    rng = random.Random(7)
+    inventory = Inventory(indexed=True)
+    for _ in range(3000):
+        name = f"SKU-{rng.randrange(400)}"
+        if name in inventory and rng.random() < 0.3:
+            inventory.delete(name)
+        else:
+            inventory.upsert(name, float(rng.randrange(0, 1000)))
+
+    products = inventory.products.to_dict()
+    expected_range = sorted((price, name) for name, price in products.items() if 100 <= price <= 300)
+    assert inventory.index.price_range(100, 300) == [(name, price) for price, name in expected_range]
+    assert [p for _, p in inventory.index.most_expensive(10)] == sorted(products.values(), reverse=True)[:10]
+    assert inventory.index.with_prefix("SKU-1") == sorted(n for n in products if n.startswith("SKU-1"))
+    assert len(inventory.index) == len(products)
+
+def test_blocked_list_matches_a_flat_sorted_list():
+    """Small blocks, so that inserts split blocks and deletes empty them."""
+    from src.indexes import _BlockedList
+    rng = random.Random(3)
+    flat = sorted(rng.randrange(200) for _ in range(50))
+    blocked = _BlockedList(flat, load=4)
+    for _ in range(2000):
+        if flat and rng.random() < 0.45:
+            item = rng.choice(flat)
+            flat.remove(item)
+            blocked.remove(item)
+        else:
+            item = rng.randrange(200)
+            flat.append(item)
+            flat.sort()
+            blocked.add(item)
+        low, high = sorted((rng.randrange(-10, 210), rng.randrange(-10, 210)))
+        assert blocked.between(low, high) == [x for x in flat if low <= x < high]
+        assert blocked.between(low, high, include_high=True) == [x for x in flat if low <= x <= high]
+    assert list(blocked) == flat and len(blocked) == len(flat)
+    assert blocked.head(7) == flat[:7] and blocked.tail(7) == flat[::-1][:7]
+    assert blocked.tail(len(flat) + 5) == flat[::-1]
+    with pytest.raises(KeyError):
+        blocked.remove(500)
@@ -0,0 +1,64 @@
+import math
+import random
+
+import pytest
+from src.inventory import Inventory
+from src.validator import analyze_products, load_products
+
+def test_inventory_summary_matches_analyze_products(tmp_path):
+    """Running totals should give the same summary as a full recompute."""
+    path = tmp_path / "products.txt"
+    path.write_text("Laptop,1200\nHeadphones,150\nMouse,not_available\nKeyboard,80\nCamera,500\n")
+
+    inventory = Inventory.from_file(str(path))
+
+    assert inventory.summary() == analyze_products(load_products(str(path)))
+
+def test_inventory_insert_update_delete_keep_totals():
+    """Totals, count and average should follow every change in O(1)."""
+    inventory = Inventory()
+    inventory.insert("Laptop", 1200.0)
+    inventory.insert("Mouse", 25.0)
+    inventory.update("Laptop", 1000.0)
+    inventory.insert("Camera", 500.0)
+    assert inventory.delete("Mouse") == 25.0
+
+    assert inventory.count == 2
+    assert inventory.total_value == 1500.0
+    assert inventory.average_price == 750.0
+    assert "Mouse" not in inventory
+    with pytest.raises(KeyError):
+        inventory.update("Mouse", 10.0)
+    with pytest.raises(KeyError):
+        inventory.delete("Mouse")
+
+def test_inventory_duplicate_policies(tmp_path):
+    """last_wins reprices repeated names; reject refuses them and keeps the first."""
+    last_wins = Inventory()
+    last_wins.insert("Laptop", 1200.0)
+    last_wins.insert("Laptop", 900.0)
+    assert (last_wins.count, last_wins.total_value) == (1, 900.0)
+
+    reject = Inventory(on_duplicate="reject")
+    reject.insert("Laptop", 1200.0)
+    with pytest.raises(ValueError):
+        reject.insert("Laptop", 900.0)
+
+    path = tmp_path / "products.txt"
+    path.write_text("Laptop,1200\nLaptop,900\n")
+    assert Inventory.from_file(str(path), on_duplicate="reject").total_value == 1200.0
+
+def test_inventory_apply_changes_stays_accurate():
+    """Thousands of reprices should leave the running total equal to an exact re-sum."""
+    rng = random.Random(5)
+    inventory = Inventory()
+    inventory.apply_changes((f"SKU-{i}", round(rng.uniform(1, 500), 2)) for i in range(1000))
+    for _ in range(20):
+        inventory.apply_changes((f"SKU-{rng.randrange(1000)}", round(rng.uniform(1, 500), 2)) for _ in range(500))
+        inventory.apply_changes((name, None) for name in rng.sample(list(inventory.products.keys()), 10))
+
+    assert inventory.total_value == math.fsum(inventory.products.values())
+
+def test_inventory_rejects_negative_price():
+    with pytest.raises(ValueError):
+        Inventory().insert("Fan", -15.0)
@@ -0,0 +1,57 @@
+import pytest
+from src.mmap_loader import load_products_mmap
+from src.validator import load_products
+
+TRICKY = (
+    "Laptop,1200\n"
+    " Headphones , 150.5 \r\n"
+    "Mouse,not_available\n"
+    "Fan,-15\n"
+    "\n"
+    "Desk Organizer,40,extra\n"
+    "Table-Top\n"
+    ",450\n"
+    "Phone Case,\n"
+    "Café Crème ,3.5\r"
+    "Laptop,999\n"
+    "Sci,1e3\n"
+    "Nothing,nan\n"
+    "Minus,-0.5\n"
+    + "Long " * 50 + ",1\n"
+    + "Last,0"
+)
+
+@pytest.mark.parametrize("block_size", [7, 64, 1024 * 1024])
+def test_mmap_loader_matches_load_products(tmp_path, capsys, block_size):
+    """The bulk loader should give the same products and warnings, in the same order."""
+    path = tmp_path / "products.txt"
+    path.write_bytes(TRICKY.encode())
+
+    expected = load_products(str(path))
+    expected_out = capsys.readouterr().out
+    result = load_products_mmap(str(path), block_size=block_size)
+    result_out = capsys.readouterr().out
+
+    assert list(result.items())[:3] == list(expected.items())[:3]
+    assert str(result) == str(expected)  # nan != nan, so compare the reprs
+    assert result_out == expected_out
+
+def test_mmap_loader_reports_rejected_line_numbers(tmp_path):
+    path = tmp_path / "products.txt"
+    path.write_text("Laptop,1200\nMouse,abc\nFan,-15\nDesk,1,2\n")
+    rejected = []
+
+    load_products_mmap(str(path), on_reject=lambda *row: rejected.append(row))
+
+    assert rejected == [
+        (2, "Mouse,abc", "non-numeric price"),
+        (3, "Fan,-15", "negative price: -15.0"),
+        (4, "Desk,1,2", "wrong number of fields"),
+    ]
+
+def test_mmap_loader_empty_and_missing_files(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+    assert load_products_mmap(str(path)) == {}
+    with pytest.raises(FileNotFoundError):
+        load_products_mmap(str(tmp_path / "missing.txt"))
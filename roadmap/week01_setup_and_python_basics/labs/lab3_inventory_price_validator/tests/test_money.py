@@ -0,0 +1,63 @@
+from decimal import Decimal
+from array import array
+
+import pytest
+from src.money import mean_minor_units, parse_minor_units, parse_minor_units_array, sum_minor_units
+from src.validator import analyze_products, load_products, save_summary
+
+def test_parse_minor_units():
+    """Price text should convert to exact minor units without a float step."""
+    assert parse_minor_units("19.99") == 1999
+    assert parse_minor_units("1200") == 120000
+    assert parse_minor_units("0.5") == 50
+    assert parse_minor_units(".5") == 50
+    assert parse_minor_units("-0.50") == -50
+    assert parse_minor_units("2.675") == 268  # float("2.675") * 100 rounds to 267
+    assert parse_minor_units("2.665") == 266  # half to even
+    assert parse_minor_units("1.2345", decimals=3) == 1234
+    assert parse_minor_units("7", decimals=0) == 7
+    assert parse_minor_units(" 12.5 ") == 1250
+    assert parse_minor_units("-.5", decimals=0) == 0 and parse_minor_units("-1.5", decimals=0) == -2
+    for bad in ["abc", ".", "1e3", "inf", "1.2.3", "1.-5", "12._5", "1_2.50", "١٢.٥٠", "-", "+-1", ""]:
+        with pytest.raises(ValueError):
+            parse_minor_units(bad)
+
+def test_money_totals_are_exact():
+    """Integer sums stay exact where float sums drift."""
+    values = array("q", [10] * 100_000)  # 100,000 x $0.10
+    assert sum_minor_units(values) == 1_000_000
+    assert sum_minor_units(list(values)) == 1_000_000
+    assert sum([0.10] * 100_000) != 10_000.0
+    assert mean_minor_units(5, 2) == 2 and mean_minor_units(7, 2) == 4
+
+def test_load_analyze_save_in_cents(tmp_path):
+    """decimals=2 should carry exact cents from the file to the report."""
+    path = tmp_path / "products.txt"
+    path.write_text("Laptop,1200\nPen,0.10\nPencil,0.20\nMouse,not_available\nFan,-0.10\n")
+
+    products = load_products(str(path), decimals=2)
+    assert products == {"Laptop": 120000, "Pen": 10, "Pencil": 20}
+
+    summary = analyze_products(products, decimals=2)
+    assert summary["total_inventory_value"] == Decimal("1200.30")
+    assert summary["average_price"] == Decimal("400.10")
+
+    output = tmp_path / "summary.txt"
+    save_summary(summary, str(path), str(output))
+    text = output.read_text()
+    assert "Total Inventory Value: $1200.30\n" in text
+    assert "Average Price: $400.10\n" in text
+
+def test_parse_minor_units_array_matches_scalar_parse():
+    """The vectorized column parser should agree with parse_minor_units() on every shape."""
+    pytest.importorskip("numpy")
+    uniform = ["19.99", "0.05", "1200.00", "123456789012345.67"]
+    mixed = uniform + ["7", "2.675", "-0.50"]
+    for texts in (uniform, mixed):
+        assert list(parse_minor_units_array(texts)) == [parse_minor_units(t) for t in texts]
+    assert list(parse_minor_units_array([])) == []
+    with pytest.raises(ValueError):
+        parse_minor_units_array(["19.99", "1x.00"])
+    rejected = []
+    assert list(parse_minor_units_array(["19.99", "1x.00", "-0.50", "abc"], rejected=rejected)) == [1999, 0, -50, 0]
+    assert rejected == [1, 3]
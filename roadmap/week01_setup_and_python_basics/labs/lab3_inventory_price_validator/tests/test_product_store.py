@@ -0,0 +1,32 @@
+from src.product_store import ProductStore
+from src.validator import analyze_products, load_products
+
+def test_product_store_summary_matches_analyze_products(tmp_path):
+    """SQL aggregates should give the same summary as the in-memory dict, duplicates included."""
+    path = tmp_path / "products.txt"
+    path.write_text("Laptop,1200\nHeadphones,150\nLaptop,1000\nKeyboard,80.5\nCamera,500\n")
+
+    with ProductStore(str(tmp_path / "products.db")) as store:
+        assert store.load_file(str(path), batch_size=2) == 5
+        assert store.summary() == analyze_products(load_products(str(path)))
+        assert store.get("Laptop") == 1000.0
+        assert store.summary(include_names=False)["product_names"] == []
+
+def test_product_store_records_rejected_rows(tmp_path):
+    """Every skipped line should land in rejected_rows with its reason."""
+    path = tmp_path / "products.txt"
+    path.write_text("Laptop,1200\nMouse,not_available\nFan,-15\n,20\nDesk\n")
+
+    with ProductStore(str(tmp_path / "products.db")) as store:
+        store.load_file(str(path))
+        assert len(store) == 1
+        assert store.rejected_rows() == [
+            (str(path), 2, "Mouse,not_available", "non-numeric price"),
+            (str(path), 3, "Fan,-15", "negative price: -15.0"),
+            (str(path), 4, ",20", "empty name or price"),
+            (str(path), 5, "Desk", "wrong number of fields"),
+        ]
+
+    # the data persists in the database file
+    with ProductStore(str(tmp_path / "products.db")) as store:
+        assert store.summary()["total_inventory_value"] == 1200.0
@@ -0,0 +1,53 @@
+import pytest
+from src.product_table import ProductTable
+from src.validator import analyze_products, load_product_table, load_products
+
+def test_product_table_behaves_like_dict():
+    """Lookups, membership and overwrites should match dict semantics."""
+    table = ProductTable()
+    table.add("Laptop", 1200.0)
+    table.add("Mouse", 25.0)
+    table.add("Laptop", 1100.0)  # duplicate name overwrites, like products[name] = price
+
+    assert len(table) == 2
+    assert table["Laptop"] == 1100.0
+    assert "Mouse" in table
+    assert "Camera" not in table
+    assert table.get("Camera", 0.0) == 0.0
+    assert list(table.items()) == [("Laptop", 1100.0), ("Mouse", 25.0)]
+    with pytest.raises(KeyError):
+        table["Camera"]
+
+def test_product_table_index_survives_growth():
+    """Every name should stay findable after the hash index is resized many times."""
+    table = ProductTable.from_items((f"SKU-{i}", float(i)) for i in range(5000))
+
+    assert len(table) == 5000
+    assert all(table[f"SKU-{i}"] == float(i) for i in range(0, 5000, 7))
+
+def test_load_product_table_matches_load_products(tmp_path):
+    """The table loader should apply the same validation and produce the same summary."""
+    path = tmp_path / "products.txt"
+    path.write_text("Laptop,1200\nHeadphones,150\nMouse,not_available\nKeyboard,80\nMonitor,-200\nCamera,500\n")
+
+    table = load_product_table(str(path))
+
+    assert table == load_products(str(path))
+    assert analyze_products(table) == analyze_products(load_products(str(path)))
+
+def test_analyze_products_empty_table():
+    """Should raise ValueError when analyzing an empty table"""
+    with pytest.raises(ValueError):
+        analyze_products(ProductTable())
+
+def test_product_table_remove_keeps_index_consistent():
+    """Removing rows should keep every remaining name findable."""
+    table = ProductTable.from_items((f"SKU-{i}", float(i)) for i in range(300))
+    for i in range(0, 300, 3):
+        assert table.remove(f"SKU-{i}") == float(i)
+
+    assert len(table) == 200
+    assert all(table[f"SKU-{i}"] == float(i) for i in range(300) if i % 3)
+    assert "SKU-3" not in table
+    with pytest.raises(KeyError):
+        table.remove("SKU-3")
@@ -0,0 +1,53 @@
+import random
+
+import pytest
+from src.snapshot_diff import apply_diff, diff_snapshots, save_diff
+from src.validator import analyze_products, load_products
+
+def write_snapshot(path, products):
+    path.write_text("".join(f"{name},{price}\n" for name, price in products.items()))
+
+def test_diff_snapshots_reports_changes(tmp_path):
+    """Added, removed and repriced products should be found by the name join."""
+    old_path, new_path = tmp_path / "old.txt", tmp_path / "new.txt"
+    old_path.write_text("Laptop,1200\nMouse,25\nKeyboard,80\nBroken,abc\n")
+    new_path.write_text("Laptop,1100\nKeyboard,80\nCamera,500\n")
+
+    diff = diff_snapshots(str(old_path), str(new_path))
+
+    assert diff == {
+        "added": [("Camera", 500.0)],
+        "removed": [("Mouse", 25.0)],
+        "repriced": [("Laptop", 1200.0, 1100.0)],
+        "unchanged": 1,
+    }
+    report = tmp_path / "diff.txt"
+    save_diff(diff, str(old_path), str(new_path), str(report))
+    assert "~ Laptop: $1200.0 -> $1100.0\n" in report.read_text()
+
+@pytest.mark.parametrize("partitions", [1, 7])
+def test_apply_diff_matches_full_reanalysis(tmp_path, partitions):
+    """Updating yesterday's summary from the diff should equal re-analyzing today's file."""
+    rng = random.Random(partitions)
+    old = {f"SKU-{i}": round(rng.uniform(1, 500), 2) for i in range(2000)}
+    new = dict(old)
+    for name in rng.sample(sorted(old), 30):
+        del new[name]
+    for name in rng.sample(sorted(new), 20):
+        new[name] = round(new[name] + 1.25, 2)
+    new.update({f"NEW-{i}": float(i) for i in range(15)})
+    old_path, new_path = tmp_path / "old.txt", tmp_path / "new.txt"
+    write_snapshot(old_path, old)
+    write_snapshot(new_path, new)
+
+    diff = diff_snapshots(str(old_path), str(new_path), partitions=partitions, tmp_dir=str(tmp_path))
+    assert (len(diff["added"]), len(diff["removed"]), len(diff["repriced"])) == (15, 30, 20)
+
+    updated = apply_diff(analyze_products(load_products(str(old_path))), diff)
+    expected = analyze_products(load_products(str(new_path)))
+    assert updated["total_valid_products"] == expected["total_valid_products"]
+    assert updated["total_inventory_value"] == pytest.approx(expected["total_inventory_value"])
+    assert updated["average_price"] == expected["average_price"]
+    assert sorted(updated["product_names"]) == sorted(expected["product_names"])
+    # the partition temp files are cleaned up
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["new.txt", "old.txt"]
@@ -1,7 +1,8 @@
 import os, tempfile
 import pytest
 from pathlib import Path
-from src.validator import load_products, analyze_products, save_summary
+from src.validator import load_products, analyze_products, save_summary, iter_products
+from src.error_sink import ErrorSink
 
 def test_load_products_valid_file():
     """Should load products correctly from a sample text file"""
@@ -61,3 +62,28 @@ def test_save_summary_creates_file(tmp_path:Path):
         assert "Total Inventory Value" in content
         assert "Average Price" in content
         assert "Product Names" in content
+
+def test_load_products_reports_rejects_to_error_sink(tmp_path):
+    products = tmp_path / "products.txt"
+    products.write_text("Laptop,999.99\nMouse,abc\nCable,-5\nDesk\n")
+    with ErrorSink(str(tmp_path / "rejects")) as sink:
+        assert load_products(str(products), on_reject=sink.on_reject) == {"Laptop": 999.99}
+    assert sink.summary()["by_code"] == {"non-numeric price": 1, "negative price": 1, "wrong number of fields": 1}
+    [path] = sink.paths
+    assert path.endswith(".1.csv")
+    lines = open(path).read().splitlines()
+    assert lines[1:] == ["non-numeric price,2,\"Mouse,abc\",non-numeric price", "negative price,3,\"Cable,-5\",negative price: -5.0", "wrong number of fields,4,Desk,wrong number of fields"]
+
+@pytest.mark.parametrize("decimals", [None, 2])
+def test_load_products_inline_loop_matches_iter_products(tmp_path, capsys, decimals):
+    """load_products() inlines the rules; it must keep, reject and warn exactly like iter_products()."""
+    products = tmp_path / "products.txt"
+    products.write_text("Laptop,999.99\n Fan , 12.5 \nMouse,abc\nCable,-5\nDesk\n,3\nNothing,nan\nLaptop,1\n")
+    expected_rejects = []
+    expected = dict(iter_products(str(products), on_reject=lambda *row: expected_rejects.append(row), decimals=decimals))
+    expected_out = capsys.readouterr().out
+    rejects = []
+    result = load_products(str(products), decimals=decimals, on_reject=lambda *row: rejects.append(row))
+    assert str(result) == str(expected)  # nan != nan, so compare the reprs
+    assert rejects == expected_rejects
+    assert capsys.readouterr().out == expected_out
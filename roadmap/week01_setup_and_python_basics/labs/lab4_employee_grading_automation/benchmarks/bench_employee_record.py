@@ -0,0 +1,88 @@
+"""
+Benchmark: csv.DictReader dict rows vs slotted EmployeeRecord objects.
+
+Memory: traced bytes of load_reviews() + process_reviews() (two dicts per employee) vs
+load_employee_records() + process_employee_records() (one record, graded in place).
+Throughput: run_pipeline() vs run_pipeline_records() on the same file; both must write the
+same graded file.
+
+Run from the lab root:
+    python -m benchmarks.bench_employee_record                              # 10^6 rows
+    python -m benchmarks.bench_employee_record --rows 10000000 --stream-only
+"""
+import argparse
+import contextlib
+import gc
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_parallel_grading import write_reviews
+from src.employee_record import load_employee_records, process_employee_records, run_pipeline_records
+from src.grade_calculator import load_reviews, process_reviews, run_pipeline
+
+
+def load_and_grade(load, process, path: str, err: str) -> tuple[list, list]:
+    # keeps the loaded list alive, as a caller of load_reviews() + process_reviews() does
+    with contextlib.redirect_stdout(io.StringIO()):
+        records = load(path)
+        return records, process(records, err)
+
+
+def loaded_bytes(load, process, path: str, err: str) -> tuple[int, float]:
+    """Traced bytes held by the loaded and graded rows, and the seconds it takes untraced."""
+    gc.collect()
+    tracemalloc.start()
+    graded = load_and_grade(load, process, path, err)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graded
+    gc.collect()
+    start = time.perf_counter()
+    load_and_grade(load, process, path, err)
+    return held, time.perf_counter() - start
+
+
+def timed(fn, *args) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fn(*args)
+        return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10**6)
+    parser.add_argument("--stream-only", action="store_true", help="skip the in-memory comparison (for very large --rows)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reviews = os.path.join(tmp_dir, "reviews.csv")
+        err = os.path.join(tmp_dir, "err")
+        write_reviews(reviews, args.rows)
+        print(f"{args.rows:,} rows ({os.path.getsize(reviews) / 1e6:.0f} MB)")
+
+        if not args.stream_only:
+            dict_bytes, dict_s = loaded_bytes(load_reviews, process_reviews, reviews, err)
+            typed_bytes, typed_s = loaded_bytes(load_employee_records, process_employee_records, reviews, err)
+            print(f"{'in memory':<22} {'MB held':>8} {'B/row':>6} {'seconds':>8}")
+            print(f"{'dict rows':<22} {dict_bytes / 1e6:>8.0f} {dict_bytes / args.rows:>6.0f} {dict_s:>8.2f}")
+            print(f"{'EmployeeRecord':<22} {typed_bytes / 1e6:>8.0f} {typed_bytes / args.rows:>6.0f} {typed_s:>8.2f}")
+            print(f"  {dict_bytes / typed_bytes:.2f}x less memory, {dict_s / typed_s:.2f}x faster")
+
+        dict_out = os.path.join(tmp_dir, "dict.csv")
+        typed_out = os.path.join(tmp_dir, "typed.csv")
+        dict_s = timed(run_pipeline, reviews, dict_out, err)
+        typed_s = timed(run_pipeline_records, reviews, typed_out, err)
+        with open(dict_out, "rb") as a, open(typed_out, "rb") as b:
+            assert a.read() == b.read(), "typed pipeline output differs from run_pipeline()"
+        print(f"{'streaming':<22} {'seconds':>8} {'rows/s':>10}")
+        print(f"{'run_pipeline':<22} {dict_s:>8.2f} {args.rows / dict_s:>10,.0f}")
+        print(f"{'run_pipeline_records':<22} {typed_s:>8.2f} {args.rows / typed_s:>10,.0f}")
+        print(f"  {dict_s / typed_s:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
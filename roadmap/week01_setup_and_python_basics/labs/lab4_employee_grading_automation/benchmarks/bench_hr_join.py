@@ -0,0 +1,69 @@
+"""
+Benchmark: join_with_master() with the hash table in memory vs a partitioned (Grace) join.
+
+The graded file has --rows employees; the HR master has 3x as many rows, a third of which
+match. Both joins must write the same rows.
+
+Run from the lab root:
+    python -m benchmarks.bench_hr_join                   # 10^6 graded rows, 3 * 10^6 master rows
+    python -m benchmarks.bench_hr_join --rows 200000 --partitions 16
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.hr_join import join_with_master
+
+
+def write_inputs(graded: str, master: str, rows: int) -> None:
+    with open(graded, "w") as f:
+        f.write("EmployeeID,Name,Department,Score,Grade\n")
+        f.writelines(f"E{i:08d},Employee {i},Dept {i % 7},{i % 101}.0,B\n" for i in range(rows))
+    with open(master, "w") as f:
+        f.write("EmployeeID,Manager,Location,Band\n")
+        f.writelines(f"E{i:08d},Manager {i % 997},Site {i % 31},L{i % 5}\n" for i in range(2 * rows, -rows, -1))
+
+
+def run(*args, **kwargs) -> tuple[dict, float, int]:
+    """The join's result, its untraced seconds and its traced peak memory (from a second run)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = join_with_master(*args, **kwargs)
+        seconds = time.perf_counter() - start
+        tracemalloc.start()
+        join_with_master(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10**6)
+    parser.add_argument("--partitions", type=int, default=8)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        graded = os.path.join(tmp_dir, "graded.csv")
+        master = os.path.join(tmp_dir, "master.csv")
+        write_inputs(graded, master, args.rows)
+        memory_out = os.path.join(tmp_dir, "memory.csv")
+        grace_out = os.path.join(tmp_dir, "grace.csv")
+
+        memory_result, memory_s, memory_peak = run(graded, master, memory_out, partitions=1)
+        grace_result, grace_s, grace_peak = run(graded, master, grace_out, partitions=args.partitions, tmp_dir=tmp_dir)
+        with open(memory_out) as a, open(grace_out) as b:
+            assert sorted(a) == sorted(b), "Grace join output differs from the in-memory join"
+
+        print(f"{args.rows:,} graded rows, {3 * args.rows:,} master rows; {memory_result}")
+        print(f"{'join':<22} {'seconds':>8} {'peak MB':>8}")
+        print(f"{'in memory':<22} {memory_s:>8.2f} {memory_peak / 1e6:>8.0f}")
+        print(f"{f'Grace, {args.partitions} partitions':<22} {grace_s:>8.2f} {grace_peak / 1e6:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark: a full run_pipeline() vs run_pipeline_incremental() with a warm cache.
+
+The second review cycle changes the score of --changed of the rows, removes 0.1% of the
+employees and adds as many new ones. Both modes must write the same graded file.
+
+Run from the lab root:
+    python -m benchmarks.bench_incremental                      # 10^6 rows, 1% changed
+    python -m benchmarks.bench_incremental --rows 5000000 --changed 0.05
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from benchmarks.bench_parallel_grading import write_reviews
+from src.grade_calculator import run_pipeline
+from src.incremental import run_pipeline_incremental
+
+
+def next_cycle(path: str, changed: float) -> None:
+    rng = random.Random(1)
+    with open(path) as f:
+        header, *lines = f.readlines()
+    kept = []
+    for line in lines:
+        r = rng.random()
+        if r < 0.001:
+            continue  # departed
+        if r < 0.001 + changed:
+            line = line[:line.rfind(",") + 1] + f"{rng.randrange(0, 101)}\n"
+        kept.append(line)
+    kept.extend(f"N{i:07d},New Hire {i},HR,{rng.randrange(0, 101)}\n" for i in range(len(lines) - len(kept)))
+    with open(path, "w") as f:
+        f.write(header)
+        f.writelines(kept)
+
+
+def timed(fn, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        result = fn(*args)
+        return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10**6)
+    parser.add_argument("--changed", type=float, default=0.01, help="fraction of rows whose score changes")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reviews = os.path.join(tmp_dir, "reviews.csv")
+        cache = os.path.join(tmp_dir, "grade_cache.txt")
+        full_out = os.path.join(tmp_dir, "full.csv")
+        inc_out = os.path.join(tmp_dir, "incremental.csv")
+        err = os.path.join(tmp_dir, "err")
+        write_reviews(reviews, args.rows)
+        _, cold_s = timed(run_pipeline_incremental, reviews, inc_out, err, cache)
+        next_cycle(reviews, args.changed)
+
+        _, full_s = timed(run_pipeline, reviews, full_out, err)
+        stats, warm_s = timed(run_pipeline_incremental, reviews, inc_out, err, cache)
+        with open(full_out, "rb") as a, open(inc_out, "rb") as b:
+            assert a.read() == b.read(), "incremental output differs from a full run"
+
+        print(f"{args.rows:,} rows, {args.changed:.0%} changed; cache {os.path.getsize(cache) / 1e6:.0f} MB")
+        print(f"  {stats}")
+        print(f"{'mode':<28} {'seconds':>8} {'speedup':>8}")
+        print(f"{'run_pipeline (full)':<28} {full_s:>8.2f} {1:>7.2f}x")
+        print(f"{'incremental, cold cache':<28} {cold_s:>8.2f} {full_s / cold_s:>7.2f}x")
+        print(f"{'incremental, warm cache':<28} {warm_s:>8.2f} {full_s / warm_s:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
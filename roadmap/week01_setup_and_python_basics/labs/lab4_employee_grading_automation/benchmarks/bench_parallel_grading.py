@@ -0,0 +1,88 @@
+"""
+Benchmark: run_pipeline() on one core vs grade_file_parallel() with 1..N workers.
+
+The generated reviews file has about 2% missing, non-numeric or out-of-range scores.
+Every parallel run is checked against the serial output file and error log.
+
+Run from the lab root:
+    python -m benchmarks.bench_parallel_grading                     # 2*10^6 rows, 1..cpu_count workers
+    python -m benchmarks.bench_parallel_grading --rows 5000000 --workers 1 2 4 8
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+
+from src.grade_calculator import run_pipeline
+from src.parallel_grading import grade_file_parallel
+
+
+def write_reviews(path: str, rows: int) -> None:
+    rng = random.Random(0)
+    departments = ["Engineering", "HR", "Finance", "Marketing", "Design"]
+    with open(path, "w") as f:
+        f.write("EmployeeID,Name,Department,Score\n")
+        for i in range(rows):
+            r = rng.random()
+            if r < 0.005:
+                score = ""
+            elif r < 0.01:
+                score = "abc"
+            elif r < 0.02:
+                score = str(rng.randrange(101, 200))
+            else:
+                score = str(rng.randrange(0, 101))
+            f.write(f"E{i:07d},Employee {i},{departments[i % 5]},{score}\n")
+
+
+def timed(fn, *args, **kwargs) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        return time.perf_counter() - start
+
+
+def read_log(log_dir: str) -> str:
+    [name] = os.listdir(log_dir)
+    with open(os.path.join(log_dir, name)) as f:
+        return f.read()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2 * 10**6)
+    parser.add_argument("--workers", type=int, nargs="+", default=list(range(1, (os.cpu_count() or 1) + 1)))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        reviews = os.path.join(tmp_dir, "reviews.csv")
+        write_reviews(reviews, args.rows)
+        size_mb = os.path.getsize(reviews) / 1e6
+        serial_out = os.path.join(tmp_dir, "serial.csv")
+        os.mkdir(os.path.join(tmp_dir, "serial_logs"))
+        serial_s = timed(run_pipeline, reviews, serial_out, os.path.join(tmp_dir, "serial_logs", "err"))
+        with open(serial_out, "rb") as f:
+            expected = f.read()
+        expected_log = read_log(os.path.join(tmp_dir, "serial_logs"))
+
+        print(f"{args.rows:,} rows, {size_mb:.1f} MB, {os.cpu_count()} CPUs")
+        print(f"{'mode':<22} {'seconds':>8} {'rows/s':>10} {'speedup':>8}")
+        print(f"{'run_pipeline':<22} {serial_s:>8.2f} {args.rows / serial_s:>10,.0f} {1:>7.2f}x")
+        for workers in args.workers:
+            out = os.path.join(tmp_dir, f"parallel-{workers}.csv")
+            log_dir = os.path.join(tmp_dir, f"logs-{workers}")
+            os.mkdir(log_dir)
+            seconds = timed(grade_file_parallel, reviews, out, os.path.join(log_dir, "err"), workers=workers)
+            with open(out, "rb") as f:
+                assert f.read() == expected, "sharded output differs from run_pipeline()"
+            assert read_log(log_dir) == expected_log, "sharded error log differs from run_pipeline()"
+            os.remove(out)
+            label = f"{workers} worker{'s' if workers > 1 else ''}"
+            print(f"{label:<22} {seconds:>8.2f} {args.rows / seconds:>10,.0f} {serial_s / seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
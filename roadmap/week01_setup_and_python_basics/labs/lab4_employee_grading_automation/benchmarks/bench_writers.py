@@ -0,0 +1,101 @@
+"""
+Benchmark: write and read throughput and file size of each graded-reviews output format.
+
+"csv (DictWriter)" is the previous save_processed_reviews() writer. Reads parse every row
+(csv.reader for the CSV formats, all columns for columnar). "columnar, Score only" reads just
+the column that a score report needs.
+
+Run from the lab root:
+    python -m benchmarks.bench_writers                  # 500,000 graded rows
+    python -m benchmarks.bench_writers --rows 2000000
+"""
+import argparse
+import csv
+import gzip
+import lzma
+import os
+import random
+import tempfile
+import time
+
+from src.grade_bands import DEFAULT_BANDS
+from src.writers import WRITERS, iter_columnar_groups
+
+DEPARTMENTS = ["Engineering", "HR", "Finance", "Marketing", "Design", "Sales", "Legal", "Support"]
+
+
+def graded_records(rows: int) -> list[dict]:
+    rng = random.Random(0)
+    records = []
+    for i in range(rows):
+        score = float(rng.randrange(0, 101))
+        records.append({
+            "EmployeeID": f"E{i:07d}",
+            "Name": f"Employee {i}",
+            "Department": DEPARTMENTS[i % len(DEPARTMENTS)],
+            "Score": score,
+            "Grade": DEFAULT_BANDS.grade(score),
+        })
+    return records
+
+
+def write_dict_writer(records: list[dict], path: str) -> int:
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+    return len(records)
+
+
+def read_csv(opener):
+    def read(path: str) -> int:
+        with opener(path, "rt", newline="") as f:
+            return sum(1 for _ in csv.reader(f)) - 1
+    return read
+
+
+def read_columnar(columns=None):
+    def read(path: str) -> int:
+        return sum(len(next(iter(group.values()))) for group in iter_columnar_groups(path, columns))
+    return read
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=500_000)
+    args = parser.parse_args()
+
+    records = graded_records(args.rows)
+    formats = [
+        ("csv (DictWriter)", "dict.csv", write_dict_writer, read_csv(open)),
+        ("csv", "out.csv", WRITERS["csv"], read_csv(open)),
+        ("csv.gz", "out.csv.gz", WRITERS["csv.gz"], read_csv(gzip.open)),
+        ("csv.xz", "out.csv.xz", WRITERS["csv.xz"], read_csv(lzma.open)),
+        ("columnar", "out.col", WRITERS["columnar"], read_columnar()),
+        ("columnar, Score only", "out.col", None, read_columnar(["Score"])),
+    ]
+    print(f"{args.rows:,} graded rows")
+    print(f"{'format':<22} {'write s':>8} {'rows/s':>10} {'read s':>8} {'rows/s':>10} {'MB':>7}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, name, write, read in formats:
+            path = os.path.join(tmp_dir, name)
+            if write is not None:
+                written, write_s = timed(write, records, path)
+                assert written == args.rows
+                write_cols = f"{write_s:>8.2f} {args.rows / write_s:>10,.0f}"
+            else:
+                write_cols = f"{'-':>8} {'-':>10}"
+            count, read_s = timed(read, path)
+            assert count == args.rows
+            size_mb = os.path.getsize(path) / 1e6
+            print(f"{label:<22} {write_cols} {read_s:>8.2f} {args.rows / read_s:>10,.0f} {size_mb:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,81 @@
-from src.grade_calculator import load_reviews, process_reviews, save_processed_reviews
+import argparse
+import os
+
+from src.dedup import POLICIES, run_pipeline_dedup
+from src.department_stats import DepartmentStats, save_department_summary
+from src.employee_record import run_pipeline_records
+from src.grade_calculator import run_pipeline
+from src.hr_join import join_with_master
+from src.incremental import run_pipeline_incremental
+from src.ingest import discover_review_files, run_ingestion
+from src.writers import output_format
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Employee Grading Automation")
+    parser.add_argument("--input", default='data/reviews.csv', help="reviews CSV to grade")
+    parser.add_argument("--input-dir", help="grade every *.csv under this directory (one sub-directory per region)")
+    parser.add_argument("--output", default='data/graded_reviews.csv', help="graded CSV to write")
+    parser.add_argument("--workers", type=int, default=1, help="grade byte-range shards in this many processes")
+    parser.add_argument("--department-summary", help="also write per-Department statistics to this CSV")
+    parser.add_argument("--typed", action="store_true", help="grade slotted EmployeeRecord objects instead of dict rows")
+    parser.add_argument("--dedup", choices=POLICIES, help="grade each EmployeeID once, keeping the record this policy picks")
+    parser.add_argument("--dedup-partitions", type=int, default=1, help="spill the dedup index to this many temp files")
+    parser.add_argument("--hr-master", help="join the graded reviews with this HR master CSV on EmployeeID")
+    parser.add_argument("--enriched-output", default='data/enriched_reviews.csv', help="joined CSV to write with --hr-master")
+    parser.add_argument("--cache", help="incremental mode: reuse unchanged rows graded in the last run (cache file)")
+    args = parser.parse_args()
+    if args.workers > 1:
+        # only the plain dict pipeline is sharded across processes
+        serial = [flag for flag, used in (
+            ("--typed", args.typed), ("--dedup", args.dedup), ("--input-dir", args.input_dir), ("--cache", args.cache),
+        ) if used]
+        if serial:
+            parser.error(f"--workers cannot be combined with {', '.join(serial)}")
+        if output_format(args.output) != "csv":
+            # the shards are concatenated byte for byte, which only works for plain CSV
+            parser.error("--workers needs a plain .csv --output")
+    if args.cache:
+        # the incremental cache only covers the plain dict pipeline on a single --input
+        uncached = [flag for flag, used in (
+            ("--typed", args.typed), ("--dedup", args.dedup), ("--input-dir", args.input_dir),
+        ) if used]
+        if uncached:
+            parser.error(f"--cache cannot be combined with {', '.join(uncached)}")
+    if args.hr_master and output_format(args.output) != "csv":
+        # the join reads the graded file back as plain CSV
+        parser.error("--hr-master needs a plain .csv --output")
+
     errfile_path = 'logs/error_log'
-    reviews = load_reviews('data/reviews.csv')
-    graded_reviews = process_reviews(reviews, errfile_path)
-    save_processed_reviews(graded_reviews, 'data/graded_reviews.csv')
\ No newline at end of file
+    os.makedirs(os.path.dirname(errfile_path), exist_ok=True)
+    stats = DepartmentStats() if args.department_summary else None
+    if args.cache:
+        run_pipeline_incremental(args.input, args.output, errfile_path, args.cache, stats=stats)
+    else:
+        # load -> process -> save, streamed one record at a time (or sharded across --workers processes)
+        if args.dedup:
+            # discovered files are in name order: date-stamped names put the latest file last
+            paths = discover_review_files(args.input_dir) if args.input_dir else [args.input]
+            run_pipeline_dedup(paths, args.output, errfile_path, args.dedup, args.dedup_partitions, stats=stats)
+        elif args.input_dir:
+            run_ingestion(args.input_dir, args.output, errfile_path, stats=stats)
+        elif args.typed:
+            run_pipeline_records(args.input, args.output, errfile_path, stats=stats)
+        else:
+            run_pipeline(args.input, args.output, errfile_path, workers=args.workers, stats=stats)
+    if stats is not None:
+        save_department_summary(stats, args.department_summary)
+
+    if args.hr_master:
+        with open(args.output, newline="") as graded:
+            has_header = graded.readline().strip() != ""
+        if not has_header:
+            # no valid reviews: the graded file has no columns to join on
+            print(f"[WARN] No graded reviews in {args.output}; skipping the HR master join.")
+        else:
+            # enrich the graded file (plain CSV) with the master's manager, location, band, ...
+            stem = os.path.splitext(args.enriched_output)[0]
+            join_with_master(
+                args.output, args.hr_master, args.enriched_output,
+                unmatched_reviews_path=f"{stem}_unmatched_reviews.csv",
+                unmatched_master_path=f"{stem}_unmatched_master.csv",
+            )
@@ -0,0 +1,154 @@
+import csv
+import math
+import tempfile
+from itertools import chain
+from typing import Iterable, Iterator, Optional
+
+from src.department_stats import DepartmentStats
+from src.error_sink import ErrorSink
+from src.grade_bands import DEFAULT_BANDS, GradeBands
+from src.grade_calculator import RAW_SCORE_FIELD, convert_score, iter_processed_reviews, iter_reviews, score_error_code, write_reviews
+from src.partitions import partition_files, partition_of
+
+# which record is kept when an EmployeeID appears more than once
+POLICIES = ("latest", "highest_score", "first")
+
+
+def _score_rank(row: dict) -> float:
+    # a record that cannot be graded loses to any record that can
+    return row["Score"] if score_error_code(row) is None else -math.inf
+
+
+def _dedup_into(index: dict, records: Iterable[dict], policy: str) -> int:
+    """Upserts records into the EmployeeID -> record index; returns the number of records read."""
+    count = 0
+    if policy == "latest":
+        for row in records:
+            count += 1
+            # assigning an existing key keeps its position, so the order stays first-seen
+            index[row.get("EmployeeID")] = row
+    elif policy == "first":
+        for row in records:
+            count += 1
+            index.setdefault(row.get("EmployeeID"), row)
+    else:
+        for row in records:
+            count += 1
+            key = row.get("EmployeeID")
+            kept = index.get(key)
+            # on a tie the record already kept stays
+            if kept is None or _score_rank(row) > _score_rank(kept):
+                index[key] = row
+    return count
+
+
+def _write_partitions(records: Iterator[dict], partitions: int, work_dir: str) -> tuple[list[str], int]:
+    records = iter(records)
+    first = next(records, None)
+    if first is None:
+        return [], 0
+    # convert_score() adds RAW_SCORE_FIELD again when a partition is read back
+    fieldnames = [name for name in first if name is not None and name != RAW_SCORE_FIELD]
+    count = 0
+    with partition_files(work_dir, "part", partitions) as (paths, files):
+        writers = [csv.DictWriter(f, fieldnames, extrasaction="ignore") for f in files]
+        for writer in writers:
+            writer.writeheader()
+        for row in chain([first], records):
+            count += 1
+            # Score is written as its text; convert_score() gives back the same value
+            if RAW_SCORE_FIELD in row:
+                row = {**row, "Score": row[RAW_SCORE_FIELD]}
+            writers[partition_of(row.get("EmployeeID"), partitions)].writerow(row)
+    return paths, count
+
+
+def _read_partition(path: str) -> Iterator[dict]:
+    with open(path, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            yield convert_score(row)
+
+
+def iter_deduplicated(
+    records: Iterable[dict],
+    policy: str = "latest",
+    partitions: int = 1,
+    tmp_dir: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    - Yields one record per EmployeeID, chosen by policy:
+        - "latest": the last record seen wins (records from later files or later lines)
+        - "highest_score": the record with the highest valid score wins; a record that
+          cannot be graded only wins if the employee has no valid one
+        - "first": the first record seen wins
+    - One pass over the input with a dict keyed on EmployeeID: O(n) time, O(distinct
+      employees) memory. Records come out in the order each EmployeeID was first seen
+    - partitions > 1 spills the records to that many temp files by a hash of EmployeeID and
+      deduplicates one partition at a time, so only about 1/partitions of the employees are
+      in memory at once. Records then come out partition by partition, each in first-seen
+      order. The temp files are removed afterwards
+    Raises:
+        ValueError: if policy is not one of POLICIES or partitions is less than 1
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"Unknown dedup policy: {policy}. Expected one of {', '.join(POLICIES)}.")
+    if partitions < 1:
+        raise ValueError(f"partitions must be at least 1, got {partitions}")
+    # checked above, before the first record is requested
+    return _iter_deduplicated(records, policy, partitions, tmp_dir)
+
+
+def _iter_deduplicated(records: Iterable[dict], policy: str, partitions: int, tmp_dir: Optional[str]) -> Iterator[dict]:
+    if partitions == 1:
+        index: dict = {}
+        count = _dedup_into(index, records, policy)
+        yield from index.values()
+        kept = len(index)
+    else:
+        kept = 0
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+            paths, count = _write_partitions(records, partitions, work_dir)
+            for path in paths:
+                index = {}
+                _dedup_into(index, _read_partition(path), policy)
+                kept += len(index)
+                yield from index.values()
+                del index
+    print(f"[INFO] Dropped {count - kept} duplicate records of {count} (policy {policy})")
+
+
+def dedup_records(records: Iterable[dict], policy: str = "latest", partitions: int = 1, tmp_dir: Optional[str] = None) -> list[dict]:
+    """List version of iter_deduplicated()."""
+    return list(iter_deduplicated(records, policy, partitions, tmp_dir))
+
+
+def run_pipeline_dedup(
+    input_file_paths: list[str],
+    output_file_path: str,
+    errfile_path: str,
+    policy: str = "latest",
+    partitions: int = 1,
+    tmp_dir: Optional[str] = None,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    error_sink: Optional[ErrorSink] = None,
+    output_format: Optional[str] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> int:
+    """
+    - run_pipeline() over several review files with a dedup stage before grading:
+      iter_reviews (each file in the given order) -> iter_deduplicated -> iter_processed_reviews
+      -> write_reviews, so each employee is graded and written once
+    - For "latest", list the files oldest first
+    - Returns the number of graded records written
+    Raises:
+        FileNotFoundError: if an input file does not exist
+        ValueError: if policy is not one of POLICIES
+    """
+    records = chain.from_iterable(map(iter_reviews, input_file_paths))
+    unique = iter_deduplicated(records, policy, partitions, tmp_dir)
+    graded = iter_processed_reviews(
+        unique, errfile_path, in_place=True, bands=bands, department_bands=department_bands,
+        error_sink=error_sink, stats=stats,
+    )
+    return write_reviews(graded, output_file_path, output_format)
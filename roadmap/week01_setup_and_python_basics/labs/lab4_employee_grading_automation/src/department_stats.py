@@ -0,0 +1,149 @@
+import csv
+from typing import Optional
+
+
+class GroupStats:
+    """
+    Running statistics of one department: graded and rejected counts, score sum/min/max
+    and a grade histogram. O(number of grade labels) memory however many rows are added.
+    """
+
+    __slots__ = ("graded", "errors", "score_sum", "score_min", "score_max", "grades")
+
+    def __init__(self):
+        self.graded = 0
+        self.errors = 0
+        self.score_sum = 0.0
+        self.score_min: Optional[float] = None
+        self.score_max: Optional[float] = None
+        self.grades: dict[str, int] = {}
+
+    def add(self, score: float, grade: str) -> None:
+        self.graded += 1
+        self.score_sum += score
+        if self.score_min is None or score < self.score_min:
+            self.score_min = score
+        if self.score_max is None or score > self.score_max:
+            self.score_max = score
+        self.grades[grade] = self.grades.get(grade, 0) + 1
+
+    def merge(self, other: "GroupStats") -> None:
+        self.graded += other.graded
+        self.errors += other.errors
+        self.score_sum += other.score_sum
+        if other.score_min is not None and (self.score_min is None or other.score_min < self.score_min):
+            self.score_min = other.score_min
+        if other.score_max is not None and (self.score_max is None or other.score_max > self.score_max):
+            self.score_max = other.score_max
+        for grade, count in other.grades.items():
+            self.grades[grade] = self.grades.get(grade, 0) + count
+
+    def to_state(self) -> dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "GroupStats":
+        group = cls()
+        for name in cls.__slots__:
+            setattr(group, name, state[name])
+        group.grades = dict(group.grades)
+        return group
+
+
+class DepartmentStats:
+    """
+    Per-Department accumulators filled while grading, so department statistics no longer
+    need a second pass over graded_reviews.csv.
+
+    - add(row) for every graded record, add_error(row) for every rejected one
+      (add_graded()/add_rejected() take the fields directly)
+    - merge() combines the stats of separate shards or runs, in any order
+    - to_state()/from_state() round-trip through JSON
+    - summary() gives count, mean/min/max score, the grade histogram and the error rate
+      of each department
+    """
+
+    def __init__(self):
+        self.groups: dict[Optional[str], GroupStats] = {}
+
+    def _group(self, department: Optional[str]) -> GroupStats:
+        group = self.groups.get(department)
+        if group is None:
+            group = self.groups[department] = GroupStats()
+        return group
+
+    def add(self, row: dict) -> None:
+        """Counts a graded record (with "Score" and "Grade")."""
+        self.add_graded(row.get("Department"), row["Score"], row["Grade"])
+
+    def add_error(self, row: dict) -> None:
+        """Counts a record rejected by validation."""
+        self.add_rejected(row.get("Department"))
+
+    def add_graded(self, department: Optional[str], score: float, grade: str) -> None:
+        """add() without a dict row, e.g. for an EmployeeRecord."""
+        self._group(department).add(score, grade)
+
+    def add_rejected(self, department: Optional[str]) -> None:
+        """add_error() without a dict row."""
+        self._group(department).errors += 1
+
+    def merge(self, other: "DepartmentStats") -> None:
+        for department, group in other.groups.items():
+            self._group(department).merge(group)
+
+    def to_state(self) -> dict:
+        """Returns the accumulators as a JSON-serializable list of [department, state] pairs."""
+        return {"groups": [[department, group.to_state()] for department, group in self.groups.items()]}
+
+    @classmethod
+    def from_state(cls, state: dict) -> "DepartmentStats":
+        stats = cls()
+        for department, group in state["groups"]:
+            stats.groups[department] = GroupStats.from_state(group)
+        return stats
+
+    def summary(self) -> dict[Optional[str], dict]:
+        """
+        Returns {department: {"count", "graded", "errors", "error_rate", "mean_score",
+        "min_score", "max_score", "grades"}}, departments in sorted order. count is
+        graded + errors; the score fields are None for a department with no graded record.
+        """
+        summary = {}
+        for department in sorted(self.groups, key=lambda name: (name is None, name or "")):
+            group = self.groups[department]
+            count = group.graded + group.errors
+            summary[department] = {
+                "count": count,
+                "graded": group.graded,
+                "errors": group.errors,
+                "error_rate": round(group.errors / count, 4) if count else 0.0,
+                "mean_score": round(group.score_sum / group.graded, 2) if group.graded else None,
+                "min_score": group.score_min,
+                "max_score": group.score_max,
+                "grades": dict(sorted(group.grades.items())),
+            }
+        return summary
+
+
+def save_department_summary(stats: DepartmentStats, output_file_path: str) -> None:
+    """
+    - Writes one CSV row per department:
+        Department,Count,Graded,Errors,ErrorRate,MeanScore,MinScore,MaxScore,Grade_<label>...
+    - There is a Grade_<label> column for every grade seen in any department
+    """
+    summary = stats.summary()
+    labels = sorted({label for row in summary.values() for label in row["grades"]})
+    with open(output_file_path, mode='w', newline='') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(
+            ["Department", "Count", "Graded", "Errors", "ErrorRate", "MeanScore", "MinScore", "MaxScore"]
+            + [f"Grade_{label}" for label in labels]
+        )
+        for department, row in summary.items():
+            writer.writerow(
+                [department, row["count"], row["graded"], row["errors"], row["error_rate"],
+                 row["mean_score"], row["min_score"], row["max_score"]]
+                + [row["grades"].get(label, 0) for label in labels]
+            )
+    print(f"[INFO] Saved department summary for {len(summary)} departments to {output_file_path}")
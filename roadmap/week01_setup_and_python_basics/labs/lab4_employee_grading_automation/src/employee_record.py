@@ -0,0 +1,248 @@
+import csv
+import sys
+from enum import IntEnum
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from src.department_stats import DepartmentStats
+from src.error_sink import ErrorSink
+from src.grade_bands import DEFAULT_BANDS, GradeBands, bands_for
+from src.grade_calculator import _ErrorLog, write_reviews
+from src.writers import CSV_BATCH_SIZE, output_format as output_format_for
+
+# input columns of a reviews file, in the order EmployeeRecord keeps them
+COLUMNS = ["EmployeeID", "Name", "Department", "Score"]
+OUTPUT_COLUMNS = COLUMNS + ["Grade"]
+
+
+class ScoreStatus(IntEnum):
+    """Validation result of a record's score, decided once when the record is loaded."""
+
+    VALID = 0
+    MISSING = 1
+    NON_NUMERIC = 2
+    OUT_OF_RANGE = 3
+
+    @property
+    def code(self) -> Optional[str]:
+        """The score_error_code() string of this status, None for VALID."""
+        return _CODES[self]
+
+
+_CODES = {
+    ScoreStatus.VALID: None,
+    ScoreStatus.MISSING: "missing",
+    ScoreStatus.NON_NUMERIC: "non_numeric",
+    ScoreStatus.OUT_OF_RANGE: "out_of_range",
+}
+
+
+class EmployeeRecord:
+    """
+    One employee review with typed fields, in place of a csv.DictReader dict.
+
+    - __slots__: no per-record __dict__, so a record is a fraction of the size of a dict row
+    - score is a float, or None when status is not VALID or OUT_OF_RANGE; raw_score keeps
+      the original text only for rejected records, for the error log and the error sink
+    - department is interned, so all records of a department share one string
+    - grade is set in place when the record is graded (None until then)
+    """
+
+    __slots__ = ("employee_id", "name", "department", "score", "status", "raw_score", "grade")
+
+    def __init__(
+        self,
+        employee_id: str,
+        name: str,
+        department: str,
+        score: Optional[float],
+        status: ScoreStatus = ScoreStatus.VALID,
+        raw_score: Optional[str] = None,
+        grade: Optional[str] = None,
+    ):
+        self.employee_id = employee_id
+        self.name = name
+        self.department = department
+        self.score = score
+        self.status = status
+        self.raw_score = raw_score
+        self.grade = grade
+
+    @classmethod
+    def from_fields(cls, employee_id: str, name: str, department: str, score: str) -> "EmployeeRecord":
+        """Builds a record from the raw CSV fields, validating the score like score_error_code()."""
+        department = sys.intern(department)
+        text = score.strip()
+        if text == "":
+            return cls(employee_id, name, department, None, ScoreStatus.MISSING)
+        try:
+            value = float(text)
+        except ValueError:
+            value = None
+        if value is None or value != value:  # "NaN" is not a score either
+            return cls(employee_id, name, department, None, ScoreStatus.NON_NUMERIC, text)
+        if value < 0 or value > 100:
+            return cls(employee_id, name, department, value, ScoreStatus.OUT_OF_RANGE, text)
+        return cls(employee_id, name, department, value)
+
+    def error_message(self) -> str:
+        """Returns the error log line of a rejected record, the same as error_message() for a dict row."""
+        if self.status == ScoreStatus.MISSING:
+            return f"[ERR] Missing score for employee {self.employee_id}."
+        if self.status == ScoreStatus.NON_NUMERIC:
+            return f"[ERR] Non-numeric score for employee {self.employee_id}:{self.raw_score}."
+        return f"[ERR] Invalid score for employee {self.employee_id}:{self.score}. Score must be between 0-100"
+
+    def as_row(self) -> tuple:
+        """The output CSV row: EmployeeID, Name, Department, Score, Grade."""
+        return (self.employee_id, self.name, self.department, self.score, self.grade)
+
+    def to_dict(self) -> dict:
+        """The dict row the dict-based functions use, with "Grade" once the record is graded."""
+        row = {"EmployeeID": self.employee_id, "Name": self.name, "Department": self.department, "Score": self.score}
+        if self.status == ScoreStatus.NON_NUMERIC:
+            row["Score"] = self.raw_score
+        if self.grade is not None:
+            row["Grade"] = self.grade
+        return row
+
+    def __repr__(self) -> str:
+        return (
+            f"EmployeeRecord({self.employee_id!r}, {self.name!r}, {self.department!r}, "
+            f"{self.score!r}, {self.status.name}, grade={self.grade!r})"
+        )
+
+
+def iter_employee_records(file_path: str) -> Iterator[EmployeeRecord]:
+    """
+    - Typed counterpart of iter_reviews(): yields EmployeeRecord objects built with csv.reader
+      and the column indexes found once in the header, instead of one dict per row
+    - Columns other than EmployeeID, Name, Department and Score are dropped; short rows are
+      padded with blanks, so a row without a score is rejected as missing
+    Raises:
+        FileNotFoundError: if the file does not exist (when the first record is requested)
+        ValueError: if the header lacks one of EmployeeID, Name, Department, Score
+    """
+    record_count = 0
+    with open(file_path, mode='r', newline='') as csvfile:
+        reader = csv.reader(csvfile)
+        header = next(reader, [])
+        missing = [name for name in COLUMNS if name not in header]
+        if missing:
+            raise ValueError(f"{file_path} is missing columns: {', '.join(missing)}")
+        id_index, name_index, department_index, score_index = (header.index(name) for name in COLUMNS)
+        width = len(header)
+        from_fields = EmployeeRecord.from_fields
+        for fields in reader:
+            if not fields:  # blank line; DictReader skips these too
+                continue
+            if len(fields) < width:
+                fields += [""] * (width - len(fields))
+            record_count += 1
+            yield from_fields(fields[id_index], fields[name_index], fields[department_index], fields[score_index])
+
+    print(f"[INFO] Loaded {record_count} records from {file_path}")
+
+
+def load_employee_records(file_path: str) -> list[EmployeeRecord]:
+    """Typed counterpart of load_reviews(); thin wrapper around iter_employee_records()."""
+    return list(iter_employee_records(file_path))
+
+
+def iter_graded_records(
+    records: Iterable[EmployeeRecord],
+    errfile_path: str,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    error_sink: Optional[ErrorSink] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> Iterator[EmployeeRecord]:
+    """
+    - Typed counterpart of iter_processed_reviews(): sets .grade on each valid record and
+      yields it; no record is copied
+    - Rejected records go to error_sink if given, otherwise to {errfile_path}_{timestamp}.txt,
+      with the same messages as the dict-based functions
+    - stats, if given, accumulates per-Department statistics in the same pass
+    """
+    error_log = _ErrorLog(errfile_path, error_sink)
+    try:
+        for record in records:
+            status = record.status
+            if status:
+                error_log.write(status.code, record.employee_id, record.raw_score, record.error_message())
+                if stats is not None:
+                    stats.add_rejected(record.department)
+                continue
+            record.grade = bands_for(record.department, bands, department_bands).grade(record.score)
+            if stats is not None:
+                stats.add_graded(record.department, record.score, record.grade)
+            yield record
+    finally:
+        error_log.close()
+
+
+def process_employee_records(
+    records: Iterable[EmployeeRecord],
+    errfile_path: str,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    error_sink: Optional[ErrorSink] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> list[EmployeeRecord]:
+    """Typed counterpart of process_reviews(): grades the valid records in place and returns them."""
+    return list(iter_graded_records(records, errfile_path, bands, department_bands, error_sink, stats))
+
+
+def write_employee_records(
+    records: Iterable[EmployeeRecord], output_file_path: str, output_format: Optional[str] = None
+) -> int:
+    """
+    - Writes graded records; plain CSV is written straight from the slots with csv.writer,
+      the other formats of src/writers.py go through EmployeeRecord.to_dict()
+    - The same file write_reviews() writes for the equivalent dict rows; no records gives an
+      empty file
+    - Returns the number of records written
+    """
+    if output_format_for(output_file_path, output_format) != "csv":
+        return write_reviews(map(EmployeeRecord.to_dict, records), output_file_path, output_format)
+    record_count = 0
+    with open(output_file_path, mode='w', newline='') as f:
+        writer = csv.writer(f)
+        rows = map(EmployeeRecord.as_row, records)
+        first = next(rows, None)
+        if first is None:
+            writer.writerow([])
+        else:
+            writer.writerow(OUTPUT_COLUMNS)
+            writer.writerow(first)
+            record_count = 1
+            while True:
+                batch = list(islice(rows, CSV_BATCH_SIZE))
+                if not batch:
+                    break
+                writer.writerows(batch)
+                record_count += len(batch)
+    print(f"[INFO] Saved {record_count} records to {output_file_path}")
+    return record_count
+
+
+def run_pipeline_records(
+    input_file_path: str,
+    output_file_path: str,
+    errfile_path: str,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    error_sink: Optional[ErrorSink] = None,
+    output_format: Optional[str] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> int:
+    """
+    - run_pipeline() on EmployeeRecord objects: iter_employee_records -> iter_graded_records
+      -> write_employee_records, streamed one record at a time
+    - Writes the same output file and error log as run_pipeline() for a file with the
+      EmployeeID, Name, Department, Score columns
+    - Returns the number of graded records written
+    """
+    records = iter_employee_records(input_file_path)
+    graded = iter_graded_records(records, errfile_path, bands, department_bands, error_sink, stats)
+    return write_employee_records(graded, output_file_path, output_format)
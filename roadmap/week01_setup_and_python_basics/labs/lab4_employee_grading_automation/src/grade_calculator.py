@@ -1,100 +1,284 @@
 import csv
 from datetime import datetime
+from typing import Iterable, Iterator, Optional
+
+from src.department_stats import DepartmentStats
+from src.error_sink import ErrorSink
+from src.grade_bands import DEFAULT_BANDS, GradeBands, bands_for, grade_records
+from src.writers import WRITERS, output_format as output_format_for
+
+# side field convert_score() adds to a row whose numeric score is out of range: the score
+# text as it appeared in the input, for the error sink's value column
+RAW_SCORE_FIELD = "_RawScore"
+
+def convert_score(row: dict) -> dict:
+    """
+    Converts row["Score"] in place: float if numeric, None if blank, otherwise the raw string ("NaN" included).
+    An out-of-range float also keeps its text in row[RAW_SCORE_FIELD].
+    """
+    score = row.get("Score", "").strip()
+
+    if score == "":
+        row["Score"] = None
+    else:
+        try:
+            value = float(score)
+        except:
+            value = score
+        if value != value:
+            # float() accepts "nan"; keep the text so it is rejected as non-numeric
+            value = score
+        elif not isinstance(value, str) and (value < 0 or value > 100):
+            row[RAW_SCORE_FIELD] = score
+        row["Score"] = value
+    return row
+
+def iter_reviews(file_path: str) -> Iterator[dict]:
+    """
+    - Streaming version of load_reviews(): yields one employee record at a time instead of building a list
+    - Score is converted the same way: float if numeric, None if blank, otherwise the raw string
+
+    Raises the following:
+    FileNotFoundError: If the file does not exist (when the first record is requested)
+    """
+    record_count: int = 0
+    with open(file_path, mode='r', newline='') as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            record_count += 1
+            convert_score(row)
+            yield row
+
+    print(f"[INFO] Loaded {record_count} records from {file_path}")
+
 def load_reviews(file_path:str) -> list[dict]:
     """
     - loads performance reviews from a csv file (one employee record per line)
     - Skips the header
     - Returns employee_record as list of dictonaries with Employee Id, Name, Department, and Score as keys and their corresponding values
-    
+    - Thin wrapper around iter_reviews(); prefer the generator for large files
+
     Raises the following:
     FileNotFoundError: If the file does not exist
     ValueError: If the file content is malformed
 
     """
-    employee_records:  list[dict] = []
-    record_count: int = 0
-    with open(file_path, mode='r', newline='') as csvfile: # this line will automatically raise the FileNotFoundError if no file is found( Beauty of with open....)
-        reader = csv.DictReader(csvfile)
-        #try to convert score to float before appending it to the employee_records list
-        for row in reader:
-            record_count += 1   
-            score = row.get("Score", "").strip()
-
-            if score == "":
-                row["Score"] = None
-            else:
-                try:
-                    row["Score"]=float(score)
-                except:
-                    row["Score"]=score
-            employee_records.append(row)
+    return list(iter_reviews(file_path))
 
-    print(f"[INFO] Loaded {record_count} records from {file_path}")
-    return employee_records
-    #raise NotImplementedError("Function 'load_reviews' is not yet implemented.")
-
-def assign_grade(score:float)->str:
-    if score >= 90:
-        grade = "A"
-    elif score >= 80:
-        grade = "B"
-    elif score >= 70:
-        grade = "C"
-    elif score >= 60:
-        grade = "D"
-    else:
-        grade = "F"
-    return grade
-
-def process_reviews(employee_records: list[dict], errfile_path:str) -> list[dict]:
-    processed_records = []
-    errors = []
-    for row in employee_records:
-        score = row.get("Score")
-        # Case 1 : Missing Score
-        if score is None:
-            errors.append(f"[ERR] Missing score for employee {row.get('EmployeeID')}.")
-            continue
-        # Case 2: non-numeric score
-        if isinstance(score, str):
-            errors.append(f"[ERR] Non-numeric score for employee {row.get('EmployeeID')}:{score}.")
-            continue
-        # Case 3: Numeric but out of range score
-        if(score < 0 or score > 100):
-            errors.append(f"[ERR] Invalid score for employee {row.get('EmployeeID')}:{score}. Score must be between 0-100")
-            continue 
+def assign_grade(score:float, bands: GradeBands = DEFAULT_BANDS)->str:
+    """
+    - Returns the letter grade for one score (A >= 90, B >= 80, C >= 70, D >= 60, otherwise F by default)
+    - Pass other GradeBands for a different curve
+    Raises:
+        TypeError: if score is not a number
+    """
+    return bands.grade(score)
+
+def score_error_code(row: dict) -> Optional[str]:
+    """Returns "missing", "non_numeric" or "out_of_range" for a score that cannot be graded, or None if it is valid."""
+    score = row.get("Score")
+    # Case 1 : Missing Score
+    if score is None:
+        return "missing"
+    # Case 2: non-numeric score ("NaN" parses as a float but is not a score)
+    if isinstance(score, str) or score != score:
+        return "non_numeric"
+    # Case 3: Numeric but out of range score
+    if(score < 0 or score > 100):
+        return "out_of_range"
+    return None
 
+def error_message(code: str, row: dict) -> str:
+    """Returns the error log line for a record rejected with score_error_code()."""
+    if code == "missing":
+        return f"[ERR] Missing score for employee {row.get('EmployeeID')}."
+    if code == "non_numeric":
+        return f"[ERR] Non-numeric score for employee {row.get('EmployeeID')}:{row.get('Score')}."
+    return f"[ERR] Invalid score for employee {row.get('EmployeeID')}:{row.get('Score')}. Score must be between 0-100"
+
+def error_value(row: dict):
+    """The score of a rejected record as the error sink records it: the input text if convert_score() kept it."""
+    return row.get(RAW_SCORE_FIELD, row.get("Score"))
+
+def score_error(row: dict) -> Optional[str]:
+    """Returns the error message for a record whose score cannot be graded, or None if it is valid."""
+    code = score_error_code(row)
+    return None if code is None else error_message(code, row)
+
+class _ErrorLog:
+    """
+    Destination of rejected records: error_sink if given, otherwise the plain-text
+    {errfile_path}_{timestamp}.txt log, created on the first error.
+    """
+
+    def __init__(self, errfile_path: str, error_sink: Optional[ErrorSink] = None):
+        self.errfile_path = errfile_path
+        self.error_sink = error_sink
+        self._file = None
+
+    def write(self, code: str, employee_id, score, message: str) -> None:
+        if self.error_sink is not None:
+            self.error_sink.record(code, employee_id, score, message)
+            return
+        if self._file is None:
+            timestamp = datetime.now().strftime("%m-%d-%Y_%H:%M:%S")
+            self._file = open(f"{self.errfile_path}_{timestamp}.txt", "w")
+        self._file.write(message + "\n")
+
+    def write_all(self, errors: Iterable[tuple]) -> None:
+        """Writes (code, EmployeeID, score, message) errors in order."""
+        for error in errors:
+            self.write(*error)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+def _iter_valid_reviews(
+    employee_records: Iterable[dict],
+    errfile_path: str,
+    error_sink: Optional[ErrorSink] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> Iterator[dict]:
+    """
+    Yields the records whose score can be graded. The others are written to error_sink
+    if given, otherwise to {errfile_path}_{timestamp}.txt, and counted in stats if given.
+    """
+    error_log = _ErrorLog(errfile_path, error_sink)
+    try:
+        for row in employee_records:
+            code = score_error_code(row)
+            if code is None:
+                yield row
+                continue
+            error_log.write(code, row.get("EmployeeID"), error_value(row), error_message(code, row))
+            if stats is not None:
+                stats.add_error(row)
+    finally:
+        error_log.close()
+
+def iter_processed_reviews(
+    employee_records: Iterable[dict],
+    errfile_path: str,
+    in_place: bool = False,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    error_sink: Optional[ErrorSink] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> Iterator[dict]:
+    """
+    - Streaming version of process_reviews(): yields each graded record as soon as it is validated
+    - Errors are written to the error file as they occur; the file is only created if there is an error
+    - in_place=True adds "Grade" to the incoming dict instead of copying it (safe when the records
+      come straight from iter_reviews() and nothing else holds them)
+    - department_bands maps a Department to its own GradeBands; other departments use bands
+    - error_sink, if given, receives the rejected records instead of the text error file
+    - stats, if given, accumulates per-Department statistics of the graded and rejected records
+    """
+    for row in _iter_valid_reviews(employee_records, errfile_path, error_sink, stats):
         # Valid Score -> assign grade
-        grade = assign_grade(score)
-        processed_records.append({**row, "Grade":grade})
-    #only write to error file IF error exists
-    if errors:
-        timestamp = datetime.now().strftime("%m-%d-%Y_%H:%M:%S")
-        error_file = f"{errfile_path}_{timestamp}.txt"
-        with open(error_file, "w") as f:
-            for e in errors:
-                f.write(e+"\n")
-
-    return processed_records
-
-
-def save_processed_reviews(processed_records: list[dict], output_file_path: str) -> None:
-
-    record_count : int = 0
-    with open(output_file_path, mode='w', newline='') as csvfile:
-        fieldnames = list(processed_records[0].keys()) if processed_records else []
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-       
-        for record in processed_records:
-            record_count += 1
-            writer.writerow(record)
-    print(f"[INFO] Saved {record_count} records to {output_file_path}")
-           
-    
+        grade = bands_for(row.get("Department"), bands, department_bands).grade(row["Score"])
+        if in_place:
+            row["Grade"] = grade
+        else:
+            row = {**row, "Grade": grade}
+        if stats is not None:
+            stats.add(row)
+        yield row
+
+def process_reviews(
+    employee_records: list[dict],
+    errfile_path:str,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    workers: int = 1,
+    error_sink: Optional[ErrorSink] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> list[dict]:
+    """
+    - Validates each record, logs invalid records to {errfile_path}_{timestamp}.txt and grades
+      all valid records in one batch call (grade_records), with per-department bands if given
+    - Returns the graded records as a new list (the input dicts are not modified)
+    - workers > 1 grades chunks of records in a process pool (process_reviews_parallel());
+      the result and the error log keep the input order
+    - error_sink, if given, receives the rejected records instead of the text error file
+    - stats, if given, accumulates per-Department statistics in the same pass
+      (see src/department_stats.py)
+    """
+    if workers > 1:
+        # imported here because parallel_grading imports this module
+        from src.parallel_grading import process_reviews_parallel
+        return process_reviews_parallel(
+            employee_records, errfile_path, workers, bands, department_bands, error_sink=error_sink, stats=stats
+        )
+    valid_records = list(_iter_valid_reviews(employee_records, errfile_path, error_sink, stats))
+    grades = grade_records(valid_records, bands, department_bands)
+    graded = [{**row, "Grade": grade} for row, grade in zip(valid_records, grades)]
+    if stats is not None:
+        for row in graded:
+            stats.add(row)
+    return graded
+
 
+def write_reviews(records: Iterable[dict], output_file_path: str, output_format: Optional[str] = None) -> int:
+    """
+    - Writes records as they arrive, so the input can be a generator of any length
+    - The columns come from the first record's keys; no records gives an empty file
+    - output_format picks a writer from src/writers.py: "csv" (default), "csv.gz", "csv.xz" or
+      "columnar"; if omitted it follows the extension (.csv.gz, .csv.xz, .col)
+    - Returns the number of records written
+    """
+    writer = WRITERS[output_format_for(output_file_path, output_format)]
+    record_count = writer(records, output_file_path)
+    print(f"[INFO] Saved {record_count} records to {output_file_path}")
+    return record_count
 
-             
-   
+def save_processed_reviews(
+    processed_records: list[dict], output_file_path: str, workers: int = 1, output_format: Optional[str] = None
+) -> None:
+    """
+    - Writes graded records to a file; thin wrapper around write_reviews()
+    - workers > 1 formats chunks of rows in a process pool and writes them in order (plain CSV only)
+    Raises:
+        ValueError: if workers > 1 is combined with an output format other than plain CSV
+    """
+    if workers > 1:
+        _check_parallel_format(output_file_path, output_format)
+        from src.parallel_grading import save_processed_reviews_parallel
+        save_processed_reviews_parallel(processed_records, output_file_path, workers)
+        return
+    write_reviews(processed_records, output_file_path, output_format)
 
+def _check_parallel_format(output_file_path: str, output_format: Optional[str]) -> None:
+    if output_format_for(output_file_path, output_format) != "csv":
+        raise ValueError("Parallel mode only writes plain CSV output.")
 
+def run_pipeline(
+    input_file_path: str,
+    output_file_path: str,
+    errfile_path: str,
+    workers: int = 1,
+    error_sink: Optional[ErrorSink] = None,
+    output_format: Optional[str] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> int:
+    """
+    - Streams reviews from input_file_path through grading into output_file_path
+      (iter_reviews -> iter_processed_reviews -> write_reviews), one record at a time,
+      so peak memory does not grow with the size of the input
+    - workers > 1 grades byte-range shards of the file in a process pool instead
+      (grade_file_parallel()), with the same output file and error log
+    - error_sink, if given, receives the rejected records instead of the text error file
+    - output_format is passed to write_reviews() (plain CSV only with workers > 1)
+    - stats, if given, accumulates per-Department statistics while grading
+    - Returns the number of graded records written
+    """
+    if workers > 1:
+        _check_parallel_format(output_file_path, output_format)
+        from src.parallel_grading import grade_file_parallel
+        return grade_file_parallel(
+            input_file_path, output_file_path, errfile_path, workers, error_sink=error_sink, stats=stats
+        )
+    records = iter_reviews(input_file_path)
+    graded = iter_processed_reviews(records, errfile_path, in_place=True, error_sink=error_sink, stats=stats)
+    return write_reviews(graded, output_file_path, output_format)
@@ -0,0 +1,200 @@
+import csv
+import math
+import os
+import tempfile
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.partitions import partition_files, partition_of
+
+# memory budget of the in-memory hash table before the join falls back to partitions on disk
+DEFAULT_MEMORY_LIMIT = 512 * 1024 * 1024
+# bytes of Python lists and strings per byte of CSV text in the hash table (about 12
+# measured with benchmarks/bench_hr_join.py)
+BYTES_PER_FILE_BYTE = 12
+# prefix of a master column whose name is also a review column, e.g. HR_Department
+CLASH_PREFIX = "HR_"
+
+
+class _Side:
+    """One input of the join: path, header and the index of the join key."""
+
+    def __init__(self, label: str, path: str, key: str):
+        self.label = label
+        self.path = path
+        with open(path, mode='r', newline='') as f:
+            self.header = next(csv.reader(f), [])
+        if key not in self.header:
+            raise ValueError(f"{path} has no {key} column")
+        self.key_index = self.header.index(key)
+
+    def rows(self, path: Optional[str] = None) -> Iterator[list[str]]:
+        # the input itself without its header, or one of its partition files
+        with open(path or self.path, mode='r', newline='') as f:
+            reader = csv.reader(f)
+            if path is None:
+                next(reader, None)
+            for fields in reader:
+                if fields:
+                    yield fields
+
+
+class _Report:
+    """Optional CSV of the unmatched rows of one side, plus their count."""
+
+    def __init__(self, path: Optional[str], header: list[str]):
+        self.count = 0
+        self._file = None
+        if path is not None:
+            self._file = open(path, mode='w', newline='')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(header)
+
+    def write(self, rows: Iterable[list[str]]) -> None:
+        for fields in rows:
+            self.count += 1
+            if self._file is not None:
+                self._writer.writerow(fields)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def _write_partitions(side: _Side, partitions: int, work_dir: str) -> list[str]:
+    with partition_files(work_dir, side.label, partitions) as (paths, files):
+        writers = [csv.writer(f) for f in files]
+        key_index = side.key_index
+        for fields in side.rows():
+            key = fields[key_index] if key_index < len(fields) else ""
+            writers[partition_of(key, partitions)].writerow(fields)
+    return paths
+
+
+def _hash_join(
+    build: _Side,
+    build_rows: Iterable[list[str]],
+    probe: _Side,
+    probe_rows: Iterable[list[str]],
+    emit: Callable[[list[str], list[str]], None],
+    unmatched: dict[str, _Report],
+) -> int:
+    """Joins one pair of inputs (or partitions); returns the number of joined rows."""
+    table: dict[str, list[list[str]]] = {}
+    build_key = build.key_index
+    for fields in build_rows:
+        key = fields[build_key] if build_key < len(fields) else ""
+        rows = table.get(key)
+        if rows is None:
+            table[key] = [fields]
+        else:
+            rows.append(fields)
+
+    matched_keys: set[str] = set()
+    probe_key = probe.key_index
+    joined = 0
+    for fields in probe_rows:
+        key = fields[probe_key] if probe_key < len(fields) else ""
+        rows = table.get(key)
+        if rows is None:
+            unmatched[probe.label].write([fields])
+            continue
+        matched_keys.add(key)
+        for build_fields in rows:
+            emit(build_fields, fields)
+            joined += 1
+    for key, rows in table.items():
+        if key not in matched_keys:
+            unmatched[build.label].write(rows)
+    return joined
+
+
+def join_with_master(
+    graded_file_path: str,
+    master_file_path: str,
+    output_file_path: str,
+    key: str = "EmployeeID",
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    partitions: Optional[int] = None,
+    tmp_dir: Optional[str] = None,
+    unmatched_reviews_path: Optional[str] = None,
+    unmatched_master_path: Optional[str] = None,
+) -> dict:
+    """
+    - Inner join of a graded reviews CSV with an HR master CSV (manager, location, band, ...)
+      on `key`; each output row is the review's columns followed by the master's other columns.
+      A master column whose name is also a review column is renamed with the HR_ prefix
+    - Hash join: a hash table is built on the smaller file and the larger file is streamed
+      through it, one row at a time
+    - When the smaller file would need more than memory_limit bytes in memory (estimated from
+      its size), it becomes a partitioned (Grace) hash join: both files are split into temp
+      files by a crc32 hash of the key and joined one partition pair at a time. `partitions`
+      forces a number of partitions. The temp files are removed afterwards
+    - Rows of either side without a match are counted, and written to unmatched_reviews_path /
+      unmatched_master_path (with the input's header) if given
+    - Output order follows the streamed file, partition by partition in a Grace join
+    - Returns {"joined", "unmatched_reviews", "unmatched_master", "build_side", "partitions"}
+    Raises:
+        FileNotFoundError: if either input does not exist
+        ValueError: if an input has no `key` column
+    """
+    reviews = _Side("reviews", graded_file_path, key)
+    master = _Side("master", master_file_path, key)
+    if os.path.getsize(master_file_path) <= os.path.getsize(graded_file_path):
+        build, probe = master, reviews
+    else:
+        build, probe = reviews, master
+    if partitions is None:
+        estimate = os.path.getsize(build.path) * BYTES_PER_FILE_BYTE
+        partitions = max(1, math.ceil(estimate / memory_limit))
+    if partitions < 1:
+        raise ValueError(f"partitions must be at least 1, got {partitions}")
+
+    master_columns = [i for i in range(len(master.header)) if i != master.key_index]
+    master_names = [
+        CLASH_PREFIX + master.header[i] if master.header[i] in reviews.header else master.header[i]
+        for i in master_columns
+    ]
+    unmatched = {
+        "reviews": _Report(unmatched_reviews_path, reviews.header),
+        "master": _Report(unmatched_master_path, master.header),
+    }
+
+    with open(output_file_path, mode='w', newline='') as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(reviews.header + master_names)
+
+        def emit(build_fields: list[str], probe_fields: list[str]) -> None:
+            review_fields, master_fields = (
+                (probe_fields, build_fields) if build is master else (build_fields, probe_fields)
+            )
+            writer.writerow(review_fields + [master_fields[i] if i < len(master_fields) else "" for i in master_columns])
+
+        try:
+            if partitions == 1:
+                joined = _hash_join(build, build.rows(), probe, probe.rows(), emit, unmatched)
+            else:
+                joined = 0
+                with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+                    build_parts = _write_partitions(build, partitions, work_dir)
+                    probe_parts = _write_partitions(probe, partitions, work_dir)
+                    for build_part, probe_part in zip(build_parts, probe_parts):
+                        joined += _hash_join(
+                            build, build.rows(build_part), probe, probe.rows(probe_part), emit, unmatched
+                        )
+        finally:
+            for report in unmatched.values():
+                report.close()
+
+    result = {
+        "joined": joined,
+        "unmatched_reviews": unmatched["reviews"].count,
+        "unmatched_master": unmatched["master"].count,
+        "build_side": build.label,
+        "partitions": partitions,
+    }
+    print(
+        f"[INFO] Joined {joined} reviews with {master_file_path} ({build.label} hashed, "
+        f"{partitions} partition{'s' if partitions > 1 else ''}); unmatched: "
+        f"{result['unmatched_reviews']} reviews, {result['unmatched_master']} master rows"
+    )
+    return result
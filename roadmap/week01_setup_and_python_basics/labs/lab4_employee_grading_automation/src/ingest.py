@@ -0,0 +1,216 @@
+import asyncio
+import csv
+import glob
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.department_stats import DepartmentStats
+from src.error_sink import ErrorSink
+from src.grade_bands import DEFAULT_BANDS, GradeBands
+from src.grade_calculator import convert_score, iter_processed_reviews, write_reviews
+
+# records read from a source per thread-pool call and per queue item
+DEFAULT_BATCH_SIZE = 5_000
+# parsed batches waiting for the grading stage; readers block once the queue is full
+DEFAULT_MAX_BATCHES = 8
+# files read at the same time (threads of the reader pool)
+DEFAULT_READERS = 4
+
+
+class SourceProgress:
+    """Ingestion progress of one review file, passed to the on_progress callback."""
+
+    __slots__ = ("path", "region", "records", "batches", "done")
+
+    def __init__(self, path: str, region: str):
+        self.path = path
+        self.region = region
+        self.records = 0
+        self.batches = 0
+        self.done = False
+
+    def __repr__(self) -> str:
+        state = "done" if self.done else "reading"
+        return f"SourceProgress({self.path!r}, region={self.region!r}, records={self.records}, {state})"
+
+
+def print_progress(progress: SourceProgress) -> None:
+    """Default on_progress callback: one line per finished source."""
+    if progress.done:
+        print(f"[INFO] Ingested {progress.records} records from {progress.path} (region {progress.region or '-'})")
+
+
+def discover_review_files(input_dir: str, pattern: str = "*.csv", exclude: Iterable[str] = ()) -> list[str]:
+    """
+    Returns the review files matching pattern in input_dir and its sub-directories
+    (one directory per region), in sorted order, leaving out the paths in exclude
+    (e.g. the pipeline's own output file when it is written inside input_dir).
+    Raises:
+        FileNotFoundError: if input_dir does not exist
+    """
+    if not os.path.isdir(input_dir):
+        raise FileNotFoundError(f"Input directory not found: {input_dir}")
+    excluded = {os.path.abspath(path) for path in exclude}
+    paths = glob.glob(os.path.join(input_dir, "**", pattern), recursive=True)
+    return sorted(path for path in paths if os.path.abspath(path) not in excluded)
+
+
+def _region(path: str, input_dir: Optional[str]) -> str:
+    if input_dir is None:
+        return os.path.basename(os.path.dirname(path))
+    region = os.path.relpath(os.path.dirname(path), input_dir)
+    return "" if region == "." else region
+
+
+def _open_source(path: str):
+    csvfile = open(path, mode='r', newline='')
+    reader = csv.DictReader(csvfile)
+    reader.fieldnames  # reads the header line
+    return csvfile, reader
+
+
+def _read_batch(reader: csv.DictReader, batch_size: int) -> list[dict]:
+    return [convert_score(row) for row in islice(reader, batch_size)]
+
+
+async def _read_source(
+    path: str,
+    progress: SourceProgress,
+    queue: asyncio.Queue,
+    executor: ThreadPoolExecutor,
+    limit: asyncio.Semaphore,
+    columns: list,
+    batch_size: int,
+    on_progress: Callable[[SourceProgress], None],
+) -> None:
+    loop = asyncio.get_running_loop()
+    async with limit:
+        csvfile, reader = await loop.run_in_executor(executor, _open_source, path)
+        try:
+            fieldnames = reader.fieldnames
+            if not fieldnames:
+                # an empty file has no header, so no columns to check: skip it
+                print(f"[WARN] Skipping {path}: no header line")
+                progress.done = True
+                on_progress(progress)
+                return
+            if not columns:
+                columns.append(fieldnames)
+            elif fieldnames != columns[0]:
+                raise ValueError(f"{path} has columns {fieldnames}, expected {columns[0]}")
+            while True:
+                batch = await loop.run_in_executor(executor, _read_batch, reader, batch_size)
+                if not batch:
+                    break
+                # waits here while the queue is full: the grading stage sets the pace
+                await queue.put(batch)
+                progress.records += len(batch)
+                progress.batches += 1
+                on_progress(progress)
+        finally:
+            csvfile.close()
+    progress.done = True
+    on_progress(progress)
+
+
+def _drain(queue: asyncio.Queue, loop: asyncio.AbstractEventLoop) -> Iterator[dict]:
+    # runs in the grading thread: takes batches off the event loop's queue until the None sentinel
+    while True:
+        batch = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+        if batch is None:
+            return
+        yield from batch
+
+
+async def ingest_reviews(
+    paths: list[str],
+    output_file_path: str,
+    errfile_path: str,
+    input_dir: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_batches: int = DEFAULT_MAX_BATCHES,
+    readers: int = DEFAULT_READERS,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    error_sink: Optional[ErrorSink] = None,
+    output_format: Optional[str] = None,
+    stats: Optional[DepartmentStats] = None,
+    on_progress: Callable[[SourceProgress], None] = print_progress,
+) -> dict[str, SourceProgress]:
+    """
+    - Reads many review files concurrently and grades them into one output file
+    - Up to `readers` files are read at a time; opening and parsing run in a thread pool,
+      batch_size records per call, so the event loop never blocks on disk
+    - Parsed batches go through an asyncio.Queue of max_batches: when grading and writing
+      fall behind, readers wait instead of buffering, and memory stays around
+      max_batches * batch_size records
+    - Grading and writing is the streaming pipeline (iter_processed_reviews -> write_reviews)
+      running in one thread, so there is a single output file and error log
+    - Records of one file keep their order; records of different files are interleaved in
+      arrival order. All files must have the same columns; a file without a header line
+      (e.g. empty) is skipped with a warning
+    - on_progress(SourceProgress) is called after each batch and when a source is finished;
+      the region is the file's directory relative to input_dir
+    - Returns {path: SourceProgress}
+    Raises:
+        FileNotFoundError: if a file does not exist
+        ValueError: if a file's columns differ from the first file's
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_batches)
+    limit = asyncio.Semaphore(readers)
+    columns: list = []
+    progress = {path: SourceProgress(path, _region(path, input_dir)) for path in paths}
+
+    def grade_and_write() -> int:
+        records = _drain(queue, loop)
+        graded = iter_processed_reviews(
+            records, errfile_path, in_place=True, bands=bands, department_bands=department_bands,
+            error_sink=error_sink, stats=stats,
+        )
+        return write_reviews(graded, output_file_path, output_format)
+
+    with ThreadPoolExecutor(max_workers=readers) as executor:
+        writer = loop.run_in_executor(None, grade_and_write)
+        tasks = [
+            asyncio.create_task(_read_source(path, progress[path], queue, executor, limit, columns, batch_size, on_progress))
+            for path in paths
+        ]
+        reading = asyncio.gather(*tasks)
+        try:
+            await asyncio.wait({reading, writer}, return_when=asyncio.FIRST_COMPLETED)
+            if writer.done():
+                await writer  # before the sentinel, the grading stage can only stop by raising
+            await reading
+        finally:
+            # stop the other readers if one failed, then let the grading thread finish what was queued
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if not writer.done():
+                await queue.put(None)
+                await writer
+    return progress
+
+
+def run_ingestion(
+    input_dir: str,
+    output_file_path: str,
+    errfile_path: str,
+    pattern: str = "*.csv",
+    **options,
+) -> dict[str, SourceProgress]:
+    """
+    - Synchronous entry point: grades every file matching pattern under input_dir
+      (see discover_review_files() and ingest_reviews(), which takes the other options)
+    - output_file_path is never read as an input, even when it is inside input_dir and
+      matches pattern (e.g. left over from a previous run)
+    - Returns {path: SourceProgress}
+    """
+    paths = discover_review_files(input_dir, pattern, exclude=[output_file_path])
+    progress = asyncio.run(ingest_reviews(paths, output_file_path, errfile_path, input_dir=input_dir, **options))
+    total = sum(source.records for source in progress.values())
+    print(f"[INFO] Ingested {total} records from {len(paths)} files in {input_dir}")
+    return progress
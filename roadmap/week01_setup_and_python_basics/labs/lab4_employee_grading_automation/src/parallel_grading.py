@@ -0,0 +1,231 @@
+import csv
+import io
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.department_stats import DepartmentStats
+from src.error_sink import ErrorSink
+from src.grade_bands import DEFAULT_BANDS, GradeBands, grade_records
+from src.grade_calculator import _ErrorLog, convert_score, error_message, error_value, score_error_code
+
+# rows per task when a list of records is split across workers
+DEFAULT_CHUNK_SIZE = 50_000
+# largest default byte-range shard, so each worker only holds a few MB of records at a time
+DEFAULT_SHARD_BYTES = 8 * 1024 * 1024
+
+
+def _chunks(records: list, chunk_size: int) -> list[list]:
+    return [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+
+
+def _grade_chunk(
+    records: list[dict],
+    bands: GradeBands,
+    department_bands: Optional[dict[str, GradeBands]],
+    with_stats: bool = False,
+) -> tuple[list[dict], list[tuple], Optional[DepartmentStats]]:
+    """
+    Validates and grades one shard. Returns the graded records and the
+    (code, EmployeeID, score, message) errors, both in input order, and with_stats the
+    shard's DepartmentStats for the parent to merge.
+    """
+    stats = DepartmentStats() if with_stats else None
+    valid: list[dict] = []
+    errors: list[tuple] = []
+    for row in records:
+        code = score_error_code(row)
+        if code is None:
+            valid.append(row)
+        else:
+            errors.append((code, row.get("EmployeeID"), error_value(row), error_message(code, row)))
+            if stats is not None:
+                stats.add_error(row)
+    grades = grade_records(valid, bands, department_bands)
+    graded = [{**row, "Grade": grade} for row, grade in zip(valid, grades)]
+    if stats is not None:
+        for row in graded:
+            stats.add(row)
+    return graded, errors, stats
+
+
+def process_reviews_parallel(
+    employee_records: list[dict],
+    errfile_path: str,
+    workers: Optional[int] = None,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    error_sink: Optional[ErrorSink] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> list[dict]:
+    """
+    - process_reviews() across a process pool: the records are split into chunks of
+      chunk_size, each chunk is validated and graded in a worker, and the results are
+      merged in chunk order, so the graded rows and the error log are in input order
+    - Every record is pickled to a worker and back, so this only pays off when grading
+      costs more than the copy; for files, grade_file_parallel() avoids the copy
+    - stats, if given, receives the merged per-chunk DepartmentStats
+    """
+    graded: list[dict] = []
+    error_log = _ErrorLog(errfile_path, error_sink)
+    chunks = _chunks(employee_records, chunk_size)
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map() yields results in submission order, whatever order the workers finish in
+            for chunk_graded, chunk_errors, chunk_stats in pool.map(
+                _grade_chunk, chunks, [bands] * len(chunks), [department_bands] * len(chunks),
+                [stats is not None] * len(chunks),
+            ):
+                graded.extend(chunk_graded)
+                error_log.write_all(chunk_errors)
+                if stats is not None:
+                    stats.merge(chunk_stats)
+    finally:
+        error_log.close()
+    return graded
+
+
+def _format_chunk(records: list[dict], fieldnames: list[str]) -> str:
+    buffer = io.StringIO(newline="")
+    csv.DictWriter(buffer, fieldnames=fieldnames).writerows(records)
+    return buffer.getvalue()
+
+
+def save_processed_reviews_parallel(
+    processed_records: list[dict],
+    output_file_path: str,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    - save_processed_reviews() across a process pool: workers format chunks of rows as CSV
+      text and the parent writes the chunks in order, giving the same file as write_reviews()
+    - Returns the number of records written
+    """
+    fieldnames = list(processed_records[0].keys()) if processed_records else []
+    chunks = _chunks(processed_records, chunk_size)
+    with open(output_file_path, mode='w', newline='') as csvfile:
+        csv.DictWriter(csvfile, fieldnames=fieldnames).writeheader()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for text in pool.map(_format_chunk, chunks, [fieldnames] * len(chunks)):
+                csvfile.write(text)
+    print(f"[INFO] Saved {len(processed_records)} records to {output_file_path}")
+    return len(processed_records)
+
+
+def shard_ranges(file_path: str, shards: int) -> tuple[list[str], list[tuple[int, int]]]:
+    """
+    - Splits a reviews CSV into at most `shards` byte ranges after the header, each
+      starting at the beginning of a line and ending after a whole line
+    - Returns (header fieldnames, [(start, end)]) in file order
+    - Assumes no quoted field contains a newline, which holds for the reviews format
+    """
+    with open(file_path, "rb") as f:
+        header_line = f.readline()
+        header_end = f.tell()
+        size = os.fstat(f.fileno()).st_size
+        boundaries = [header_end]
+        for i in range(1, shards):
+            target = header_end + (size - header_end) * i // shards
+            if target <= boundaries[-1]:
+                continue
+            # reading from one byte before the target keeps a line that starts exactly there
+            f.seek(target - 1)
+            f.readline()
+            if boundaries[-1] < f.tell() < size:
+                boundaries.append(f.tell())
+        boundaries.append(size)
+    fieldnames = next(csv.reader([header_line.decode()]), [])
+    return fieldnames, [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _grade_shard(
+    file_path: str,
+    fieldnames: list[str],
+    start: int,
+    end: int,
+    shard_path: str,
+    bands: GradeBands,
+    department_bands: Optional[dict[str, GradeBands]],
+    with_stats: bool = False,
+) -> tuple[int, int, list[tuple], Optional[DepartmentStats]]:
+    """Reads, validates and grades one byte range and writes its graded rows (no header) to shard_path."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        text = f.read(end - start).decode()
+    records = [convert_score(row) for row in csv.DictReader(io.StringIO(text, newline=""), fieldnames=fieldnames)]
+    graded, errors, stats = _grade_chunk(records, bands, department_bands, with_stats)
+    with open(shard_path, mode='w', newline='') as shard_file:
+        csv.DictWriter(shard_file, fieldnames=fieldnames + ["Grade"]).writerows(graded)
+    return len(records), len(graded), errors, stats
+
+
+def grade_file_parallel(
+    input_file_path: str,
+    output_file_path: str,
+    errfile_path: str,
+    workers: Optional[int] = None,
+    shards: Optional[int] = None,
+    bands: GradeBands = DEFAULT_BANDS,
+    department_bands: Optional[dict[str, GradeBands]] = None,
+    tmp_dir: Optional[str] = None,
+    error_sink: Optional[ErrorSink] = None,
+    stats: Optional[DepartmentStats] = None,
+) -> int:
+    """
+    - Parallel run_pipeline(): splits the input CSV into byte-range shards (shard_ranges()),
+      and each worker process reads, validates and grades its own shard and writes it to a
+      temp file, so no records are pickled between processes
+    - The shard files are concatenated in shard order and the per-shard errors are written
+      (to error_sink if given) in the same order, so the output CSV and error log match
+      run_pipeline()'s
+    - shards defaults to at least 4 per worker, so one slow shard does not leave the other
+      workers idle, and to shards of at most DEFAULT_SHARD_BYTES, so worker memory stays bounded
+    - stats, if given, receives the merged DepartmentStats of all shards
+    - Returns the number of graded records written
+    Raises:
+        FileNotFoundError: if the input file does not exist
+    """
+    workers = workers or os.cpu_count() or 1
+    if shards is None:
+        shards = max(4 * workers, -(-os.path.getsize(input_file_path) // DEFAULT_SHARD_BYTES))
+    fieldnames, ranges = shard_ranges(input_file_path, shards)
+    record_count = 0
+    graded_count = 0
+    error_log = _ErrorLog(errfile_path, error_sink)
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        shard_paths = [os.path.join(work_dir, f"shard-{i}.csv") for i in range(len(ranges))]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _grade_shard, input_file_path, fieldnames, start, end, path, bands, department_bands,
+                        stats is not None,
+                    )
+                    for (start, end), path in zip(ranges, shard_paths)
+                ]
+                # collect in shard order, whatever order the shards finish in
+                for future in futures:
+                    shard_records, shard_graded, shard_errors, shard_stats = future.result()
+                    record_count += shard_records
+                    graded_count += shard_graded
+                    error_log.write_all(shard_errors)
+                    if stats is not None:
+                        stats.merge(shard_stats)
+        finally:
+            error_log.close()
+        print(f"[INFO] Loaded {record_count} records from {input_file_path}")
+
+        with open(output_file_path, mode='w', newline='') as csvfile:
+            if graded_count:
+                csv.DictWriter(csvfile, fieldnames=fieldnames + ["Grade"]).writeheader()
+            else:
+                csv.DictWriter(csvfile, fieldnames=[]).writeheader()
+            for path in shard_paths:
+                with open(path, newline='') as shard_file:
+                    shutil.copyfileobj(shard_file, csvfile)
+    print(f"[INFO] Saved {graded_count} records to {output_file_path}")
+    return graded_count
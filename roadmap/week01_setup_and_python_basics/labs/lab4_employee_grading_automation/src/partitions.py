@@ -0,0 +1,28 @@
+import os
+import zlib
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+def partition_of(key: Optional[str], partitions: int) -> int:
+    """
+    Returns the partition (0 .. partitions - 1) of a key; None goes with "".
+    crc32 rather than hash(): str hashes are salted per process, so the same key must not
+    land in different partitions depending on the process that wrote it.
+    """
+    return zlib.crc32((key or "").encode()) % partitions
+
+
+@contextmanager
+def partition_files(work_dir: str, label: str, partitions: int) -> Iterator[tuple[list[str], list]]:
+    """
+    Opens {work_dir}/{label}-{i}.csv for writing, one per partition, and yields (paths, files);
+    the files are closed on exit, the paths stay for reading back.
+    """
+    paths = [os.path.join(work_dir, f"{label}-{i}.csv") for i in range(partitions)]
+    files = [open(path, "w", newline="") for path in paths]
+    try:
+        yield paths, files
+    finally:
+        for f in files:
+            f.close()
@@ -0,0 +1,50 @@
+import csv
+
+import pytest
+
+from src.dedup import dedup_records, run_pipeline_dedup
+from src.grade_calculator import load_reviews
+from tests.test_pipeline import write_reviews_csv
+
+def test_policies_pick_one_record_per_employee():
+    records = [
+        {"EmployeeID": "E1", "Name": "A", "Department": "X", "Score": 70.0},
+        {"EmployeeID": "E2", "Name": "B", "Department": "X", "Score": 80.0},
+        {"EmployeeID": "E1", "Name": "A", "Department": "X", "Score": 95.0},
+        {"EmployeeID": "E1", "Name": "A", "Department": "X", "Score": "abc"},
+        {"EmployeeID": "E2", "Name": "B", "Department": "X", "Score": 150.0},
+    ]
+    latest = dedup_records(records, "latest")
+    assert [(row["EmployeeID"], row["Score"]) for row in latest] == [("E1", "abc"), ("E2", 150.0)]
+    highest = dedup_records(records, "highest_score")
+    assert [(row["EmployeeID"], row["Score"]) for row in highest] == [("E1", 95.0), ("E2", 80.0)]
+    first = dedup_records(records, "first")
+    assert first == [records[0], records[1]]
+    with pytest.raises(ValueError):
+        dedup_records(records, "newest")
+
+@pytest.mark.parametrize("policy", ["latest", "highest_score", "first"])
+def test_spilled_dedup_matches_in_memory(tmp_path, policy):
+    older, newer = tmp_path / "older.csv", tmp_path / "newer.csv"
+    write_reviews_csv(older, 300)
+    write_reviews_csv(newer, 450)  # E000000..E000299 again, plus 150 new employees
+    records = load_reviews(str(older)) + load_reviews(str(newer))
+    # rescore some of the repeated employees so that the policies disagree
+    for i, row in enumerate(records[300:400]):
+        row["Score"] = float(i % 101)
+
+    in_memory = dedup_records(records, policy)
+    spilled = dedup_records(records, policy, partitions=4, tmp_dir=str(tmp_path))
+    assert len(in_memory) == 450
+    key = lambda row: row["EmployeeID"]
+    assert sorted(spilled, key=key) == sorted(in_memory, key=key)
+    assert sorted(tmp_path.iterdir()) == [newer, older]  # the spill files are gone
+
+def test_pipeline_grades_each_employee_once(tmp_path):
+    older, newer = tmp_path / "older.csv", tmp_path / "newer.csv"
+    write_reviews_csv(older, 200)
+    write_reviews_csv(newer, 200)
+    written = run_pipeline_dedup([str(older), str(newer)], str(tmp_path / "out.csv"), str(tmp_path / "err"))
+    with open(tmp_path / "out.csv", newline="") as f:
+        ids = [row["EmployeeID"] for row in csv.DictReader(f)]
+    assert written == len(ids) == len(set(ids)) == 196
@@ -0,0 +1,47 @@
+import csv
+import json
+
+from src.department_stats import DepartmentStats, save_department_summary
+from src.grade_calculator import load_reviews, process_reviews, run_pipeline
+from tests.test_pipeline import write_reviews_csv
+
+def test_stats_match_a_second_pass_over_the_output(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 700)
+    stats = DepartmentStats()
+    run_pipeline(str(reviews), str(tmp_path / "graded.csv"), str(tmp_path / "err"), stats=stats)
+
+    with open(tmp_path / "graded.csv", newline="") as f:
+        graded = [row for row in csv.DictReader(f) if row["Department"] == "Dept 3"]
+    summary = stats.summary()["Dept 3"]
+    scores = [float(row["Score"]) for row in graded]
+    assert summary["graded"] == len(graded) and summary["count"] == 100
+    assert summary["errors"] == 100 - len(graded) == 2
+    assert summary["mean_score"] == round(sum(scores) / len(scores), 2)
+    assert (summary["min_score"], summary["max_score"]) == (min(scores), max(scores))
+    assert summary["grades"]["A"] == sum(row["Grade"] == "A" for row in graded)
+    assert summary["error_rate"] == 0.02
+
+    save_department_summary(stats, str(tmp_path / "departments.csv"))
+    rows = list(csv.DictReader(open(tmp_path / "departments.csv", newline="")))
+    assert [row["Department"] for row in rows] == [f"Dept {i}" for i in range(7)]
+    assert rows[3]["Grade_A"] == str(summary["grades"]["A"])
+
+def test_shard_stats_merge_to_the_whole(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 400)
+    records = load_reviews(str(reviews))
+    whole = DepartmentStats()
+    process_reviews(records, str(tmp_path / "err"), stats=whole)
+
+    first, second = DepartmentStats(), DepartmentStats()
+    process_reviews(records[:150], str(tmp_path / "err"), stats=first)
+    process_reviews(records[150:], str(tmp_path / "err"), stats=second)
+    # a run's accumulators survive a JSON round trip, e.g. to merge with the next run
+    second = DepartmentStats.from_state(json.loads(json.dumps(second.to_state())))
+    second.merge(first)
+    assert second.summary() == whole.summary()
+
+    parallel = DepartmentStats()
+    run_pipeline(str(reviews), str(tmp_path / "out.csv"), str(tmp_path / "err"), workers=2, stats=parallel)
+    assert parallel.summary() == whole.summary()
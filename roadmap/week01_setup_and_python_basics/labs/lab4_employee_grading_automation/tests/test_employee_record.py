@@ -0,0 +1,42 @@
+import sys
+
+from src.department_stats import DepartmentStats
+from src.employee_record import (
+    EmployeeRecord,
+    ScoreStatus,
+    load_employee_records,
+    process_employee_records,
+    run_pipeline_records,
+)
+from src.grade_calculator import run_pipeline
+from tests.test_pipeline import write_reviews_csv
+
+def test_typed_pipeline_writes_the_same_files_as_run_pipeline(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 500)
+    with open(reviews, "a") as f:
+        f.write("X1,Bad Score,Dept 1,abc\nX2,Too High,Dept 2,150\nX3,Spaced, Dept 3 , 88 \n")
+    dict_stats, typed_stats = DepartmentStats(), DepartmentStats()
+
+    run_pipeline(str(reviews), str(tmp_path / "dict.csv"), str(tmp_path / "dict_err"), stats=dict_stats)
+    written = run_pipeline_records(str(reviews), str(tmp_path / "typed.csv"), str(tmp_path / "typed_err"), stats=typed_stats)
+
+    assert written == 491
+    assert (tmp_path / "typed.csv").read_text() == (tmp_path / "dict.csv").read_text()
+    [dict_err] = tmp_path.glob("dict_err_*.txt")
+    [typed_err] = tmp_path.glob("typed_err_*.txt")
+    assert typed_err.read_text() == dict_err.read_text()
+    assert typed_stats.summary() == dict_stats.summary()
+
+def test_records_are_typed_interned_and_graded_in_place(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    reviews.write_text("Score,EmployeeID,Department,Name,Extra\n91,E1,Sales,Ann,x\nabc,E2,Sales,Bob\n,E3,HR,Cy,y\n")
+    records = load_employee_records(str(reviews))
+
+    assert [record.status for record in records] == [ScoreStatus.VALID, ScoreStatus.NON_NUMERIC, ScoreStatus.MISSING]
+    assert records[0].department is records[1].department is sys.intern("Sales")
+    assert not hasattr(records[0], "__dict__")
+    graded = process_employee_records(records, str(tmp_path / "err"))
+    assert graded == [records[0]] and records[0].grade == "A"
+    assert records[1].to_dict() == {"EmployeeID": "E2", "Name": "Bob", "Department": "Sales", "Score": "abc"}
+    assert EmployeeRecord.from_fields("E4", "Dee", "HR", "101").status.code == "out_of_range"
@@ -0,0 +1,63 @@
+import csv
+from datetime import datetime
+
+from src import error_sink
+from src.employee_record import run_pipeline_records
+from src.error_sink import ErrorSink
+from src.grade_calculator import run_pipeline
+from tests.test_pipeline import write_reviews_csv
+
+def read_rows(paths):
+    rows = []
+    for path in paths:
+        with open(path, newline="") as f:
+            reader = csv.reader(f)
+            assert next(reader) == ["code", "key", "value", "message"]
+            rows.extend(reader)
+    return rows
+
+def test_error_sink_rotates_and_bounds_counters(tmp_path):
+    with ErrorSink(str(tmp_path / "errors"), max_bytes=200, max_codes=2) as sink:
+        for i in range(20):
+            sink.record(["missing", "non_numeric", "out_of_range"][i % 3], f"E{i}", i, f"error {i}")
+    summary = sink.summary()
+    assert len(summary["files"]) > 1 and all(path.endswith(f".{n}.csv") for n, path in enumerate(summary["files"], 1))
+    assert summary["total"] == 20
+    assert summary["by_code"] == {"missing": 7, "non_numeric": 7, "other": 6}
+    rows = read_rows(summary["files"])
+    assert [row[1] for row in rows] == [f"E{i}" for i in range(20)]
+    assert rows[2] == ["out_of_range", "E2", "2", "error 2"]
+
+def test_pipeline_writes_structured_errors_in_input_order(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 300)
+    with open(reviews, "a") as f:
+        f.write("X1,Bad,Dept 0,abc\nX2,High,Dept 1,1.5e2\n")
+    for workers in (1, 2):
+        with ErrorSink(str(tmp_path / f"sink{workers}")) as sink:
+            run_pipeline(str(reviews), str(tmp_path / f"out{workers}.csv"), str(tmp_path / "unused"), workers=workers, error_sink=sink)
+        rows = read_rows(sink.paths)
+        assert [row[:3] for row in rows[-3:]] == [["missing", "E000250", ""], ["non_numeric", "X1", "abc"], ["out_of_range", "X2", "1.5e2"]]
+        assert sink.summary()["by_code"] == {"missing": 6, "non_numeric": 1, "out_of_range": 1}
+    assert not list(tmp_path.glob("unused_*"))
+
+def test_typed_pipeline_records_the_raw_score_text(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    reviews.write_text("EmployeeID,Name,Department,Score\nX1,Bad,D,abc\nX2,High,D, 1.5e2 \nX3,None,D,\nX4,Ok,D,90\n")
+    with ErrorSink(str(tmp_path / "sink")) as sink:
+        run_pipeline_records(str(reviews), str(tmp_path / "out.csv"), str(tmp_path / "unused"), error_sink=sink)
+    assert [row[:3] for row in read_rows(sink.paths)] == [["non_numeric", "X1", "abc"], ["out_of_range", "X2", "1.5e2"], ["missing", "X3", ""]]
+
+def test_sinks_started_in_the_same_second_do_not_overwrite(tmp_path, monkeypatch):
+    class FrozenClock:
+        @staticmethod
+        def now():
+            return datetime(2024, 1, 2, 3, 4, 5)
+    monkeypatch.setattr(error_sink, "datetime", FrozenClock)
+    prefix = str(tmp_path / "errors")
+    with ErrorSink(prefix) as first, ErrorSink(prefix) as second:
+        first.record("missing", "E1", None)
+        second.record("missing", "E2", None)
+    assert first.paths != second.paths
+    assert second.paths[0].endswith("_01-02-2024_03:04:05-2.1.csv")
+    assert [row[1] for row in read_rows(first.paths + second.paths)] == ["E1", "E2"]
@@ -0,0 +1,58 @@
+import pytest
+
+from src import grade_bands
+from src.grade_bands import DEFAULT_BANDS, GradeBands, grade_records
+from src.grade_calculator import assign_grade, convert_score, process_reviews, score_error_code
+
+SCORES = [0, 0.5, 59.99, 60, 60.0, 69.9, 70, 79.5, 80, 89.999, 90, 95, 95.5, 100]
+
+def test_grade_many_matches_scalar_grade(monkeypatch):
+    """The numpy, lookup-table and bisect column paths must all agree with grade()."""
+    expected = [assign_grade(score) for score in SCORES]
+    assert expected[:4] == ["F", "F", "F", "D"] and expected[-1] == "A"
+    if grade_bands.np is not None:
+        assert DEFAULT_BANDS.grade_many(SCORES) == expected
+    monkeypatch.setattr(grade_bands, "np", None)
+    assert DEFAULT_BANDS._table is not None
+    assert DEFAULT_BANDS.grade_many(SCORES) == expected
+    fractional = GradeBands([(59.5, "D"), (69.5, "C"), (79.5, "B"), (89.5, "A")], below="F")
+    assert fractional._table is None
+    assert fractional.grade_many(SCORES) == [fractional.grade(score) for score in SCORES]
+
+def test_bands_must_be_increasing():
+    with pytest.raises(ValueError):
+        GradeBands([(90, "A"), (80, "B")], below="F")
+    bands = GradeBands.from_cutoffs({"Pass": 50, "Merit": 70}, below="Fail")
+    assert [bands.grade(s) for s in (49, 50, 70)] == ["Fail", "Pass", "Merit"]
+
+def test_process_reviews_uses_department_bands(tmp_path):
+    engineering = GradeBands([(60, "D"), (70, "C"), (80, "B"), (90, "A"), (95.5, "Distinction")], below="F")
+    records = [
+        {"EmployeeID": "1", "Name": "A", "Department": "Engineering", "Score": 97.0},
+        {"EmployeeID": "2", "Name": "B", "Department": "HR", "Score": 97.0},
+        {"EmployeeID": "3", "Name": "C", "Department": "HR", "Score": "abc"},
+        {"EmployeeID": "4", "Name": "D", "Department": "Engineering", "Score": 95.0},
+    ]
+    graded = process_reviews(records, str(tmp_path / "errors"), department_bands={"Engineering": engineering})
+    assert [row["Grade"] for row in graded] == ["Distinction", "A", "A"]
+    assert grade_records(records[:2]) == ["A", "A"]
+
+def test_nan_and_inf_scores_are_rejected(tmp_path, monkeypatch):
+    """float() accepts "nan" and "inf"; neither may be graded (NaN used to bisect to "A")."""
+    records = [
+        {"EmployeeID": "1", "Name": "A", "Department": "X", "Score": "nan"},
+        {"EmployeeID": "2", "Name": "B", "Department": "X", "Score": "inf"},
+        {"EmployeeID": "3", "Name": "C", "Department": "X", "Score": "-Infinity"},
+        {"EmployeeID": "4", "Name": "D", "Department": "X", "Score": "91"},
+    ]
+    records = [convert_score(row) for row in records]
+    assert [score_error_code(row) for row in records] == ["non_numeric", "out_of_range", "out_of_range", None]
+    assert score_error_code({"EmployeeID": "5", "Score": float("nan")}) == "non_numeric"
+    assert [row["EmployeeID"] for row in process_reviews(records, str(tmp_path / "err"))] == ["4"]
+    [log] = tmp_path.glob("err_*.txt")
+    assert "Non-numeric score for employee 1:nan." in log.read_text()
+    # graded directly, NaN falls below every band, as the if/elif ladder did
+    assert assign_grade(float("nan")) == "F" and assign_grade(float("inf")) == "A"
+    assert DEFAULT_BANDS.grade_many([float("nan"), 95.0]) == ["F", "A"]
+    monkeypatch.setattr(grade_bands, "np", None)
+    assert DEFAULT_BANDS.grade_many([float("nan"), 95.0]) == ["F", "A"]
@@ -0,0 +1,51 @@
+import csv
+
+import pytest
+
+from src.hr_join import join_with_master
+
+def write_csv(path, header, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+@pytest.fixture
+def inputs(tmp_path):
+    graded = tmp_path / "graded.csv"
+    master = tmp_path / "master.csv"
+    # E0000..E0399 graded; the master has E0100..E0999, so 100 reviews and 600 master rows are unmatched
+    write_csv(graded, ["EmployeeID", "Name", "Department", "Score", "Grade"],
+              [[f"E{i:04d}", f"Name {i}", f"Dept {i % 3}", f"{i % 101}.0", "A"] for i in range(400)])
+    write_csv(master, ["Department", "EmployeeID", "Manager", "Location", "Band"],
+              [[f"HR {i % 5}", f"E{i:04d}", f"M{i % 17}", "Berlin", f"L{i % 4}"] for i in range(100, 1000)])
+    return graded, master
+
+def test_join_builds_on_the_smaller_file_and_reports_unmatched(tmp_path, inputs):
+    graded, master = inputs
+    result = join_with_master(
+        str(graded), str(master), str(tmp_path / "out.csv"),
+        unmatched_reviews_path=str(tmp_path / "no_master.csv"),
+        unmatched_master_path=str(tmp_path / "no_review.csv"),
+    )
+    assert result == {"joined": 300, "unmatched_reviews": 100, "unmatched_master": 600,
+                      "build_side": "reviews", "partitions": 1}
+    header, first, *rest = read_csv(tmp_path / "out.csv")
+    assert header == ["EmployeeID", "Name", "Department", "Score", "Grade", "HR_Department", "Manager", "Location", "Band"]
+    assert first == ["E0100", "Name 100", "Dept 1", "100.0", "A", "HR 0", "M15", "Berlin", "L0"]
+    assert [row[0] for row in read_csv(tmp_path / "no_master.csv")[1:]] == [f"E{i:04d}" for i in range(100)]
+    assert len(read_csv(tmp_path / "no_review.csv")) == 601
+
+def test_grace_join_matches_in_memory_join(tmp_path, inputs):
+    graded, master = inputs
+    join_with_master(str(graded), str(master), str(tmp_path / "memory.csv"))
+    result = join_with_master(str(graded), str(master), str(tmp_path / "grace.csv"), memory_limit=4096, tmp_dir=str(tmp_path))
+    assert result["partitions"] > 1
+    assert (result["joined"], result["unmatched_reviews"], result["unmatched_master"]) == (300, 100, 600)
+    memory, grace = read_csv(tmp_path / "memory.csv"), read_csv(tmp_path / "grace.csv")
+    assert grace[0] == memory[0] and sorted(grace[1:]) == sorted(memory[1:])
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["grace.csv", "graded.csv", "master.csv", "memory.csv"]
@@ -0,0 +1,56 @@
+from src.department_stats import DepartmentStats
+from src.grade_bands import GradeBands
+from src.grade_calculator import run_pipeline
+from src.incremental import run_pipeline_incremental
+from tests.test_pipeline import write_reviews_csv
+
+def assert_matches_full_run(tmp_path, reviews, name, **kwargs):
+    (tmp_path / f"{name}_inc").mkdir()
+    (tmp_path / f"{name}_full").mkdir()
+    stats = run_pipeline_incremental(
+        str(reviews), str(tmp_path / f"{name}_inc.csv"), str(tmp_path / f"{name}_inc" / "err"), str(tmp_path / "cache.json"), **kwargs
+    )
+    run_pipeline(str(reviews), str(tmp_path / f"{name}_full.csv"), str(tmp_path / f"{name}_full" / "err"))
+    assert (tmp_path / f"{name}_inc.csv").read_bytes() == (tmp_path / f"{name}_full.csv").read_bytes()
+    [inc_err] = (tmp_path / f"{name}_inc").iterdir()
+    [full_err] = (tmp_path / f"{name}_full").iterdir()
+    assert inc_err.read_text() == full_err.read_text()
+    return stats
+
+def test_incremental_run_reuses_unchanged_rows(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 200)
+    first = assert_matches_full_run(tmp_path, reviews, "first")
+    assert (first["new"], first["reused"], first["errors"]) == (196, 0, 4)
+
+    lines = reviews.read_text().splitlines(keepends=True)
+    lines[2] = lines[2].replace(",1\n", ",95\n")        # E000001: changed score
+    lines[3] = lines[3].replace(",2\n", ",abc\n")       # E000002: now invalid
+    del lines[10]                                       # E000009 left
+    lines.append("N000001,New Hire,Dept 3,88\n")        # new employee
+    reviews.write_text("".join(lines))
+    second = assert_matches_full_run(tmp_path, reviews, "second")
+    assert second == {"rows": 200, "reused": 193, "regraded": 1, "new": 1, "departed": 1, "errors": 5}
+
+def test_changed_bands_discard_the_cache(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 50)
+    cache = str(tmp_path / "cache.json")
+    run_pipeline_incremental(str(reviews), str(tmp_path / "a.csv"), str(tmp_path / "err"), cache)
+    strict = GradeBands([(75, "Pass")], below="Fail")
+    stats = run_pipeline_incremental(str(reviews), str(tmp_path / "b.csv"), str(tmp_path / "err"), cache, bands=strict)
+    assert stats["reused"] == 0 and stats["new"] == 49
+    assert (tmp_path / "b.csv").read_text().splitlines()[1].endswith(",Fail")
+
+def test_incremental_run_computes_department_stats(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 200)
+    expected = DepartmentStats()
+    run_pipeline(str(reviews), str(tmp_path / "full.csv"), str(tmp_path / "full_err"), stats=expected)
+    for run in ("first", "second"):  # graded from scratch, then almost all reused from the cache
+        stats = DepartmentStats()
+        counts = run_pipeline_incremental(
+            str(reviews), str(tmp_path / "inc.csv"), str(tmp_path / "inc_err"), str(tmp_path / "cache.json"), stats=stats
+        )
+        assert stats.summary() == expected.summary()
+    assert counts["reused"] == 196
@@ -0,0 +1,89 @@
+import csv
+import time
+
+import pytest
+
+from src.department_stats import DepartmentStats
+from src.grade_calculator import run_pipeline
+from src.ingest import discover_review_files, run_ingestion
+from tests.test_pipeline import write_reviews_csv
+
+def write_regions(root, rows=300):
+    for region in ("emea", "apac"):
+        (root / region).mkdir()
+        for k in range(2):
+            write_reviews_csv(root / region / f"reviews_{k}.csv", rows)
+
+def test_ingests_every_file_of_every_region(tmp_path):
+    root = tmp_path / "incoming"
+    root.mkdir()
+    write_regions(root)
+    progress = run_ingestion(str(root), str(tmp_path / "out.csv"), str(tmp_path / "err"), batch_size=64, readers=2)
+
+    assert discover_review_files(str(root)) == sorted(progress)
+    assert {source.region for source in progress.values()} == {"emea", "apac"}
+    assert all(source.done and source.records == 300 and source.batches == 5 for source in progress.values())
+    # the same rows as grading each file on its own; only the interleaving differs
+    run_pipeline(str(root / "emea" / "reviews_0.csv"), str(tmp_path / "one.csv"), str(tmp_path / "err"))
+    with open(tmp_path / "one.csv", newline="") as f:
+        expected = sorted(map(tuple, csv.reader(f)))[:-1]
+    with open(tmp_path / "out.csv", newline="") as f:
+        ingested = sorted(map(tuple, csv.reader(f)))[:-1]
+    assert ingested == sorted(expected * 4)
+
+class SlowStats(DepartmentStats):
+    def __init__(self):
+        super().__init__()
+        self.seen = 0
+
+    def add_graded(self, department, score, grade):
+        self.seen += 1
+        if self.seen % 50 == 0:
+            time.sleep(0.001)
+        super().add_graded(department, score, grade)
+
+    def add_rejected(self, department):
+        self.seen += 1
+        super().add_rejected(department)
+
+def test_slow_grading_holds_back_the_readers(tmp_path):
+    root = tmp_path / "incoming"
+    root.mkdir()
+    write_regions(root, rows=2000)
+    stats = SlowStats()
+    sources, backlog = {}, []
+
+    def on_progress(source):
+        # records handed to the queue so far minus records the grading stage has taken
+        sources[source.path] = source.records
+        backlog.append(sum(sources.values()) - stats.seen)
+
+    run_ingestion(str(root), str(tmp_path / "out.csv"), str(tmp_path / "err"),
+                  batch_size=100, max_batches=2, stats=stats, on_progress=on_progress)
+    assert stats.seen == 8000
+    # queued + in the grading thread + just read: never more than a few batches ahead
+    assert max(backlog) <= 100 * (2 + 2)
+
+def test_mismatched_columns_raise(tmp_path):
+    region = tmp_path / "incoming" / "emea"
+    region.mkdir(parents=True)
+    write_reviews_csv(region / "a.csv", 50)
+    (region / "b.csv").write_text("EmployeeID,Score\nE1,90\n")
+    with pytest.raises(ValueError):
+        run_ingestion(str(tmp_path / "incoming"), str(tmp_path / "out.csv"), str(tmp_path / "err"))
+
+def test_skips_empty_files_and_its_own_output(tmp_path, capsys):
+    root = tmp_path / "incoming"
+    root.mkdir()
+    write_reviews_csv(root / "a.csv", 50)
+    (root / "empty.csv").write_text("")
+    output = root / "graded.csv"
+    output.write_text("stale output of a previous run\n")
+
+    progress = run_ingestion(str(root), str(output), str(tmp_path / "err"), readers=2)
+
+    assert sorted(progress) == [str(root / "a.csv"), str(root / "empty.csv")]
+    assert progress[str(root / "empty.csv")].done and progress[str(root / "empty.csv")].records == 0
+    assert "[WARN] Skipping" in capsys.readouterr().out
+    with open(output, newline="") as f:
+        assert next(csv.reader(f)) == ["EmployeeID", "Name", "Department", "Score", "Grade"]
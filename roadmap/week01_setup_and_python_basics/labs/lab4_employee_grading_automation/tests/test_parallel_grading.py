@@ -0,0 +1,44 @@
+from src.grade_calculator import load_reviews, process_reviews, run_pipeline, save_processed_reviews
+from src.parallel_grading import shard_ranges
+from tests.test_pipeline import write_reviews_csv
+
+def test_shard_ranges_cover_whole_lines(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 1000)
+    data = reviews.read_bytes()
+    fieldnames, ranges = shard_ranges(str(reviews), 7)
+    assert fieldnames == ["EmployeeID", "Name", "Department", "Score"]
+    assert len(ranges) == 7
+    assert ranges[0][0] == data.index(b"\n") + 1 and ranges[-1][1] == len(data)
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start and data[start - 1:start] == b"\n"
+    # more shards than lines: every range still holds at least one whole line
+    write_reviews_csv(reviews, 3)
+    _, ranges = shard_ranges(str(reviews), 10)
+    assert len(ranges) == 3
+
+def test_parallel_pipeline_matches_serial(tmp_path):
+    """Sharded grading must write the same CSV and error log, in input order, as the serial pipeline."""
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 2000)
+    (tmp_path / "serial").mkdir()
+    (tmp_path / "parallel").mkdir()
+    serial = run_pipeline(str(reviews), str(tmp_path / "serial.csv"), str(tmp_path / "serial" / "err"))
+    parallel = run_pipeline(str(reviews), str(tmp_path / "parallel.csv"), str(tmp_path / "parallel" / "err"), workers=3)
+
+    assert parallel == serial == 1960
+    assert (tmp_path / "parallel.csv").read_bytes() == (tmp_path / "serial.csv").read_bytes()
+    [serial_err] = (tmp_path / "serial").iterdir()
+    [parallel_err] = (tmp_path / "parallel").iterdir()
+    assert parallel_err.read_text() == serial_err.read_text()
+
+def test_process_and_save_with_workers_match_serial(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 300)
+    records = load_reviews(str(reviews))
+    serial = process_reviews(records, str(tmp_path / "serial_err"))
+    parallel = process_reviews(records, str(tmp_path / "parallel_err"), workers=2)
+    assert parallel == serial
+    save_processed_reviews(serial, str(tmp_path / "serial.csv"))
+    save_processed_reviews(parallel, str(tmp_path / "parallel.csv"), workers=2)
+    assert (tmp_path / "parallel.csv").read_bytes() == (tmp_path / "serial.csv").read_bytes()
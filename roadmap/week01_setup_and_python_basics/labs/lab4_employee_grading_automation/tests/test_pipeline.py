@@ -0,0 +1,53 @@
+import csv
+import tracemalloc
+
+from src.grade_calculator import (
+    iter_processed_reviews,
+    load_reviews,
+    process_reviews,
+    run_pipeline,
+    save_processed_reviews,
+)
+
+def write_reviews_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        f.write("EmployeeID,Name,Department,Score\n")
+        for i in range(rows):
+            score = "" if i % 50 == 0 else str(i % 101)
+            f.write(f"E{i:06d},Employee {i},Dept {i % 7},{score}\n")
+
+def test_run_pipeline_matches_list_functions(tmp_path):
+    """Streaming load -> process -> save should write the same file as the list-based functions."""
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 500)
+
+    save_processed_reviews(process_reviews(load_reviews(str(reviews)), str(tmp_path / "list_err")), str(tmp_path / "list.csv"))
+    written = run_pipeline(str(reviews), str(tmp_path / "stream.csv"), str(tmp_path / "stream_err"))
+
+    assert (tmp_path / "stream.csv").read_text() == (tmp_path / "list.csv").read_text()
+    assert written == 490
+    [list_err] = tmp_path.glob("list_err_*.txt")
+    [stream_err] = tmp_path.glob("stream_err_*.txt")
+    assert stream_err.read_text() == list_err.read_text()
+
+def test_process_reviews_does_not_modify_input(tmp_path):
+    records = [{"EmployeeID": "1", "Name": "A", "Department": "X", "Score": 90.0}]
+    process_reviews(records, str(tmp_path / "errors"))
+    assert "Grade" not in records[0]
+    graded = next(iter_processed_reviews(records, str(tmp_path / "errors"), in_place=True))
+    assert graded is records[0] and graded["Grade"] == "A"
+
+def test_run_pipeline_memory_is_flat(tmp_path):
+    """Peak memory should not grow with the number of rows."""
+    peaks = []
+    for rows in (2_000, 40_000):
+        reviews = tmp_path / f"reviews_{rows}.csv"
+        write_reviews_csv(reviews, rows)
+        tracemalloc.start()
+        run_pipeline(str(reviews), str(tmp_path / f"graded_{rows}.csv"), str(tmp_path / f"err_{rows}"))
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    assert peaks[1] < peaks[0] * 2
+    with open(tmp_path / "graded_40000.csv", newline="") as f:
+        assert sum(1 for _ in csv.DictReader(f)) == 39_200
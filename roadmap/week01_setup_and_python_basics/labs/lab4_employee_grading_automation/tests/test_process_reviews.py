@@ -1,5 +1,5 @@
 import pytest
-from src.grade_calculator import process_reviews
+from src.grade_calculator import iter_processed_reviews, load_reviews, process_reviews
 
 # testing logic for process_reviews
 '''
@@ -293,3 +293,26 @@ def test_process_reviews_returns_list_of_dicts(tmp_path):
     assert isinstance(processed[0], dict)
 
 
+
+
+# ------------------------------------------------------
+# A STRING SCORE IS NON-NUMERIC, EVEN IF IT LOOKS LIKE A NUMBER
+# ------------------------------------------------------
+@pytest.mark.parametrize("streaming", [False, True])
+def test_string_score_is_non_numeric(tmp_path, streaming):
+    records = [{"EmployeeID": "1", "Name": "a", "Department": "X", "Score": "85"}]
+    err_path = tmp_path / "errors"
+    if streaming:
+        processed = list(iter_processed_reviews(records, str(err_path)))
+    else:
+        processed = process_reviews(records, str(err_path))
+
+    assert processed == []
+    [error_file] = tmp_path.glob("errors_*.txt")
+    assert "Non-numeric score for employee 1:85." in error_file.read_text()
+
+def test_load_reviews_keeps_out_of_range_scores_as_floats(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    reviews.write_text("EmployeeID,Name,Department,Score\n1,a,X,150\n2,b,X,abc\n")
+    rows = load_reviews(str(reviews))
+    assert [row["Score"] for row in rows] == [150.0, "abc"]
@@ -0,0 +1,56 @@
+import csv
+import gzip
+import lzma
+
+import pytest
+
+from src.grade_calculator import load_reviews, process_reviews, write_reviews
+from src.writers import iter_columnar_groups, output_format, read_columnar, write_columnar
+from tests.test_pipeline import write_reviews_csv
+
+@pytest.fixture
+def graded(tmp_path):
+    reviews = tmp_path / "reviews.csv"
+    write_reviews_csv(reviews, 500)
+    records = process_reviews(load_reviews(str(reviews)), str(tmp_path / "errors"))
+    records[3]["Name"] = 'Zoë "Z", Ortiz'  # non-ASCII, quotes and a comma
+    return records
+
+def test_csv_writers_match_dict_writer(tmp_path, graded):
+    with open(tmp_path / "expected.csv", "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(graded[0]))
+        writer.writeheader()
+        writer.writerows(graded)
+    expected = (tmp_path / "expected.csv").read_bytes()
+
+    assert write_reviews(iter(graded), str(tmp_path / "out.csv")) == len(graded)
+    write_reviews(graded, str(tmp_path / "out.csv.gz"))
+    write_reviews(graded, str(tmp_path / "out.xz"), output_format="csv.xz")
+    assert (tmp_path / "out.csv").read_bytes() == expected
+    assert gzip.open(tmp_path / "out.csv.gz").read() == expected
+    assert lzma.open(tmp_path / "out.xz").read() == expected
+
+def test_columnar_round_trip(tmp_path, graded):
+    path = str(tmp_path / "out.col")
+    assert output_format(path) == "columnar"
+    assert write_columnar(graded, path, row_group_size=128) == len(graded)
+    assert list(read_columnar(path)) == graded  # the generated scores are whole numbers, exact in float32
+    groups = list(iter_columnar_groups(path, columns=["Grade"]))
+    assert len(groups) == 4 and all(list(group) == ["Grade"] for group in groups)
+    assert sum((group["Grade"] for group in groups), []) == [row["Grade"] for row in graded]
+
+    write_columnar([], path)
+    assert list(read_columnar(path)) == []
+    with pytest.raises(ValueError):
+        output_format(path, "parquet")
+
+def test_columnar_missing_and_many_departments(tmp_path):
+    """None is stored as ""; a group with more than 65,536 departments gets wider codes instead of overflowing."""
+    rows = [{"EmployeeID": str(i), "Department": f"D{i}", "Score": 50.0, "Grade": "F"} for i in range(70_000)]
+    rows[1]["Department"] = None
+    rows[2]["Grade"] = None
+    path = str(tmp_path / "out.col")
+    assert write_columnar(rows, path, row_group_size=70_000) == len(rows)
+    rows[1]["Department"] = ""
+    rows[2]["Grade"] = ""
+    assert list(read_columnar(path)) == rows